@@ -1,26 +1,4 @@
-class SMS:
-    def send_sms(self, recipient, message):
-        return f"Sending SMS to {recipient}: {message}"
-
-class Email:
-    def send_email(self, recipient, subject, message):
-        return f"Sending Email to {recipient} - Subject: {subject}, Message: {message}"
-
-class PushNotification:
-    def push(self, recipient, message):
-        return f"Pushing Notification to {recipient}: {message}"
-
-class MessagingAdapter:
-    def __init__(self, messaging_service):
-        self.messaging_service = messaging_service
-
-    def send_message(self, recipient, message):
-        if isinstance(self.messaging_service, SMS):
-            return self.messaging_service.send_sms(recipient, message)
-        elif isinstance(self.messaging_service, Email):
-            return self.messaging_service.send_email(recipient, "Chat Notification", message)
-        elif isinstance(self.messaging_service, PushNotification):
-            return self.messaging_service.push(recipient, message)
+from messaging_module import Email, MessagingAdapter, PushNotification, SMS
 
 if __name__ == "__main__":
     # Usage
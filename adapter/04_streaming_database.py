@@ -0,0 +1,47 @@
+import time
+import tracemalloc
+
+from database_module import DatabaseAdapter, LegacyDatabase, ModernDatabase, generate_rows
+
+
+def measure(label, read):
+    "Run `read`, printing the time to the first row, the total time and the peak memory"
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_row_at = None
+    count = 0
+    for _ in read():
+        if first_row_at is None:
+            first_row_at = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} rows: {count:>9,}  first row: {first_row_at * 1000:8.2f} ms"
+        f"  total: {total:6.2f} s  peak memory: {peak / 2**20:8.2f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    N_ROWS = 1_000_000
+
+    legacy_db = LegacyDatabase()
+    modern_db = ModernDatabase()
+    legacy_db.load(generate_rows(N_ROWS))
+    modern_db.load(generate_rows(N_ROWS))
+
+    legacy_adapter = DatabaseAdapter(legacy_db)
+    modern_adapter = DatabaseAdapter(modern_db)
+
+    print("First rows streamed through the Adapter:")
+    for adapter in (legacy_adapter, modern_adapter):
+        rows = adapter.iter_rows(chunk_size=2)
+        print(f"  {type(adapter.database).__name__}: {next(rows)}, {next(rows)}, {next(rows)}")
+        rows.close()
+
+    print(f"\nReading {N_ROWS:,} rows:")
+    measure("Legacy  retrieve_data()", legacy_adapter.retrieve_data)
+    measure("Legacy  iter_rows(1000)", lambda: legacy_adapter.iter_rows(chunk_size=1000))
+    measure("Modern  retrieve_data()", modern_adapter.retrieve_data)
+    measure("Modern  iter_rows(1000)", lambda: modern_adapter.iter_rows(chunk_size=1000))
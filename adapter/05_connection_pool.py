@@ -0,0 +1,59 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+from connection_pool_module import PoolTimeoutError, PooledDatabaseAdapter
+from database_module import DatabaseAdapter, LegacyDatabase, ModernDatabase, generate_rows
+
+
+def run_benchmark(label, read, n_threads, n_requests):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(lambda _: read(), range(n_requests)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {n_requests / elapsed:10,.0f} requests/s  ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    N_THREADS = 16
+    N_REQUESTS = 2_000
+    CONNECT_DELAY = 0.005  # 5 ms handshake per new connection
+
+    path = os.path.join(tempfile.mkdtemp(), "legacy.sqlite3")
+    LegacyDatabase(path).load(generate_rows(100))
+    ModernDatabase(path).load(generate_rows(100))
+
+    def new_connection():
+        return LegacyDatabase(path, connect_delay=CONNECT_DELAY)
+
+    def read_without_pool():
+        database = new_connection()
+        try:
+            return DatabaseAdapter(database).retrieve_data()
+        finally:
+            database.close()
+
+    pool = PooledDatabaseAdapter(new_connection, min_size=2, max_size=8, timeout=2.0, max_idle=30.0)
+
+    print(f"{N_REQUESTS:,} reads from {N_THREADS} threads, {CONNECT_DELAY * 1000:.0f} ms per connect:")
+    run_benchmark("Without pooling", read_without_pool, N_THREADS, N_REQUESTS)
+    run_benchmark("With pooling (max 8)", pool.retrieve_data, N_THREADS, N_REQUESTS)
+
+    metrics = pool.metrics
+    print("\nPool metrics:")
+    for name, value in asdict(metrics).items():
+        print(f"  {name:<12} {value:.3f}" if isinstance(value, float) else f"  {name:<12} {value}")
+    print(f"  saturation   {metrics.describe_saturation()}")
+
+    print("\nThe pool hands out Modern databases just as well:")
+    modern_pool = PooledDatabaseAdapter(lambda: ModernDatabase(path), max_size=2, timeout=0.1)
+    with modern_pool.connection() as first, modern_pool.connection() as second:
+        print(f"  {len(first.retrieve_data())} rows, {len(second.retrieve_data())} rows")
+        try:
+            modern_pool.acquire()
+        except PoolTimeoutError as error:
+            print(f"  third checkout: {error}")
+    pool.close()
+    modern_pool.close()
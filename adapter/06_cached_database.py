@@ -0,0 +1,46 @@
+import random
+import time
+
+from cached_database_module import CachedDatabaseAdapter
+from database_module import DatabaseAdapter, LegacyDatabase, generate_rows
+
+
+class CountingLegacyDatabase(LegacyDatabase):
+    "LegacyDatabase that counts the queries reaching it"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def run_query(self, sql, params=()):
+        self.calls += 1
+        return super().run_query(sql, params)
+
+
+if __name__ == "__main__":
+    N_READS = 50_000
+    HOT_KEYS = 200
+
+    legacy_db = CountingLegacyDatabase()
+    legacy_db.load(generate_rows(10_000))
+    cached = CachedDatabaseAdapter(DatabaseAdapter(legacy_db), max_entries=256, ttl=30.0)
+
+    sql = "SELECT id, payload FROM legacy_records WHERE id = ?"
+    rng = random.Random(42)
+    # Most reads are repeats of a small hot set of records
+    ids = [rng.randrange(HOT_KEYS) if rng.random() < 0.9 else rng.randrange(10_000) for _ in range(N_READS)]
+
+    start = time.perf_counter()
+    for record_id in ids:
+        cached.query(sql, (record_id,))
+    elapsed = time.perf_counter() - start
+
+    print(f"{N_READS:,} reads in {elapsed:.2f} s, {legacy_db.calls:,} reached the legacy database")
+    print(f"Hit rate: {cached.stats.hit_rate:.1%}  {cached.stats}")
+
+    print("\nInvalidation after a write:")
+    with legacy_db.connection:
+        legacy_db.connection.execute("UPDATE legacy_records SET payload = 'changed' WHERE id = 1")
+    print(f"  before: {cached.query(sql, (1,))}")
+    cached.invalidate(sql, (1,))
+    print(f"  after:  {cached.query(sql, (1,))}")
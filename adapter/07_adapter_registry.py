@@ -0,0 +1,94 @@
+import timeit
+
+from database_module import DatabaseAdapter, LegacyDatabase, ModernDatabase, generate_rows
+from messaging_module import SEND_MESSAGE, MessagingAdapter, SMS, Email, PushNotification
+from registry_module import AdapterRegistry
+
+
+class IsinstanceChainAdapter:
+    "The old way: walk an if/elif isinstance chain on every call"
+
+    def __init__(self, adaptations, adaptee):
+        self.adaptations = adaptations
+        self.adaptee = adaptee
+
+    def send(self, message):
+        for adaptee_type, adaptation in self.adaptations:
+            if isinstance(self.adaptee, adaptee_type):
+                return adaptation(self.adaptee, message)
+
+
+class RegistryAdapter:
+    def __init__(self, registry, adaptee):
+        self.registry = registry
+        self.adaptee = adaptee
+
+    def send(self, message):
+        return self.registry.dispatch(self.adaptee, message)
+
+
+def make_services(n_types):
+    "Build `n_types` unrelated service classes, each with its own send method name"
+    services = []
+    for i in range(n_types):
+        method = f"deliver_{i}"
+        service_type = type(f"Service{i}", (), {method: lambda self, message, i=i: f"service {i}: {message}"})
+        services.append((service_type, method))
+    return services
+
+
+if __name__ == "__main__":
+    # Subclasses are adapted through their parent's registration
+    class VipSMS(SMS):
+        pass
+
+    print(MessagingAdapter(VipSMS()).send_message("Alice", "Hello from chat app!"))
+    print(MessagingAdapter(Email()).send_message("Bob", "Chat invitation"))
+    print(MessagingAdapter(PushNotification()).send_message("Charlie", "New message"))
+
+    # New channels register once, without touching MessagingAdapter
+    class Pager:
+        def page(self, number, text):
+            return f"Paging {number}: {text}"
+
+    SEND_MESSAGE.register(Pager, lambda service, recipient, message: service.page(recipient, message))
+    print(MessagingAdapter(Pager()).send_message("555-0100", "Server down"))
+
+    try:
+        MessagingAdapter(object()).send_message("Dave", "Hi")
+    except TypeError as error:
+        print(f"Unknown service: {error}")
+
+    legacy_db = LegacyDatabase()
+    legacy_db.load(generate_rows(2))
+    modern_db = ModernDatabase()
+    modern_db.load(generate_rows(3))
+    print(f"\nLegacy rows: {DatabaseAdapter(legacy_db).retrieve_data()}")
+    print(f"Modern rows: {DatabaseAdapter(modern_db).retrieve_data()}")
+
+    # Microbenchmark: dispatch cost with many registered adaptee types
+    N_TYPES = 60
+    N_CALLS = 200_000
+    services = make_services(N_TYPES)
+
+    chain = [
+        (service_type, lambda service, message, method=method: getattr(service, method)(message))
+        for service_type, method in services
+    ]
+    registry = AdapterRegistry("send")
+    for service_type, adaptation in chain:
+        registry.register(service_type, adaptation)
+
+    print(f"\nDispatch with {N_TYPES} registered adaptee types ({N_CALLS:,} calls):")
+    for position in (0, N_TYPES // 2, N_TYPES - 1):
+        service_type = services[position][0]
+        # A subclass exercises the MRO fallback of the registry
+        adaptee = type(f"Sub{service_type.__name__}", (service_type,), {})()
+        old_adapter = IsinstanceChainAdapter(chain, adaptee)
+        new_adapter = RegistryAdapter(registry, adaptee)
+        old = timeit.timeit(lambda: old_adapter.send("hi"), number=N_CALLS)
+        new = timeit.timeit(lambda: new_adapter.send("hi"), number=N_CALLS)
+        print(
+            f"  type #{position:<3} isinstance chain: {old / N_CALLS * 1e9:7.0f} ns/call"
+            f"   registry: {new / N_CALLS * 1e9:5.0f} ns/call"
+        )
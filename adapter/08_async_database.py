@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+from async_database_module import AsyncDatabaseAdapter, fan_out_retrieve
+from database_module import LegacyDatabase, ModernDatabase, generate_rows
+
+
+async def main():
+    legacy_db = LegacyDatabase(query_delay=0.20)
+    modern_db = ModernDatabase(query_delay=0.30)
+    legacy_db.load(generate_rows(5))
+    modern_db.load((i, f"modern-{i}") for i in range(5, 10))
+    legacy_adapter = AsyncDatabaseAdapter(legacy_db)
+    modern_adapter = AsyncDatabaseAdapter(modern_db)
+
+    start = time.perf_counter()
+    sequential = await legacy_adapter.retrieve_data() + await modern_adapter.retrieve_data()
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = await fan_out_retrieve([legacy_adapter, modern_adapter])
+    parallel_time = time.perf_counter() - start
+
+    assert sorted(sequential) == merged
+    print(f"Merged {len(merged)} rows: {merged[0]} ... {merged[-1]}")
+    print(f"Sequential reads: {sequential_time * 1000:6.0f} ms (200 ms + 300 ms of simulated latency)")
+    print(f"Fan-out reads:    {parallel_time * 1000:6.0f} ms")
+
+    # Reads wait on the network while the loop keeps serving other work
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    await fan_out_retrieve([legacy_adapter, modern_adapter])
+    beat.cancel()
+    print(f"The event loop ran {ticks} heartbeats during the fan-out")
+
+    try:
+        await fan_out_retrieve([legacy_adapter, modern_adapter], timeout=0.25)
+    except asyncio.TimeoutError:
+        print("Fan-out with a 250 ms timeout: timed out, the pending read was cancelled")
+
+    task = asyncio.create_task(modern_adapter.retrieve_data())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        print("A read cancelled by the caller: cancelled")
+
+    streamed = [row async for row in AsyncDatabaseAdapter(legacy_db).iter_rows(chunk_size=2)]
+    print(f"Streamed {len(streamed)} legacy rows in chunks of 2")
+
+    # A chunk that times out: the stream is closed once the worker thread is out of it
+    slow_rows = AsyncDatabaseAdapter(legacy_db, timeout=0.05).iter_rows(chunk_size=2)
+    try:
+        async for _ in slow_rows:
+            pass
+    except asyncio.TimeoutError:
+        await slow_rows.aclose()
+        await asyncio.sleep(0.25)
+        print("A streamed read with a 50 ms timeout: timed out, the rows were closed after the fetch")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
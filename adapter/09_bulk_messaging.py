@@ -0,0 +1,70 @@
+import time
+
+from bulk_messaging_module import BulkMessenger
+from messaging_module import BatchRejected, MessagingAdapter, SMS, Email, PushNotification
+
+
+# Fake providers: every API call pays a round trip, whatever the number of recipients
+ROUND_TRIP = 0.0005
+BOUNCING = "bounce@example.com"
+
+class RemoteSMS(SMS):
+    def send_sms(self, recipient, message):
+        time.sleep(ROUND_TRIP)
+        return super().send_sms(recipient, message)
+
+    def send_sms_batch(self, recipients, message):
+        time.sleep(ROUND_TRIP)
+        return super().send_sms_batch(recipients, message)
+
+class RemoteEmail(Email):
+    def send_email(self, recipient, subject, message):
+        time.sleep(ROUND_TRIP)
+        if recipient == BOUNCING:
+            raise ValueError(f"{recipient} does not exist")
+        return super().send_email(recipient, subject, message)
+
+    def send_email_batch(self, recipients, subject, message):
+        time.sleep(ROUND_TRIP)
+        if BOUNCING in recipients:
+            raise BatchRejected(f"{BOUNCING} does not exist")
+        return super().send_email_batch(recipients, subject, message)
+
+class RemotePushNotification(PushNotification):
+    def push(self, recipient, message):
+        time.sleep(ROUND_TRIP)
+        return super().push(recipient, message)
+
+    def push_batch(self, recipients, message):
+        time.sleep(ROUND_TRIP)
+        return super().push_batch(recipients, message)
+
+
+if __name__ == "__main__":
+    N_RECIPIENTS = 300_000
+    CHANNELS = ("sms", "email", "push")
+
+    adapters = {
+        "sms": MessagingAdapter(RemoteSMS()),
+        "email": MessagingAdapter(RemoteEmail()),
+        "push": MessagingAdapter(RemotePushNotification()),
+    }
+    recipients = [(CHANNELS[i % 3], f"user-{i}") for i in range(N_RECIPIENTS)]
+    recipients[1] = ("email", BOUNCING)
+
+    messenger = BulkMessenger(adapters, batch_size=1000, max_workers=8)
+    report = messenger.send_bulk(recipients, "Our spring campaign has started!")
+    print(f"send_bulk: {len(report.results):,} recipients in {report.elapsed:.2f} s"
+          f" ({report.throughput:,.0f} recipients/s), {report.sent:,} sent, {report.failed} failed")
+    print(f"  {report.batch_errors}")
+    print(f"  {report.results[0]}")
+    print(f"  {report.results[1]}")
+    print(f"  {report.results[4]}")
+
+    # The same campaign one recipient at a time, on a sample to keep it short
+    sample = recipients[3:3_003]
+    start = time.perf_counter()
+    for channel, recipient in sample:
+        adapters[channel].send_message(recipient, "Our spring campaign has started!")
+    elapsed = time.perf_counter() - start
+    print(f"send_message loop: {len(sample) / elapsed:,.0f} recipients/s")
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from typing import List
+
+from delivery_pipeline_module import ChannelPipeline, DeliveryPipeline
+from messaging_module import MessagingAdapter, SMS, Email, PushNotification
+
+
+class FakeProvider:
+    """
+    Local stand-in for a provider API: a small network delay, and a limit
+    of `max_per_second` calls plus a `burst` it enforces over any second,
+    with 5% of slack for network jitter
+    """
+
+    def __init__(self, max_per_second: float, burst: int = 0, delay: float = 0.002):
+        self.max_per_second = max_per_second
+        self.burst = burst
+        self.delay = delay
+        self.calls: List[float] = []
+
+    def call(self):
+        time.sleep(self.delay)
+        now = time.monotonic()
+        self.calls.append(now)
+        window = int((self.max_per_second + self.burst) * 1.05) + 1
+        if len(self.calls) >= window and now - self.calls[-window] < 1.0:
+            raise RuntimeError("429 Too Many Requests")
+
+class ProviderSMS(SMS):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def send_sms(self, recipient, message):
+        self.provider.call()
+        return super().send_sms(recipient, message)
+
+class ProviderEmail(Email):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def send_email(self, recipient, subject, message):
+        self.provider.call()
+        return super().send_email(recipient, subject, message)
+
+class ProviderPushNotification(PushNotification):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def push(self, recipient, message):
+        self.provider.call()
+        return super().push(recipient, message)
+
+
+async def main():
+    LIMITS = {"sms": 200, "email": 500, "push": 1000}  # messages per second
+    BURSTS = {"sms": 20, "email": 50, "push": 100}
+    WORKERS = {"sms": 4, "email": 8, "push": 16}
+    N_MESSAGES = {"sms": 600, "email": 1500, "push": 3000}
+    providers = {channel: FakeProvider(LIMITS[channel], BURSTS[channel]) for channel in LIMITS}
+    services = {
+        "sms": ProviderSMS(providers["sms"]),
+        "email": ProviderEmail(providers["email"]),
+        "push": ProviderPushNotification(providers["push"]),
+    }
+
+    pipeline = DeliveryPipeline({
+        channel: ChannelPipeline(
+            MessagingAdapter(services[channel]),
+            rate=LIMITS[channel],
+            burst=BURSTS[channel],
+            workers=WORKERS[channel],
+            max_queue=100,
+        )
+        for channel in LIMITS
+    })
+
+    start = time.perf_counter()
+    async with pipeline:
+        async def produce(channel):
+            for i in range(N_MESSAGES[channel]):
+                await pipeline.send(channel, f"{channel}-user-{i}", "Flash sale!")
+        await asyncio.gather(*(produce(channel) for channel in LIMITS))
+        print(f"Producers done after {time.perf_counter() - start:.2f} s (held back by the bounded queues)")
+    print(f"Pipeline drained after {time.perf_counter() - start:.2f} s\n")
+
+    for channel, lane in pipeline.channels.items():
+        calls = providers[channel].calls
+        observed = (len(calls) - 1) / (calls[-1] - calls[0])
+        print(
+            f"{channel:<6} limit {LIMITS[channel]:>5}/s  observed {observed:7.1f}/s  "
+            f"enqueued {lane.stats.enqueued:>5}  delivered {lane.stats.delivered:>5}  failed {lane.stats.failed}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
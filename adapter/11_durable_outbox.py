@@ -0,0 +1,52 @@
+import os
+import random
+import tempfile
+import time
+
+from messaging_module import MessagingAdapter, SMS, Email, PushNotification
+from outbox_module import Outbox
+
+
+class FlakySMS(SMS):
+    "SMS provider that fails a share of the calls"
+
+    def __init__(self, failure_rate: float):
+        self.failure_rate = failure_rate
+
+    def send_sms(self, recipient, message):
+        if random.random() < self.failure_rate:
+            raise ConnectionError("provider unavailable")
+        return super().send_sms(recipient, message)
+
+
+if __name__ == "__main__":
+    N_MESSAGES = 100_000
+    path = os.path.join(tempfile.mkdtemp(), "outbox.sqlite3")
+    adapters = {
+        "sms": MessagingAdapter(FlakySMS(failure_rate=0.3)),
+        "email": MessagingAdapter(Email()),
+        "push": MessagingAdapter(PushNotification()),
+    }
+
+    outbox = Outbox(path, adapters, base_delay=0.01)
+    start = time.perf_counter()
+    for i in range(N_MESSAGES):
+        outbox.enqueue(("sms", "email", "push")[i % 3], f"user-{i}", "Your order has shipped", f"order-{i}")
+    outbox.flush()
+    elapsed = time.perf_counter() - start
+    print(f"Enqueued {N_MESSAGES:,} messages in {elapsed:.2f} s ({N_MESSAGES / elapsed:,.0f} messages/s)")
+
+    duplicate = outbox.enqueue("sms", "user-0", "Your order has shipped", "order-0")
+    print(f"Enqueue again with idempotency key order-0: stored = {duplicate}")
+
+    outbox.dispatch_due(limit=10_000)
+    print(f"Dispatched a first slice, then the process dies: {outbox.counts()}")
+    outbox.connection.close()  # no flush, no goodbye
+
+    restarted = Outbox(path, adapters, base_delay=0.01)
+    print(f"After restart: {restarted.counts()}")
+    start = time.perf_counter()
+    report = restarted.drain()
+    print(f"Drained in {time.perf_counter() - start:.2f} s: {report}")
+    print(f"Final state: {restarted.counts()}")
+    restarted.close()
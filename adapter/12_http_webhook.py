@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from messaging_module import MessagingAdapter, batched
+from webhook_module import HttpPool, Webhook, WebhookError
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    "Local stand-in for the receiving service, counting the TCP connections it accepts"
+
+    protocol_version = "HTTP/1.1"  # keep connections alive
+    disable_nagle_algorithm = True
+    connections = 0
+    messages = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with WebhookHandler.lock:
+            WebhookHandler.connections += 1
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self.path.startswith("/hooks/"):
+            self.send_error(404)
+            return
+        with WebhookHandler.lock:
+            WebhookHandler.messages += len(payload.get("recipients", [None]))
+        body = json.dumps({"status": "accepted"}).encode()
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label, send, recipients, workers):
+    WebhookHandler.connections = WebhookHandler.messages = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send, recipients))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<30} {WebhookHandler.messages / elapsed:9,.0f} messages/s"
+        f"  new TCP connections: {WebhookHandler.connections:,}"
+    )
+
+
+if __name__ == "__main__":
+    N_MESSAGES = 2_000
+    WORKERS = 4
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/hooks/chat"
+
+    pool = HttpPool(size=WORKERS, timeout=2.0)
+    adapter = MessagingAdapter(Webhook(url, pool))
+    print(adapter.send_message("Alice", "Hello from chat app!"))
+
+    recipients = [f"user-{i}" for i in range(N_MESSAGES)]
+
+    def send_without_reuse(recipient):
+        # A fresh client per message: a new TCP connection every time
+        single_use = HttpPool(size=1)
+        try:
+            return MessagingAdapter(Webhook(url, single_use)).send_message(recipient, "Deploy finished")
+        finally:
+            single_use.close()
+
+    print(f"\n{N_MESSAGES:,} messages from {WORKERS} threads:")
+    run("New connection per message", send_without_reuse, recipients, WORKERS)
+    run("Shared keep-alive pool", lambda recipient: adapter.send_message(recipient, "Deploy finished"), recipients, WORKERS)
+    run(
+        "Batched POSTs (100 per request)",
+        lambda batch: adapter.send_batch(batch, "Deploy finished"),
+        list(batched(recipients, 100)),
+        WORKERS,
+    )
+
+    try:
+        MessagingAdapter(Webhook(url.replace("/hooks/chat", "/missing"), pool)).send_message("Bob", "Hi")
+    except WebhookError as error:
+        print(f"\nWebhook error: {error}")
+
+    pool.close()
+    server.shutdown()
@@ -0,0 +1,52 @@
+import random
+import time
+
+import numpy as np
+
+from power_module import (
+    Chinese3PinPlug, ChineseSocket, EuropeanSocket, TaiwaneseSocket, Laptop, PowerSocket, is_compatible, INDEX,
+)
+
+
+def charge_loop(plugs, sockets, powers):
+    "The per pair way: compare pins, shape and volt, then round(power / volt) in Python"
+    compatible, currents = [], []
+    for plug, socket, power in zip(plugs, sockets, powers):
+        ok = is_compatible(plug, socket)
+        compatible.append(ok)
+        currents.append(round(power / plug.volt, 2) if ok else 0.0)
+    return compatible, currents
+
+
+if __name__ == "__main__":
+    laptop = Laptop()
+    laptop.charge(socket=ChineseSocket(), power_in_watt=235)
+    laptop.charge(socket=EuropeanSocket(), power_in_watt=235)
+    laptop.charge(socket=PowerSocket(3, "FLAT", 220), power_in_watt=235)
+
+    compatible, currents = laptop.charge_batch([ChineseSocket(), EuropeanSocket(), TaiwaneseSocket()], 235)
+    print(f"\ncharge_batch: compatible {compatible}, currents {currents}")
+
+    N_PAIRS = 1_000_000
+    rng = random.Random(7)
+    socket_pool = [ChineseSocket(), EuropeanSocket(), TaiwaneseSocket()]
+    plug = Chinese3PinPlug()
+    plugs = [plug] * N_PAIRS
+    sockets = [rng.choice(socket_pool) for _ in range(N_PAIRS)]
+    powers = [rng.uniform(5, 300) for _ in range(N_PAIRS)]
+
+    start = time.perf_counter()
+    loop_compatible, loop_currents = charge_loop(plugs, sockets, powers)
+    loop_time = time.perf_counter() - start
+
+    powers_array = np.array(powers)
+    start = time.perf_counter()
+    batch_compatible, batch_currents = INDEX.charge_batch(plugs, sockets, powers_array)
+    batch_time = time.perf_counter() - start
+
+    assert batch_compatible.tolist() == loop_compatible
+    # np.round and round() may disagree in the last digit on ties of the binary value
+    assert np.allclose(batch_currents, loop_currents, rtol=0, atol=0.011)
+    print(f"\n{N_PAIRS:,} plug/socket pairs, {batch_compatible.sum():,} compatible:")
+    print(f"  Python loop:  {loop_time:.2f} s")
+    print(f"  charge_batch: {batch_time:.2f} s")
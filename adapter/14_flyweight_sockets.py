@@ -0,0 +1,38 @@
+import importlib
+import sys
+import tracemalloc
+
+from power_module import ChineseSocket, EuropeanSocket, TaiwaneseSocket, Chinese3PinPlug
+
+# The dict based classes of example 02, for comparison
+original = importlib.import_module("02_power_adapter")
+
+
+def measure(label, socket_types, n):
+    "Build `n` sockets cycling through `socket_types`, return the memory they use"
+    tracemalloc.start()
+    sockets = [socket_types[i % 3](f"outlet-{i}") for i in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The names are the same in both layouts, leave them out of the comparison
+    names = sum(sys.getsizeof(socket.name) for socket in sockets)
+    print(f"{label:<26} {(current - names) / n:6.1f} bytes per socket (excluding its name)")
+    return sockets
+
+
+if __name__ == "__main__":
+    N_SOCKETS = 1_000_000
+
+    a, b = ChineseSocket(), ChineseSocket()
+    print(f"Shared specs: {a._spec is b._spec}, {a._spec}")
+    print(f"Hashable: {len({ChineseSocket(), ChineseSocket(), EuropeanSocket()})} distinct sockets in a set")
+    charging = {ChineseSocket("kitchen"): "laptop", TaiwaneseSocket("hotel"): "phone"}
+    print(f"Dict key lookup: {charging[ChineseSocket('kitchen')]}")
+    try:
+        Chinese3PinPlug().volt = 110
+    except AttributeError as error:
+        print(f"Specs are read-only: {error}")
+
+    print(f"\nMemory of {N_SOCKETS:,} modelled outlets:")
+    measure("Per-instance __dict__", (original.ChineseSocket, original.EuropeanSocket, original.TaiwaneseSocket), N_SOCKETS)
+    measure("Flyweight specs + slots", (ChineseSocket, EuropeanSocket, TaiwaneseSocket), N_SOCKETS)
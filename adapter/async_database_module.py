@@ -0,0 +1,80 @@
+import asyncio
+import heapq
+from itertools import islice
+from typing import AsyncIterator, List, Sequence
+
+from database_module import DatabaseAdapter, Row
+
+
+class AsyncDatabaseAdapter:
+    """
+    Awaitable version of DatabaseAdapter.
+
+    The blocking backend calls run in the default executor so they never
+    block the event loop. `timeout` (in seconds) bounds every read unless a
+    read passes its own. Cancelling a read stops waiting for it right away;
+    the backend call already running in its worker thread is left to
+    finish and its result is discarded.
+    """
+
+    def __init__(self, database, timeout: float = None):
+        self.adapter = DatabaseAdapter(database)
+        self.timeout = timeout
+
+    async def _run(self, function, *args, timeout: float = None):
+        timeout = self.timeout if timeout is None else timeout
+        return await asyncio.wait_for(asyncio.to_thread(function, *args), timeout)
+
+    async def retrieve_data(self, timeout: float = None) -> List[Row]:
+        return await self._run(self.adapter.retrieve_data, timeout=timeout)
+
+    async def query(self, sql: str, params: tuple = (), timeout: float = None) -> List[Row]:
+        return await self._run(self.adapter.query, sql, params, timeout=timeout)
+
+    async def iter_rows(self, chunk_size: int = 1000, timeout: float = None) -> AsyncIterator[Row]:
+        """
+        Stream rows, fetching each chunk in the executor. `timeout` bounds
+        the fetch of every chunk. When the stream stops early, the backend
+        rows are closed once the chunk being fetched, if any, is done.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        rows = self.adapter.iter_rows(chunk_size)
+        fetch = None
+        try:
+            while True:
+                fetch = asyncio.ensure_future(asyncio.to_thread(lambda: list(islice(rows, chunk_size))))
+                # Shielded: a timeout or a cancellation stops the wait, not the fetch
+                chunk = await asyncio.wait_for(asyncio.shield(fetch), timeout)
+                if not chunk:
+                    break
+                for row in chunk:
+                    yield row
+        finally:
+            if fetch is None or fetch.done():
+                rows.close()
+            else:
+                # The worker thread is still inside the generator: closing it now would raise
+                # "generator already executing"
+                fetch.add_done_callback(lambda done: _close_after(done, rows))
+
+
+def _close_after(fetch: asyncio.Future, rows):
+    "Close the rows once the abandoned fetch is over, discarding its result"
+    if not fetch.cancelled():
+        fetch.exception()
+    rows.close()
+
+
+async def fan_out_retrieve(adapters: Sequence[AsyncDatabaseAdapter], timeout: float = None) -> List[Row]:
+    """
+    Query every adapter at the same time and merge their (id ordered) rows.
+    If one read fails, times out or is cancelled, the others are cancelled.
+    """
+    tasks = [asyncio.ensure_future(adapter.retrieve_data()) for adapter in adapters]
+    try:
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return list(heapq.merge(*results))
@@ -0,0 +1,134 @@
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from messaging_module import BatchRejected, MessagingAdapter, batched
+
+
+@dataclass
+class DeliveryResult:
+    channel: str
+    recipient: object
+    ok: bool
+    detail: str  # the service response, or the error when the send failed
+
+
+@dataclass
+class BatchError:
+    channel: str
+    recipients: int  # recipients of the batch
+    answered: int    # responses received before the failure
+    error: str
+
+
+@dataclass
+class BulkReport:
+    results: List[DeliveryResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    batch_errors: List[BatchError] = field(default_factory=list)
+
+    @property
+    def sent(self) -> int:
+        return sum(result.ok for result in self.results)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.sent
+
+    @property
+    def throughput(self) -> float:
+        "Recipients handled per second"
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+
+class BulkMessenger:
+    """
+    Sends one message to many (channel, recipient) pairs.
+
+    Recipients are grouped per channel and each channel is sent to in
+    batches of `batch_size` recipients, dispatched on a pool of
+    `max_workers` threads. Every batch failure is recorded in
+    `BulkReport.batch_errors`. When the service rejects a whole batch
+    (BatchRejected) or answers fewer recipients than it was sent, only the
+    recipients left without a response are retried one by one, so every
+    recipient gets its own result and none is sent the message twice. Any
+    other error, or more responses than recipients, leaves unknown who was
+    sent the message: the recipients of the batch are reported as failed,
+    without a retry.
+    """
+
+    def __init__(self, adapters: Dict[str, MessagingAdapter], batch_size: int = 1000, max_workers: int = 4):
+        self.adapters = adapters
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def _send_batch(
+        self, channel: str, batch: List[Tuple[int, object]], message
+    ) -> Tuple[List[Tuple[int, DeliveryResult]], Optional[BatchError]]:
+        adapter = self.adapters[channel]
+        recipients = [recipient for _, recipient in batch]
+        try:
+            responses = list(adapter.send_batch(recipients, message))
+        except BatchRejected as error:
+            responses, batch_error = [], BatchError(channel, len(batch), 0, repr(error))
+        except Exception as error:
+            # Part of the batch may have been delivered: resending could send it twice
+            batch_error = BatchError(channel, len(batch), 0, repr(error))
+            return [
+                (index, DeliveryResult(channel, recipient, False, batch_error.error))
+                for index, recipient in batch
+            ], batch_error
+        else:
+            if len(responses) == len(batch):
+                return [
+                    (index, DeliveryResult(channel, recipient, True, response))
+                    for (index, recipient), response in zip(batch, responses)
+                ], None
+            batch_error = BatchError(
+                channel, len(batch), len(responses), f"{len(responses)} responses for {len(batch)} recipients"
+            )
+            if len(responses) > len(batch):
+                return [
+                    (index, DeliveryResult(channel, recipient, False, batch_error.error))
+                    for index, recipient in batch
+                ], batch_error
+
+        results = [
+            (index, DeliveryResult(channel, recipient, True, response))
+            for (index, recipient), response in zip(batch, responses)
+        ]
+        for index, recipient in batch[len(responses):]:
+            try:
+                results.append((index, DeliveryResult(channel, recipient, True, adapter.send_message(recipient, message))))
+            except Exception as error:
+                results.append((index, DeliveryResult(channel, recipient, False, repr(error))))
+        return results, batch_error
+
+    def send_bulk(self, recipients: Iterable[Tuple[str, object]], message) -> BulkReport:
+        "Send `message` to every (channel, recipient) pair; results keep the input order"
+        start = time.perf_counter()
+        per_channel = defaultdict(list)
+        count = 0
+        for index, (channel, recipient) in enumerate(recipients):
+            if channel not in self.adapters:
+                raise KeyError(f"Unknown channel [{channel}]")
+            per_channel[channel].append((index, recipient))
+            count = index + 1
+
+        results: List[DeliveryResult] = [None] * count
+        batch_errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._send_batch, channel, batch, message)
+                for channel, channel_recipients in per_channel.items()
+                for batch in batched(channel_recipients, self.batch_size)
+            ]
+            for future in futures:
+                batch_results, batch_error = future.result()
+                for index, result in batch_results:
+                    results[index] = result
+                if batch_error is not None:
+                    batch_errors.append(batch_error)
+        return BulkReport(results, time.perf_counter() - start, batch_errors)
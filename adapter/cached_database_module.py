@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, List
+
+from database_module import DatabaseAdapter, Row
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0     # entries dropped to respect max_entries
+    expirations: int = 0   # entries dropped because their TTL ran out
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedDatabaseAdapter:
+    """
+    Read-through cache in front of a DatabaseAdapter.
+
+    Results are keyed on the query and its parameters. The cache holds at
+    most `max_entries` results, evicting the least recently used one, and
+    every entry expires `ttl` seconds after it was stored. Cached results
+    are shared between callers and must not be mutated.
+
+    An invalidation bumps a generation counter: a load that was already
+    running when it happened returns its rows but does not cache them, so
+    a result read before a write can't outlive the invalidation.
+    """
+
+    RETRIEVE_ALL = ("retrieve_data",)
+
+    def __init__(
+        self,
+        adapter: DatabaseAdapter,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        self.adapter = adapter
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple[float, List[Row]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _read_through(self, key: Hashable, load: Callable[[], List[Row]], ttl: float) -> List[Row]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, rows = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return rows
+                del self._entries[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            generation = self._generation
+
+        rows = load()
+
+        with self._lock:
+            if self._generation != generation:
+                return rows
+            self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return rows
+
+    def retrieve_data(self, ttl: float = None) -> List[Row]:
+        return self._read_through(self.RETRIEVE_ALL, self.adapter.retrieve_data, ttl)
+
+    def query(self, sql: str, params: tuple = (), ttl: float = None) -> List[Row]:
+        params = tuple(params)
+        return self._read_through(("query", sql, params), lambda: self.adapter.query(sql, params), ttl)
+
+    def invalidate(self, sql: str = None, params: tuple = None):
+        """
+        Drop cached results. With no arguments everything is dropped, with
+        only `sql` every parameter set of that query is dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            if sql is None:
+                keys = list(self._entries)
+            elif params is None:
+                keys = [key for key in self._entries if key[0] == "query" and key[1] == sql]
+            else:
+                keys = [("query", sql, tuple(params))]
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def invalidate_retrieve_data(self):
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(self.RETRIEVE_ALL, None) is not None:
+                self.stats.invalidations += 1
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,256 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterator, List, Tuple
+
+from database_module import DatabaseAdapter, Row
+
+
+class PoolTimeoutError(TimeoutError):
+    "Raised when no connection could be checked out before the timeout"
+
+
+@dataclass
+class PoolMetrics:
+    size: int = 0             # connections currently open (idle + in use)
+    in_use: int = 0           # connections currently checked out
+    peak_in_use: int = 0      # highest number of simultaneous checkouts
+    attempts: int = 0         # checkouts requested, successful or not
+    checkouts: int = 0        # successful checkouts
+    waits: int = 0            # attempts that had to wait, including the ones that timed out
+    wait_time: float = 0.0    # total seconds spent waiting
+    max_wait: float = 0.0     # longest single wait, in seconds
+    timeouts: int = 0         # checkouts that gave up
+    created: int = 0          # connections opened
+    discarded: int = 0        # connections dropped by the health check
+    reaped: int = 0           # idle connections closed by the reaper
+
+    @property
+    def saturation(self) -> float:
+        "Share of the checkout attempts that found the pool exhausted"
+        return self.waits / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        "Seconds waited on average by the attempts that had to wait"
+        return self.wait_time / self.waits if self.waits else 0.0
+
+    def describe_saturation(self) -> str:
+        "Saturation with the waits behind it: a low share can still hide long waits"
+        return (
+            f"{self.saturation:.1%} of checkout attempts waited ({self.waits} waits,"
+            f" {self.wait_time:.3f} s in total, {self.max_wait:.3f} s at most)"
+        )
+
+
+class _Waiter:
+    "A thread queued for a connection: it is handed a connection, or a slot to open one"
+    __slots__ = ("event", "database", "slot")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.database = None
+        self.slot = False
+
+
+class PooledDatabaseAdapter:
+    """
+    Hands out DatabaseAdapter objects wrapping pooled LegacyDatabase or
+    ModernDatabase connections to threads.
+
+    `factory` opens a new backend connection. The pool keeps at least
+    `min_size` and at most `max_size` connections open and checks every
+    connection with `ping()` on checkout. Threads waiting for a connection
+    are served first come, first served: a released connection is handed
+    to the oldest waiter, never to a thread arriving later. Connections
+    idle for more than `max_idle` seconds are closed on checkout, on
+    release and by a background reaper that runs every `max_idle` seconds,
+    so an unused pool shrinks back to `min_size` too.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], object],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 5.0,
+        max_idle: float = 60.0,
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("expected 0 <= min_size <= max_size and max_size >= 1")
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.metrics = PoolMetrics()
+        self._idle: Deque[Tuple[object, float]] = deque()
+        self._waiters: Deque[_Waiter] = deque()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        for _ in range(min_size):
+            self._idle.append((self._open(), time.monotonic()))
+        self._reaper = threading.Thread(target=self._reap_periodically, name="pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _open(self):
+        database = self._factory()
+        with self._lock:
+            self.metrics.size += 1
+            self.metrics.created += 1
+        return database
+
+    def _free_slot(self):
+        "A connection was closed: hand its slot to the oldest waiter. Must be called holding the lock"
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.slot = True
+            waiter.event.set()
+        else:
+            self.metrics.size -= 1
+
+    def _reap_idle(self, now: float) -> List[object]:
+        "Pop connections idle for too long. Must be called holding the lock"
+        expired = []
+        # The oldest idle connections sit on the left of the deque
+        while self._idle and self.metrics.size - len(expired) > self.min_size:
+            database, last_used = self._idle[0]
+            if now - last_used < self.max_idle:
+                break
+            self._idle.popleft()
+            expired.append(database)
+        self.metrics.size -= len(expired)
+        self.metrics.reaped += len(expired)
+        return expired
+
+    def reap_idle(self):
+        "Close connections that have been idle for more than `max_idle` seconds"
+        with self._lock:
+            expired = self._reap_idle(time.monotonic())
+        for database in expired:
+            database.close()
+
+    def _reap_periodically(self):
+        while not self._stopped.wait(self.max_idle):
+            self.reap_idle()
+
+    def _checkout(self, timeout: float):
+        "A connection, or None when the caller got a slot to open one"
+        database = None
+        granted = False
+        expired = []
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Pool is closed")
+            self.metrics.attempts += 1
+            # Nobody overtakes the threads already waiting
+            if not self._waiters:
+                expired = self._reap_idle(time.monotonic())
+                if self._idle:
+                    # LIFO: reuse the most recently returned connection so the
+                    # others can age out and be reaped
+                    database, _ = self._idle.pop()
+                    granted = True
+                elif self.metrics.size < self.max_size:
+                    self.metrics.size += 1
+                    granted = True
+            if not granted:
+                waiter = _Waiter()
+                self._waiters.append(waiter)
+                self.metrics.waits += 1
+        for idle in expired:
+            idle.close()
+        if granted:
+            return database
+
+        start = time.monotonic()
+        waiter.event.wait(timeout)
+        with self._lock:
+            waited = time.monotonic() - start
+            self.metrics.wait_time += waited
+            self.metrics.max_wait = max(self.metrics.max_wait, waited)
+            # Checked under the lock: release() may have served us after the wait timed out
+            if not waiter.event.is_set():
+                self._waiters.remove(waiter)
+                self.metrics.timeouts += 1
+                raise PoolTimeoutError(f"No connection available after {timeout} s")
+        if waiter.database is None and not waiter.slot:
+            raise RuntimeError("Pool is closed")
+        return waiter.database
+
+    def acquire(self, timeout: float = None):
+        "Check out a healthy backend connection, waiting up to `timeout` seconds"
+        timeout = self.timeout if timeout is None else timeout
+        database = self._checkout(timeout)
+        if database is not None and not database.ping():
+            database.close()
+            with self._lock:
+                self.metrics.discarded += 1
+            # Its slot is ours: open a new connection in it
+            database = None
+        if database is None:
+            # A slot was reserved, open the connection outside the lock
+            try:
+                database = self._factory()
+            except BaseException:
+                with self._lock:
+                    self._free_slot()
+                raise
+            with self._lock:
+                self.metrics.created += 1
+
+        with self._lock:
+            self.metrics.checkouts += 1
+            self.metrics.in_use += 1
+            self.metrics.peak_in_use = max(self.metrics.peak_in_use, self.metrics.in_use)
+        return database
+
+    def release(self, database):
+        "Return a checked out connection to the pool, or hand it to the oldest waiter"
+        expired = []
+        with self._lock:
+            self.metrics.in_use -= 1
+            if self._closed:
+                self.metrics.size -= 1
+                expired = [database]
+            elif self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.database = database
+                waiter.event.set()
+            else:
+                now = time.monotonic()
+                self._idle.append((database, now))
+                expired = self._reap_idle(now)
+        for idle in expired:
+            idle.close()
+
+    @contextmanager
+    def connection(self, timeout: float = None) -> Iterator[DatabaseAdapter]:
+        "Check out a connection wrapped in a DatabaseAdapter for the duration of the block"
+        database = self.acquire(timeout)
+        try:
+            yield DatabaseAdapter(database)
+        finally:
+            self.release(database)
+
+    def retrieve_data(self) -> List[Row]:
+        with self.connection() as adapter:
+            return adapter.retrieve_data()
+
+    def close(self):
+        "Close idle connections and wake the waiters; checked out ones are closed when released"
+        self._stopped.set()
+        with self._lock:
+            self._closed = True
+            idle = [database for database, _ in self._idle]
+            self._idle.clear()
+            self.metrics.size -= len(idle)
+            waiters = self._waiters
+            self._waiters = deque()
+        for waiter in waiters:
+            waiter.event.set()
+        for database in idle:
+            database.close()
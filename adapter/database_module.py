@@ -0,0 +1,167 @@
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Tuple
+
+from registry_module import AdapterRegistry
+
+Row = Tuple[int, str]
+
+
+class ILegacyDatabase:
+    def retrieve_data(self):
+        pass
+
+    def retrieve_chunks(self, chunk_size: int):
+        pass
+
+    def run_query(self, sql: str, params: tuple):
+        pass
+
+
+class IModernDatabase:
+    def get_data(self):
+        pass
+
+    def stream_data(self, batch_size: int):
+        pass
+
+    def fetch(self, sql: str, params: tuple):
+        pass
+
+
+class SQLiteStandIn:
+    """
+    Local SQLite stand-in for a database server. `connect_delay` simulates
+    the handshake cost of opening a connection to a real server and
+    `query_delay` the network round trip of every query.
+    """
+    TABLE = "records"
+
+    def __init__(self, path: str = ":memory:", connect_delay: float = 0.0, query_delay: float = 0.0):
+        if connect_delay:
+            time.sleep(connect_delay)
+        self.path = path
+        self.query_delay = query_delay
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} (id INTEGER PRIMARY KEY, payload TEXT)"
+        )
+
+    def load(self, rows: Iterable[Row]):
+        "Insert rows, consuming the iterable lazily"
+        with self.connection:
+            self.connection.executemany(f"INSERT INTO {self.TABLE} VALUES (?, ?)", rows)
+
+    def ping(self) -> bool:
+        "Health check: True if the connection can still run a query"
+        try:
+            self.connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        self.connection.close()
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        if self.query_delay:
+            time.sleep(self.query_delay)
+        return self.connection.execute(sql, params)
+
+    def _select_all(self) -> sqlite3.Cursor:
+        return self._execute(f"SELECT id, payload FROM {self.TABLE} ORDER BY id")
+
+
+class LegacyDatabase(SQLiteStandIn, ILegacyDatabase):
+    """
+    The legacy system only knows how to hand out whole result sets or
+    lists of rows (chunks).
+    """
+    TABLE = "legacy_records"
+
+    def retrieve_data(self) -> List[Row]:
+        return self._select_all().fetchall()
+
+    def retrieve_chunks(self, chunk_size: int) -> Iterator[List[Row]]:
+        cursor = self._select_all()
+        try:
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            cursor.close()
+
+    def run_query(self, sql: str, params: tuple = ()) -> List[Row]:
+        return self._execute(sql, params).fetchall()
+
+
+class ModernDatabase(SQLiteStandIn, IModernDatabase):
+    """
+    The modern system streams rows one by one, fetching `batch_size` rows
+    at a time from the cursor.
+    """
+    TABLE = "records"
+
+    def get_data(self) -> List[Row]:
+        return self._select_all().fetchall()
+
+    def stream_data(self, batch_size: int) -> Iterator[Row]:
+        cursor = self._select_all()
+        cursor.arraysize = batch_size
+        try:
+            while True:
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            cursor.close()
+
+    def fetch(self, sql: str, params: tuple = ()) -> List[Row]:
+        return self._execute(sql, params).fetchall()
+
+
+def _flatten(chunks: Iterator[List[Row]]) -> Iterator[Row]:
+    for chunk in chunks:
+        yield from chunk
+
+
+# Adaptations call the backend methods through the instance so that
+# subclasses overriding them are honoured
+RETRIEVE_DATA = AdapterRegistry("retrieve_data")
+RETRIEVE_DATA.register(LegacyDatabase, lambda database: database.retrieve_data())
+RETRIEVE_DATA.register(ModernDatabase, lambda database: database.get_data())
+
+QUERY = AdapterRegistry("query")
+QUERY.register(LegacyDatabase, lambda database, sql, params: database.run_query(sql, params))
+QUERY.register(ModernDatabase, lambda database, sql, params: database.fetch(sql, params))
+
+ITER_ROWS = AdapterRegistry("iter_rows")
+ITER_ROWS.register(LegacyDatabase, lambda database, chunk_size: _flatten(database.retrieve_chunks(chunk_size)))
+ITER_ROWS.register(ModernDatabase, lambda database, chunk_size: database.stream_data(chunk_size))
+
+
+class DatabaseAdapter(ILegacyDatabase, IModernDatabase):
+    def __init__(self, database):
+        self.database = database
+
+    def retrieve_data(self) -> List[Row]:
+        return RETRIEVE_DATA.dispatch(self.database)
+
+    def query(self, sql: str, params: tuple = ()) -> List[Row]:
+        "Run a parameterized read against the wrapped database"
+        return QUERY.dispatch(self.database, sql, params)
+
+    def iter_rows(self, chunk_size: int = 1000) -> Iterator[Row]:
+        "Yield rows one by one, holding at most `chunk_size` rows in memory"
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return ITER_ROWS.dispatch(self.database, chunk_size)
+
+
+def generate_rows(n_rows: int) -> Iterator[Row]:
+    "Lazily generate `n_rows` fake records"
+    for i in range(n_rows):
+        yield (i, f"record-{i}")
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from messaging_module import MessagingAdapter
+
+
+class TokenBucket:
+    """
+    Allows `rate` operations per second on average, with bursts of up to
+    `capacity` operations.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        # The lock makes waiting workers take tokens in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+@dataclass
+class ChannelStats:
+    enqueued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class ChannelPipeline:
+    """
+    Delivery lane of one channel: a bounded queue drained by `workers`
+    tasks, each send waiting for a token of the channel's rate limiter.
+    When the queue is full `send()` waits, pushing back on the producer.
+    Once `close()` is called, `send()` raises RuntimeError, including in
+    the producers already waiting for room in the queue.
+    """
+
+    def __init__(self, adapter: MessagingAdapter, rate: float, burst: float = None, workers: int = 4, max_queue: int = 1000):
+        self.adapter = adapter
+        self.limiter = TokenBucket(rate, burst)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.stats = ChannelStats()
+        self._closed = False
+        # Guards the closed check and the enqueue, and wakes the producers waiting for room
+        self._room = asyncio.Condition()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(workers)]
+
+    async def send(self, recipient, message):
+        async with self._room:
+            await self._room.wait_for(lambda: self._closed or not self.queue.full())
+            if self._closed:
+                raise RuntimeError("Pipeline is shut down")
+            self.queue.put_nowait((recipient, message))
+            self.stats.enqueued += 1
+
+    async def _worker(self):
+        while True:
+            recipient, message = await self.queue.get()
+            async with self._room:
+                self._room.notify()
+            try:
+                await self.limiter.acquire()
+                # The providers are blocking, keep them off the event loop
+                await asyncio.to_thread(self.adapter.send_message, recipient, message)
+                self.stats.delivered += 1
+            except Exception as error:
+                self.stats.failed += 1
+                self.stats.errors.append(f"{recipient}: {error!r}")
+            finally:
+                self.queue.task_done()
+
+    async def close(self, drain: bool = True):
+        "Refuse new messages and stop the workers, after delivering everything queued if `drain` is set"
+        async with self._room:
+            self._closed = True
+            self._room.notify_all()
+        if drain:
+            await self.queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+
+class DeliveryPipeline:
+    "One rate limited ChannelPipeline per channel"
+
+    def __init__(self, channels: Dict[str, ChannelPipeline]):
+        self.channels = channels
+        self._closed = False
+
+    async def send(self, channel: str, recipient, message):
+        # The channel checks again under its lock: a producer waiting for room is refused too
+        if self._closed:
+            raise RuntimeError("Pipeline is shut down")
+        await self.channels[channel].send(recipient, message)
+
+    async def shutdown(self, drain: bool = True):
+        "Refuse new messages, then stop every channel, draining queued messages by default"
+        self._closed = True
+        await asyncio.gather(*(pipeline.close(drain) for pipeline in self.channels.values()))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.shutdown()
@@ -0,0 +1,83 @@
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from registry_module import AdapterRegistry
+
+
+class BatchRejected(Exception):
+    "Raised by a batch method when the service refused the whole batch: nobody was sent the message"
+
+
+class SMS:
+    def send_sms(self, recipient, message):
+        return f"Sending SMS to {recipient}: {message}"
+
+    def send_sms_batch(self, recipients, message):
+        # The part shared by every recipient is formatted once per batch
+        suffix = f": {message}"
+        return ["Sending SMS to " + str(recipient) + suffix for recipient in recipients]
+
+class Email:
+    def send_email(self, recipient, subject, message):
+        return f"Sending Email to {recipient} - Subject: {subject}, Message: {message}"
+
+    def send_email_batch(self, recipients, subject, message):
+        suffix = f" - Subject: {subject}, Message: {message}"
+        return ["Sending Email to " + str(recipient) + suffix for recipient in recipients]
+
+class PushNotification:
+    def push(self, recipient, message):
+        return f"Pushing Notification to {recipient}: {message}"
+
+    def push_batch(self, recipients, message):
+        suffix = f": {message}"
+        return ["Pushing Notification to " + str(recipient) + suffix for recipient in recipients]
+
+
+SEND_MESSAGE = AdapterRegistry("send_message")
+SEND_MESSAGE.register(SMS, lambda service, recipient, message: service.send_sms(recipient, message))
+SEND_MESSAGE.register(
+    Email, lambda service, recipient, message: service.send_email(recipient, "Chat Notification", message)
+)
+SEND_MESSAGE.register(PushNotification, lambda service, recipient, message: service.push(recipient, message))
+
+SEND_BATCH = AdapterRegistry("send_batch")
+SEND_BATCH.register(SMS, lambda service, recipients, message: service.send_sms_batch(recipients, message))
+SEND_BATCH.register(
+    Email, lambda service, recipients, message: service.send_email_batch(recipients, "Chat Notification", message)
+)
+SEND_BATCH.register(PushNotification, lambda service, recipients, message: service.push_batch(recipients, message))
+
+
+def batched(items: Iterable, batch_size: int) -> Iterator[List]:
+    "Split `items` into lists of at most `batch_size` items"
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class MessagingAdapter:
+    def __init__(self, messaging_service):
+        self.messaging_service = messaging_service
+
+    def send_message(self, recipient, message):
+        return SEND_MESSAGE.dispatch(self.messaging_service, recipient, message)
+
+    def send_batch(self, recipients: List, message) -> List:
+        """
+        Send the same message to every recipient in one call to the service,
+        or one call per recipient for services without a batch method
+        """
+        if SEND_BATCH.supports(type(self.messaging_service)):
+            return SEND_BATCH.dispatch(self.messaging_service, recipients, message)
+        return [self.send_message(recipient, message) for recipient in recipients]
+
+    def send_bulk(self, recipients: Iterable, message, batch_size: int = 1000) -> List:
+        "Send the same message to any number of recipients, `batch_size` at a time"
+        results = []
+        for batch in batched(recipients, batch_size):
+            results.extend(self.send_batch(batch, message))
+        return results
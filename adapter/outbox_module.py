@@ -0,0 +1,190 @@
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict
+
+from messaging_module import MessagingAdapter
+
+
+@dataclass
+class DispatchReport:
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+class Outbox:
+    """
+    Append-only local outbox in front of MessagingAdapter, backed by SQLite.
+
+    `enqueue()` only writes the message to the outbox and never calls a
+    service, so it can absorb bursts. Writes are group committed: the
+    transaction is committed (and fsynced) every `batch_size` messages,
+    every `flush_interval` seconds, or on `flush()`. A background thread
+    checks every `flush_interval` seconds, so a quiet outbox is committed
+    too. A message is durable once committed: a crash loses at most the
+    messages enqueued in the last 2 * `flush_interval` seconds, and
+    `flush()` returns once everything enqueued before it is durable. With
+    `flush_interval=None` there is no thread and no timed commit. A
+    message enqueued twice with the same idempotency key is stored once.
+
+    `dispatch_due()` sends the messages that are due. A failed send is
+    retried with exponential backoff (`base_delay * 2 ** attempts`, capped
+    at `max_delay`, with jitter) until `max_attempts` is reached, after
+    which the message is marked dead. Delivery is at least once: after a
+    restart every message that was not marked sent is dispatched again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        adapters: Dict[str, MessagingAdapter],
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+    ):
+        self.adapters = adapters
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        self._closed = threading.Event()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                channel TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                message TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+        """)
+        self._flusher = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="outbox-flusher", daemon=True)
+            self._flusher.start()
+
+    def enqueue(self, channel: str, recipient, message, idempotency_key: str = None) -> bool:
+        "Store a message for delivery. Returns False if its idempotency key was already enqueued"
+        if channel not in self.adapters:
+            raise KeyError(f"Unknown channel [{channel}]")
+        idempotency_key = idempotency_key or uuid.uuid4().hex
+        with self._lock:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, channel, recipient, message, next_attempt_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (idempotency_key, channel, str(recipient), message, time.time()),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.batch_size or (
+                self.flush_interval is not None and time.monotonic() - self._last_commit >= self.flush_interval
+            ):
+                self._commit()
+        return cursor.rowcount == 1
+
+    def _commit(self):
+        self.connection.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def flush(self):
+        "Commit every enqueued message to disk"
+        with self._lock:
+            self._commit()
+
+    def _flush_periodically(self):
+        "Commit the messages left uncommitted for `flush_interval` when no enqueue() comes to do it"
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._uncommitted and time.monotonic() - self._last_commit >= self.flush_interval:
+                    try:
+                        self._commit()
+                    except sqlite3.ProgrammingError:
+                        return  # the connection was closed under us
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def dispatch_due(self, limit: int = 1000) -> DispatchReport:
+        "Send up to `limit` messages whose next attempt is due"
+        report = DispatchReport()
+        with self._lock:
+            self._commit()
+            due = self.connection.execute(
+                "SELECT id, channel, recipient, message, attempts FROM outbox"
+                " WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT ?",
+                (time.time(), limit),
+            ).fetchall()
+
+        for message_id, channel, recipient, message, attempts in due:
+            try:
+                self.adapters[channel].send_message(recipient, message)
+            except Exception as error:
+                attempts += 1
+                if attempts >= self.max_attempts:
+                    update = ("UPDATE outbox SET status = 'dead', attempts = ?, last_error = ? WHERE id = ?",
+                              (attempts, repr(error), message_id))
+                    report.dead += 1
+                else:
+                    update = ("UPDATE outbox SET attempts = ?, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                              (attempts, repr(error), time.time() + self._backoff(attempts), message_id))
+                    report.retried += 1
+            else:
+                update = ("UPDATE outbox SET status = 'sent', attempts = ? WHERE id = ?", (attempts + 1, message_id))
+                report.sent += 1
+            with self._lock:
+                self.connection.execute(*update)
+
+        self.flush()
+        return report
+
+    def next_due_in(self) -> float:
+        "Seconds until the next pending message is due, None if nothing is pending"
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def drain(self) -> DispatchReport:
+        "Dispatch until no message is pending, waiting for the retries to come due"
+        total = DispatchReport()
+        while True:
+            report = self.dispatch_due()
+            total.sent += report.sent
+            total.retried += report.retried
+            total.dead += report.dead
+            wait = self.next_due_in()
+            if wait is None:
+                return total
+            time.sleep(wait)
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.connection.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status"))
+
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        # Under the lock: a concurrent enqueue() gets a ProgrammingError, not a connection closed mid-query
+        with self._lock:
+            self._commit()
+            self.connection.close()
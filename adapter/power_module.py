@@ -0,0 +1,315 @@
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+
+class ElectricalSpec(NamedTuple):
+    """
+    Immutable electrical specs of a socket or plug. Specs are interned
+    (flyweights): every socket or plug with the same specs shares one
+    ElectricalSpec object instead of holding its own copy.
+    """
+    hole_num: int
+    shape: str
+    volt: int
+
+    @classmethod
+    def intern(cls, hole_num, shape, volt) -> "ElectricalSpec":
+        key = (hole_num, shape, volt)
+        spec = _SPECS.get(key)
+        if spec is None:
+            spec = _SPECS[key] = cls(hole_num, shape, volt)
+        return spec
+
+_SPECS: Dict[tuple, ElectricalSpec] = {}
+
+
+class PowerSocket:
+    """
+       PowerSocket base class
+    """
+    __slots__ = ("_spec",)
+
+    def __init__ (self, hole_num, shape, volt):
+        self._spec = ElectricalSpec.intern(hole_num, shape, volt)
+
+    def get_hole_num(self):
+        return self._spec.hole_num
+
+    def get_hole_shape(self):
+        return self._spec.shape
+
+    def get_volt(self):
+        return self._spec.volt
+
+### some concrete PowerSocket classes
+class ChineseSocket(PowerSocket):
+    __slots__ = ("name",)
+
+    def __init__ (self, name: str = "CHINESE"):
+        super().__init__(3, "FLAT", 220)
+        self.name = name
+
+    def __eq__(self, other):
+        if isinstance(other, ChineseSocket):
+            return self.name == other.name
+        return False
+
+    def __hash__(self):
+        return hash((ChineseSocket, self.name))
+
+    def __str__(self):
+        return self.name
+
+class EuropeanSocket(PowerSocket):
+    __slots__ = ("name",)
+
+    def __init__ (self, name: str = "EUROPEAN"):
+        super().__init__(2, "ROUND", 220)
+        self.name = name
+
+    def __eq__(self, other):
+        if isinstance(other, EuropeanSocket):
+            return self.name == other.name
+        return False
+
+    def __hash__(self):
+        return hash((EuropeanSocket, self.name))
+
+    def __str__(self):
+        return self.name
+
+class TaiwaneseSocket(PowerSocket):
+    __slots__ = ("name",)
+
+    def __init__ (self, name: str = "TAIWANESE"):
+        super().__init__(2, "FLAT", 110)
+        self.name = name
+
+    def __eq__(self, other):
+        if isinstance(other, TaiwaneseSocket):
+            return self.name == other.name
+        return False
+
+    def __hash__(self):
+        return hash((TaiwaneseSocket, self.name))
+
+    def __str__(self):
+        return self.name
+
+class PowerPlug:
+    """
+       PowerPlug base class: the specs of a plug class are its class-level SPEC
+    """
+    __slots__ = ()
+    SPEC: ElectricalSpec = None
+
+    @property
+    def pins(self):
+        return self.SPEC.hole_num
+
+    @property
+    def pin_shape(self):
+        return self.SPEC.shape
+
+    @property
+    def volt(self):
+        return self.SPEC.volt
+
+class Chinese3PinPlug(PowerPlug):
+    __slots__ = ("name",)
+    SPEC = ElectricalSpec.intern(3, "FLAT", 220)
+
+    def __init__(self, name: str = "CHINESE3PINPLUG"):
+        self.name = name
+
+    def __eq__(self, other):
+        if isinstance(other, Chinese3PinPlug):
+            return self.name == other.name
+        return False
+
+    def __hash__(self):
+        return hash((Chinese3PinPlug, self.name))
+
+    def __str__(self):
+        return self.name
+
+
+def is_compatible(plug, socket) -> bool:
+    "Compare pins, shape and voltage of a plug and a socket"
+    return (plug.pins == socket.get_hole_num()) and \
+           (plug.pin_shape == socket.get_hole_shape()) and \
+           (plug.volt == socket.get_volt())
+
+
+def _read_plug_spec(plug) -> ElectricalSpec:
+    return ElectricalSpec.intern(plug.pins, plug.pin_shape, plug.volt)
+
+
+def _read_socket_spec(socket) -> ElectricalSpec:
+    return ElectricalSpec.intern(socket.get_hole_num(), socket.get_hole_shape(), socket.get_volt())
+
+
+_PLUG_READERS: Dict[type, Callable] = {}
+_SOCKET_READERS: Dict[type, Callable] = {}
+
+
+def _plug_reader(plug_type: type) -> Callable:
+    "How to read the specs of a plug class: its class-level SPEC unless it overrides the properties"
+    reader = _PLUG_READERS.get(plug_type)
+    if reader is None:
+        fixed = issubclass(plug_type, PowerPlug) and isinstance(plug_type.SPEC, ElectricalSpec) and all(
+            getattr(plug_type, name) is getattr(PowerPlug, name)
+            for name in ("pins", "pin_shape", "volt")
+        )
+        reader = _PLUG_READERS[plug_type] = attrgetter("SPEC") if fixed else _read_plug_spec
+    return reader
+
+
+def _socket_reader(socket_type: type) -> Callable:
+    "How to read the specs of a socket class: its interned spec unless it overrides the getters"
+    reader = _SOCKET_READERS.get(socket_type)
+    if reader is None:
+        plain = issubclass(socket_type, PowerSocket) and all(
+            getattr(socket_type, getter) is getattr(PowerSocket, getter)
+            for getter in ("get_hole_num", "get_hole_shape", "get_volt")
+        )
+        reader = _SOCKET_READERS[socket_type] = attrgetter("_spec") if plain else _read_socket_spec
+    return reader
+
+
+def plug_spec(plug) -> ElectricalSpec:
+    return _plug_reader(type(plug))(plug)
+
+
+def socket_spec(socket) -> ElectricalSpec:
+    return _socket_reader(type(socket))(socket)
+
+
+class CompatibilityIndex:
+    """
+    Precomputed plug/socket compatibility keyed on electrical specs.
+
+    The compatibility of a plug and a socket only depends on their specs,
+    and a fleet only uses a handful of distinct specs. Each spec gets an
+    integer code the first time a plug or socket with it is met, and the
+    compatibility of every (plug spec, socket spec) pair is kept in the
+    `compatible` matrix, so single pairs and whole batches are lookups.
+    Specs are read per instance: a socket class whose specs vary between
+    instances, like a bare PowerSocket, is indexed correctly.
+    """
+
+    def __init__(self, plugs: Iterable = (), sockets: Iterable = ()):
+        # Keyed on id(spec): specs are interned, and an int hashes faster than a tuple
+        self.plug_codes: Dict[int, int] = {}
+        self.socket_codes: Dict[int, int] = {}
+        self._plugs = []
+        self._sockets = []
+        self.compatible = np.zeros((0, 0), dtype=bool)
+        self.plug_volts = np.zeros(0)
+        for plug in plugs:
+            self.add_plug(plug)
+        for socket in sockets:
+            self.add_socket(socket)
+
+    def add_plug(self, plug) -> int:
+        "Code of the specs of a plug, indexing them if they are new"
+        spec = plug_spec(plug)
+        code = self.plug_codes.get(id(spec))
+        if code is None:
+            code = self.plug_codes[id(spec)] = len(self._plugs)
+            self._plugs.append(plug)
+            self._rebuild()
+        return code
+
+    def add_socket(self, socket) -> int:
+        "Code of the specs of a socket, indexing them if they are new"
+        spec = socket_spec(socket)
+        code = self.socket_codes.get(id(spec))
+        if code is None:
+            code = self.socket_codes[id(spec)] = len(self._sockets)
+            self._sockets.append(socket)
+            self._rebuild()
+        return code
+
+    def _rebuild(self):
+        self.compatible = np.array(
+            [[is_compatible(plug, socket) for socket in self._sockets] for plug in self._plugs],
+            dtype=bool,
+        ).reshape(len(self._plugs), len(self._sockets))
+        self.plug_volts = np.array([plug.volt for plug in self._plugs], dtype=float)
+
+    def lookup(self, plug, socket) -> bool:
+        # Both codes first: indexing a new spec grows the matrix
+        plug_code = self.add_plug(plug)
+        socket_code = self.add_socket(socket)
+        return bool(self.compatible[plug_code, socket_code])
+
+    def _codes(self, items: Sequence, reader_of, codes: Dict[int, int], add) -> np.ndarray:
+        readers = {reader_of(item_type) for item_type in set(map(type, items))}
+        # A batch of classes read the same way is mapped to codes without a Python-level loop
+        read = readers.pop() if len(readers) == 1 else (lambda item: reader_of(type(item))(item))
+        try:
+            return np.fromiter(map(codes.__getitem__, map(id, map(read, items))), dtype=np.intp, count=len(items))
+        except KeyError:
+            return np.fromiter(map(add, items), dtype=np.intp, count=len(items))
+
+    def charge_batch(self, plugs: Sequence, sockets: Sequence, powers_in_watt) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate many plug/socket pairs at once.
+
+        Returns a boolean array telling which pairs are compatible and the
+        current drawn by each pair (0 when they are not compatible), rounded
+        to 2 decimals like Laptop.charge.
+        """
+        plug_codes = self._codes(plugs, _plug_reader, self.plug_codes, self.add_plug)
+        socket_codes = self._codes(sockets, _socket_reader, self.socket_codes, self.add_socket)
+        powers = np.broadcast_to(np.asarray(powers_in_watt, dtype=float), plug_codes.shape)
+        compatible = self.compatible[plug_codes, socket_codes]
+        currents = np.where(compatible, np.round(powers / self.plug_volts[plug_codes], 2), 0.0)
+        return compatible, currents
+
+
+INDEX = CompatibilityIndex(
+    plugs=[Chinese3PinPlug()],
+    sockets=[ChineseSocket(), EuropeanSocket(), TaiwaneseSocket()],
+)
+
+
+class Laptop:
+    def __init__(self, index: CompatibilityIndex = INDEX):
+        self.plug = Chinese3PinPlug()
+        self.index = index
+
+    def charge(self, socket, power_in_watt):
+        res = False
+        if isinstance(socket, PowerSocket):
+            res = self.index.lookup(self.plug, socket)
+        else:
+            print("Socket is not an instance of PowerSocket")
+
+        if res:
+            current = round(power_in_watt / self.plug.volt, 2)
+            print(f"Start charging...., Plug: {self.plug} Socket: {socket}" )
+        else:
+            print(f"Socket and plug not compatible, Plug: {self.plug} Socket: {socket}.")
+        return res
+
+    def charge_batch(self, sockets: Sequence, powers_in_watt) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Try the laptop plug on many sockets at once, see
+        CompatibilityIndex.charge_batch. Like charge(), an object that is
+        not a PowerSocket is reported and counted as not compatible.
+        """
+        if all(issubclass(socket_type, PowerSocket) for socket_type in set(map(type, sockets))):
+            return self.index.charge_batch([self.plug] * len(sockets), sockets, powers_in_watt)
+
+        valid = np.fromiter((isinstance(socket, PowerSocket) for socket in sockets), dtype=bool, count=len(sockets))
+        print(f"{np.count_nonzero(~valid)} sockets are not instances of PowerSocket")
+        powers = np.broadcast_to(np.asarray(powers_in_watt, dtype=float), valid.shape)
+        kept = [socket for socket, ok in zip(sockets, valid) if ok]
+        compatible = np.zeros(len(sockets), dtype=bool)
+        currents = np.zeros(len(sockets))
+        compatible[valid], currents[valid] = self.index.charge_batch([self.plug] * len(kept), kept, powers[valid])
+        return compatible, currents
@@ -0,0 +1,66 @@
+from typing import Callable, Dict, Optional
+
+
+class AdapterRegistry:
+    """
+    Maps adaptee types to the function that adapts them to one operation.
+
+    Each adaptee type registers its adaptation once. The first lookup for a
+    concrete class walks its MRO, so subclasses of a registered type are
+    adapted like their parent, and the result is cached per class: every
+    later dispatch is a single dict lookup, however many types are
+    registered.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._adaptations: Dict[type, Callable] = {}
+        self._resolved: Dict[type, Optional[Callable]] = {}
+
+    def register(self, adaptee_type: type, adaptation: Callable = None):
+        """
+        Register `adaptation(adaptee, *args)` for `adaptee_type`. Can also be
+        used as a decorator: `@registry.register(SomeType)`.
+        """
+        if adaptation is None:
+            return lambda function: self.register(adaptee_type, function)
+        self._adaptations[adaptee_type] = adaptation
+        # Registering a type can change how already resolved subclasses dispatch
+        self._resolved.clear()
+        return adaptation
+
+    def _resolve_mro(self, adaptee_type: type) -> Optional[Callable]:
+        for base in adaptee_type.__mro__:
+            if base in self._adaptations:
+                return self._adaptations[base]
+        return None
+
+    def resolve(self, adaptee_type: type) -> Callable:
+        try:
+            adaptation = self._resolved[adaptee_type]
+        except KeyError:
+            adaptation = self._resolved[adaptee_type] = self._resolve_mro(adaptee_type)
+        if adaptation is None:
+            raise TypeError(f"No {self.operation} adaptation registered for {adaptee_type.__name__}")
+        return adaptation
+
+    def supports(self, adaptee_type: type) -> bool:
+        "True if `adaptee_type` or one of its bases has a registered adaptation"
+        try:
+            self.resolve(adaptee_type)
+            return True
+        except TypeError:
+            return False
+
+    def dispatch(self, adaptee, *args, **kwargs):
+        "Adapt the call to `adaptee` using the adaptation registered for its type"
+        adaptation = self._resolved.get(type(adaptee))
+        if adaptation is None:
+            adaptation = self.resolve(type(adaptee))
+        return adaptation(adaptee, *args, **kwargs)
+
+    def __contains__(self, adaptee_type: type) -> bool:
+        return adaptee_type in self._adaptations
+
+    def __len__(self):
+        return len(self._adaptations)
@@ -0,0 +1,23 @@
+import asyncio
+
+import pytest
+
+from async_database_module import AsyncDatabaseAdapter
+from database_module import LegacyDatabase, generate_rows
+
+
+def test_iter_rows_timeout_closes_rows_after_the_fetch():
+    database = LegacyDatabase(query_delay=0.1)
+    database.load(generate_rows(5))
+
+    async def stream():
+        rows = AsyncDatabaseAdapter(database, timeout=0.02).iter_rows(chunk_size=2)
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in rows:
+                pass
+        await rows.aclose()
+        # Once the worker is done, the rows can be streamed again from a fresh adapter
+        await asyncio.sleep(0.2)
+        return [row async for row in AsyncDatabaseAdapter(database).iter_rows(chunk_size=2)]
+
+    assert len(asyncio.run(stream())) == 5
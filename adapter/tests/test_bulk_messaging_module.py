@@ -0,0 +1,74 @@
+from bulk_messaging_module import BulkMessenger
+from messaging_module import BatchRejected, MessagingAdapter, SMS
+
+
+class CountingSMS(SMS):
+    "Answers `answered` recipients of each batch, counts the single sends"
+
+    def __init__(self, answered):
+        self.answered = answered
+        self.single = []
+
+    def send_sms(self, recipient, message):
+        self.single.append(recipient)
+        return super().send_sms(recipient, message)
+
+    def send_sms_batch(self, recipients, message):
+        return super().send_sms_batch(recipients, message)[:self.answered(len(recipients))]
+
+
+def send(service, count=4):
+    messenger = BulkMessenger({"sms": MessagingAdapter(service)}, batch_size=count)
+    return messenger.send_bulk([("sms", f"user-{i}") for i in range(count)], "hi")
+
+
+def test_short_batch_retries_only_unanswered_recipients():
+    service = CountingSMS(lambda n: n - 1)
+    report = send(service)
+    assert report.sent == 4
+    assert service.single == ["user-3"]
+    assert [(error.answered, error.recipients) for error in report.batch_errors] == [(3, 4)]
+
+
+def test_long_batch_is_reported_failed_without_resending():
+    service = CountingSMS(lambda n: n)
+    service.send_sms_batch = lambda recipients, message: ["extra"] * (len(recipients) + 1)
+    report = send(service)
+    assert report.failed == 4
+    assert service.single == []
+    assert len(report.batch_errors) == 1
+
+
+def test_full_batch_has_no_error():
+    report = send(CountingSMS(lambda n: n))
+    assert report.sent == 4 and report.batch_errors == []
+
+
+def test_batch_failing_partway_is_not_resent():
+    service = CountingSMS(lambda n: n)
+
+    def fail_after_two(recipients, message):
+        for recipient in recipients[:2]:
+            service.delivered.append(recipient)
+        raise ConnectionError("connection reset")
+
+    service.delivered = []
+    service.send_sms_batch = fail_after_two
+    report = send(service)
+    assert report.failed == 4
+    assert service.single == []
+    assert service.delivered == ["user-0", "user-1"]
+    assert [(error.answered, error.recipients) for error in report.batch_errors] == [(0, 4)]
+
+
+def test_rejected_batch_falls_back_to_single_sends():
+    service = CountingSMS(lambda n: n)
+
+    def reject(recipients, message):
+        raise BatchRejected("too many recipients")
+
+    service.send_sms_batch = reject
+    report = send(service)
+    assert report.sent == 4
+    assert service.single == ["user-0", "user-1", "user-2", "user-3"]
+    assert len(report.batch_errors) == 1
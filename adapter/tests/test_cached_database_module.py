@@ -0,0 +1,38 @@
+import threading
+
+from cached_database_module import CachedDatabaseAdapter
+from database_module import DatabaseAdapter, LegacyDatabase, generate_rows
+
+
+class SlowLegacyDatabase(LegacyDatabase):
+    "Holds every query until `release` is set"
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def run_query(self, sql, params=()):
+        rows = super().run_query(sql, params)
+        self.started.set()
+        self.release.wait()
+        return rows
+
+
+def test_invalidate_during_a_load_is_not_lost():
+    database = SlowLegacyDatabase()
+    database.load(generate_rows(3))
+    cached = CachedDatabaseAdapter(DatabaseAdapter(database))
+    sql = "SELECT id, payload FROM legacy_records WHERE id = ?"
+
+    reader = threading.Thread(target=cached.query, args=(sql, (1,)))
+    reader.start()
+    database.started.wait()
+    with database.connection:
+        database.connection.execute("UPDATE legacy_records SET payload = 'changed' WHERE id = 1")
+    cached.invalidate(sql, (1,))
+    database.release.set()
+    reader.join()
+
+    assert len(cached) == 0
+    assert cached.query(sql, (1,)) == [(1, "changed")]
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from connection_pool_module import PoolTimeoutError, PooledDatabaseAdapter
+from database_module import LegacyDatabase
+
+
+def test_waiters_are_served_in_arrival_order():
+    pool = PooledDatabaseAdapter(LegacyDatabase, min_size=1, max_size=1, timeout=2.0)
+    held = pool.acquire()
+    served = []
+
+    def wait_turn(number):
+        database = pool.acquire()
+        served.append(number)
+        pool.release(database)
+
+    threads = []
+    for number in range(5):
+        thread = threading.Thread(target=wait_turn, args=(number,))
+        thread.start()
+        threads.append(thread)
+        while pool.metrics.waits <= number:
+            time.sleep(0.001)
+    pool.release(held)
+    for thread in threads:
+        thread.join()
+    assert served == [0, 1, 2, 3, 4]
+    assert pool.metrics.waits == 5
+    assert pool.metrics.wait_time >= pool.metrics.max_wait > 0
+    pool.close()
+
+
+def test_timeout_leaves_the_queue():
+    pool = PooledDatabaseAdapter(LegacyDatabase, min_size=1, max_size=1)
+    held = pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire(timeout=0.01)
+    pool.release(held)
+    assert pool.acquire(timeout=0.01) is held
+    pool.close()
+
+
+def test_timed_out_waits_keep_saturation_within_bounds():
+    pool = PooledDatabaseAdapter(LegacyDatabase, min_size=1, max_size=1)
+    held = pool.acquire()
+    for _ in range(3):
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire(timeout=0.001)
+    metrics = pool.metrics
+    assert (metrics.attempts, metrics.checkouts, metrics.waits, metrics.timeouts) == (4, 1, 3, 3)
+    assert metrics.saturation == 0.75
+    pool.release(held)
+    pool.close()
+
+
+def test_idle_connections_are_reaped_without_any_release():
+    pool = PooledDatabaseAdapter(LegacyDatabase, min_size=0, max_size=2, max_idle=0.02)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    time.sleep(0.2)
+    assert pool.metrics.size == 0
+    assert pool.metrics.reaped == 2
+    pool.close()
+
+
+def test_close_wakes_waiters():
+    pool = PooledDatabaseAdapter(LegacyDatabase, min_size=1, max_size=1, timeout=5.0)
+    pool.acquire()
+    errors = []
+
+    def wait():
+        try:
+            pool.acquire()
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    while not pool.metrics.waits:
+        time.sleep(0.001)
+    pool.close()
+    thread.join(timeout=1.0)
+    assert len(errors) == 1
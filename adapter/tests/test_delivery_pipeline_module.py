@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+import pytest
+
+from delivery_pipeline_module import ChannelPipeline, DeliveryPipeline
+from messaging_module import MessagingAdapter, SMS
+
+
+class BlockedSMS(SMS):
+    "Holds every send until `release` is set"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def send_sms(self, recipient, message):
+        self.release.wait()
+        return super().send_sms(recipient, message)
+
+
+@pytest.mark.parametrize("drain", [False, True])
+def test_shutdown_rejects_producers_waiting_for_room(drain):
+    async def scenario():
+        service = BlockedSMS()
+        pipeline = DeliveryPipeline({
+            "sms": ChannelPipeline(MessagingAdapter(service), rate=1000, workers=1, max_queue=1),
+        })
+        # One message in the worker, one in the queue, the third producer waits for room
+        await pipeline.send("sms", "user-0", "hi")
+        await asyncio.sleep(0.01)
+        await pipeline.send("sms", "user-1", "hi")
+        blocked = asyncio.create_task(pipeline.send("sms", "user-2", "hi"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        service.release.set()
+        await asyncio.wait_for(pipeline.shutdown(drain), 2.0)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(blocked, 1.0)
+        with pytest.raises(RuntimeError):
+            await pipeline.send("sms", "user-3", "hi")
+        return pipeline.channels["sms"].stats
+
+    stats = asyncio.run(scenario())
+    assert stats.enqueued == 2
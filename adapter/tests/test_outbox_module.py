@@ -0,0 +1,57 @@
+import sqlite3
+import threading
+import time
+
+from messaging_module import Email, MessagingAdapter
+from outbox_module import Outbox
+
+
+def committed_rows(path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_quiet_outbox_is_committed_after_flush_interval(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    outbox = Outbox(path, {"email": MessagingAdapter(Email())}, batch_size=1000, flush_interval=0.02)
+    outbox.enqueue("email", "someone@example.com", "hello")
+    assert committed_rows(path) == 0
+    time.sleep(0.2)
+    assert committed_rows(path) == 1
+    outbox.close()
+
+
+def test_no_timed_commit_without_flush_interval(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    outbox = Outbox(path, {"email": MessagingAdapter(Email())}, batch_size=1000, flush_interval=None)
+    outbox.enqueue("email", "someone@example.com", "hello")
+    time.sleep(0.05)
+    assert committed_rows(path) == 0
+    outbox.close()
+    assert committed_rows(path) == 1
+
+
+def test_close_while_enqueueing_returns(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    outbox = Outbox(path, {"email": MessagingAdapter(Email())}, batch_size=10, flush_interval=0.001)
+    stop = threading.Event()
+
+    def produce():
+        while not stop.is_set():
+            try:
+                outbox.enqueue("email", "someone@example.com", "hello")
+            except sqlite3.ProgrammingError:
+                return  # the outbox was closed
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    time.sleep(0.05)
+    closer = threading.Thread(target=outbox.close)
+    closer.start()
+    closer.join(timeout=5)
+    stop.set()
+    producer.join()
+    assert not closer.is_alive()
@@ -0,0 +1,83 @@
+from power_module import (
+    Chinese3PinPlug, ChineseSocket, CompatibilityIndex, ElectricalSpec, EuropeanSocket, Laptop, PowerSocket,
+    TaiwaneseSocket,
+)
+
+
+class KoreanSocket(PowerSocket):
+    "A socket class the index has never seen"
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(2, "ROUND", 220)
+
+
+class SwitchableSocket(PowerSocket):
+    "A socket overriding a getter: its specs can't be read from _spec"
+    __slots__ = ("volt",)
+
+    def __init__(self, volt):
+        super().__init__(3, "FLAT", 220)
+        self.volt = volt
+
+    def get_volt(self):
+        return self.volt
+
+
+def test_charge_indexes_new_socket_type():
+    laptop = Laptop(CompatibilityIndex())
+    assert laptop.charge(KoreanSocket(), 100) is False
+    assert laptop.charge(ChineseSocket(), 100) is True
+
+
+def test_lookup_grows_matrix_for_new_plug_and_socket():
+    index = CompatibilityIndex()
+    assert index.lookup(Laptop().plug, PowerSocket(3, "FLAT", 220)) is True
+    assert index.compatible.shape == (1, 1)
+
+
+def test_bare_power_socket_specs_vary_per_instance():
+    laptop = Laptop(CompatibilityIndex())
+    sockets = [PowerSocket(3, "FLAT", 220), PowerSocket(2, "ROUND", 220), PowerSocket(3, "FLAT", 220)]
+    assert [laptop.charge(socket, 220) for socket in sockets] == [True, False, True]
+    compatible, currents = laptop.charge_batch(sockets, 220)
+    assert compatible.tolist() == [True, False, True]
+    assert currents.tolist() == [1.0, 0.0, 1.0]
+
+
+def test_charge_batch_matches_charge_on_mixed_types():
+    laptop = Laptop(CompatibilityIndex())
+    sockets = [KoreanSocket(), ChineseSocket(), EuropeanSocket(), SwitchableSocket(110), SwitchableSocket(220)]
+    compatible, _ = laptop.charge_batch(sockets, 100)
+    assert compatible.tolist() == [laptop.charge(socket, 100) for socket in sockets]
+    assert compatible.tolist() == [False, True, False, False, True]
+
+
+def test_specs_are_shared_between_index_keys():
+    index = CompatibilityIndex(sockets=[ChineseSocket(), PowerSocket(3, "FLAT", 220)])
+    assert len(index.socket_codes) == 1
+    assert ElectricalSpec.intern(3, "FLAT", 220) is ChineseSocket()._spec
+
+
+class LowVoltagePlug(Chinese3PinPlug):
+    "A plug overriding a property: its specs can't be read from SPEC"
+    __slots__ = ()
+
+    @property
+    def volt(self):
+        return 110
+
+
+def test_plug_overriding_a_property_is_read_per_instance():
+    index = CompatibilityIndex()
+    sockets = [ChineseSocket(), TaiwaneseSocket()]
+    assert [index.lookup(LowVoltagePlug(), socket) for socket in sockets] == [False, False]
+    assert [index.lookup(Chinese3PinPlug(), socket) for socket in sockets] == [True, False]
+
+
+def test_charge_batch_rejects_non_sockets_like_charge():
+    laptop = Laptop(CompatibilityIndex())
+    sockets = [ChineseSocket(), "a wall", EuropeanSocket(), ChineseSocket()]
+    compatible, currents = laptop.charge_batch(sockets, [220, 220, 220, 440])
+    assert compatible.tolist() == [laptop.charge(socket, 220) for socket in sockets]
+    assert currents.tolist() == [1.0, 0.0, 0.0, 2.0]
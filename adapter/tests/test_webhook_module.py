@@ -0,0 +1,87 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from messaging_module import MessagingAdapter
+from webhook_module import HttpPool, Webhook, WebhookError
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    "Local stand-in for the receiving service: records the requests and the connections"
+
+    protocol_version = "HTTP/1.1"  # keep connections alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.payloads.append(payload)
+        if self.path == "/slow":
+            time.sleep(0.5)
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        body = json.dumps({"status": "accepted"}).encode()
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.connections = 0
+    server.payloads = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server, path="/hooks/chat"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_messages_reuse_one_connection(server):
+    pool = HttpPool(size=1)
+    adapter = MessagingAdapter(Webhook(url(server), pool))
+    replies = [adapter.send_message(f"user-{i}", "hi") for i in range(5)]
+    pool.close()
+    assert replies[0] == "Posting Webhook to user-0: hi (accepted)"
+    assert server.payloads[0] == {"recipient": "user-0", "message": "hi"}
+    assert server.connections == 1
+
+
+def test_batch_is_one_request(server):
+    pool = HttpPool(size=1)
+    adapter = MessagingAdapter(Webhook(url(server), pool))
+    replies = adapter.send_batch(["a", "b", "c"], "hi")
+    pool.close()
+    assert len(replies) == 3
+    assert server.payloads == [{"recipients": ["a", "b", "c"], "message": "hi"}]
+
+
+def test_error_status_raises(server):
+    pool = HttpPool(size=1)
+    with pytest.raises(WebhookError):
+        Webhook(url(server, "/missing"), pool).post("someone", "hi")
+    pool.close()
+
+
+def test_slow_server_times_out(server):
+    pool = HttpPool(size=1, timeout=0.1)
+    with pytest.raises((socket.timeout, TimeoutError)):
+        Webhook(url(server, "/slow"), pool).post("someone", "hi")
+    pool.close()
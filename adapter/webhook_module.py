@@ -0,0 +1,75 @@
+import json
+import queue
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import httplib2
+
+from messaging_module import SEND_BATCH, SEND_MESSAGE
+
+
+class WebhookError(Exception):
+    "Raised when the webhook answers with a non 2xx status"
+
+
+class HttpPool:
+    """
+    Pool of keep-alive `httplib2.Http` clients.
+
+    An `Http` object keeps its connections open between requests but must
+    not be used by two threads at once, so each thread checks one out for
+    the duration of a request. `timeout` is the socket timeout in seconds.
+    """
+
+    def __init__(self, size: int = 4, timeout: float = 5.0):
+        self.timeout = timeout
+        self._clients: "queue.LifoQueue[httplib2.Http]" = queue.LifoQueue()
+        for _ in range(size):
+            self._clients.put(httplib2.Http(timeout=timeout))
+
+    @contextmanager
+    def client(self) -> Iterator[httplib2.Http]:
+        http = self._clients.get()
+        try:
+            yield http
+        finally:
+            self._clients.put(http)
+
+    def close(self):
+        while not self._clients.empty():
+            self._clients.get_nowait().close()
+
+
+class Webhook:
+    """
+    HTTP channel: POSTs messages as JSON to `url`. Clients are shared
+    through an HttpPool so consecutive messages reuse open connections
+    instead of paying the TCP (and TLS) setup each time.
+    """
+
+    HEADERS = {"Content-Type": "application/json"}
+
+    def __init__(self, url: str, pool: HttpPool = None):
+        self.url = url
+        self.pool = pool or HttpPool()
+
+    def _post(self, payload) -> dict:
+        with self.pool.client() as http:
+            response, content = http.request(self.url, "POST", body=json.dumps(payload), headers=self.HEADERS)
+        if not 200 <= response.status < 300:
+            raise WebhookError(f"{self.url} answered {response.status} {response.reason}")
+        return json.loads(content)
+
+    def post(self, recipient, message) -> str:
+        reply = self._post({"recipient": recipient, "message": message})
+        return f"Posting Webhook to {recipient}: {message} ({reply['status']})"
+
+    def post_batch(self, recipients: List, message) -> List[str]:
+        "POST one request carrying every recipient"
+        reply = self._post({"recipients": recipients, "message": message})
+        suffix = f": {message} ({reply['status']})"
+        return ["Posting Webhook to " + str(recipient) + suffix for recipient in recipients]
+
+
+SEND_MESSAGE.register(Webhook, lambda service, recipient, message: service.post(recipient, message))
+SEND_BATCH.register(Webhook, lambda service, recipients, message: service.post_batch(recipients, message))
@@ -3,6 +3,8 @@ from typing import Dict, Type
 import time
 from abc import ABCMeta, abstractmethod
 
+from history_module import CommandHistory
+
 class ICommand(metaclass=ABCMeta):
     "The switch interface, that all commands will implement"
 
@@ -47,9 +49,9 @@ You can flick the switch and it then invokes a registered command
 class RemoteControl:
     "The Invoker Class."
 
-    def __init__(self):
+    def __init__(self, history_size: int = 10_000):
         self._commands: Dict[str, Type[ICommand]] = {}
-        self._history: list = []
+        self._history = CommandHistory(history_size)
 
     def show_history(self):
         "Print the history of each time a command was invoked"
@@ -67,17 +69,16 @@ class RemoteControl:
         "Execute any registered commands"
         if command_name in self._commands.keys():
             self._commands[command_name].execute()
-            self._history.append((time.time(), command_name))
+            self._history.append(time.time(), command_name)
         else:
             print(f"Command [{command_name}] not recognised")
 
     def replay_last(self, number_of_commands: int):
         "Replay the last N commands"
-        commands = self._history[-number_of_commands:]
-        for command in commands:
-            self._commands[command[1]].execute()
+        for command_name in self._history.last_names(number_of_commands):
+            self._commands[command_name].execute()
             #or if you want to record these replays in history
-            #self.execute(command[1])
+            #self.execute(command_name)
 
 """
 A Command object, that implements the ISwitch interface and runs the
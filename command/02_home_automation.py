@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
-import datetime
+from datetime import datetime
 import time
 from typing import Dict, Type
 
+from history_module import CommandHistory
+
 # Command interface
 class ICommand(metaclass=ABCMeta):
     @abstractmethod
@@ -34,9 +36,9 @@ class Fan(ISmartDevice):
         print("Fan is OFF")
 
 class RemoteControl:
-    def __init__(self):
+    def __init__(self, history_size: int = 10_000):
         self._commands: Dict[str, Type[ICommand]] = {}
-        self._history = []
+        self._history = CommandHistory(history_size)
 
     def show_history(self):
         "Print the history of each time a command was invoked"
@@ -54,15 +56,14 @@ class RemoteControl:
         "Execute any registered commands"
         if command_name in self._commands.keys():
             self._commands[command_name].execute()
-            self._history.append((time.time(), command_name))
+            self._history.append(time.time(), command_name)
         else:
             print(f"Command [{command_name}] not recognised")
 
     def replay_last(self, number_of_commands: int):
         "Replay the last N commands"
-        commands = self._history[-number_of_commands:]
-        for command in commands:
-            self._commands[command[1]].execute()
+        for command_name in self._history.last_names(number_of_commands):
+            self._commands[command_name].execute()
 
 # Concrete command classes
 class LightOnCommand(ICommand):
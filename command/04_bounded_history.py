@@ -0,0 +1,62 @@
+import sys
+import time
+import tracemalloc
+
+from history_module import CommandHistory
+
+COMMAND_NAMES = ("light_on", "light_off", "fan_on", "fan_off")
+
+
+def fill_list(n):
+    history = []
+    for i in range(n):
+        history.append((time.time(), COMMAND_NAMES[i & 3]))
+    return history
+
+
+def fill_ring(n, capacity):
+    history = CommandHistory(capacity)
+    for i in range(n):
+        history.append(time.time(), COMMAND_NAMES[i & 3])
+    return history
+
+
+def measure(label, fill, n):
+    start = time.perf_counter()
+    history = fill()
+    elapsed = time.perf_counter() - start
+    del history
+
+    tracemalloc.start()
+    history = fill()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<30} {n / elapsed / 1e6:5.2f} M executions/s"
+        f"  memory held: {current / 2**20:8.1f} MiB  rows kept: {len(history):,}"
+    )
+
+
+if __name__ == "__main__":
+    # python 04_bounded_history.py [number_of_executions]
+    N_EXECUTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    CAPACITY = 100_000
+
+    history = CommandHistory(capacity=5)
+    for i, name in enumerate(["light_on", "fan_on", "light_off", "fan_off", "light_on", "fan_on", "light_off"]):
+        history.append(1000.0 + i, name)
+    print(f"Capacity 5 after 7 commands: {list(history)}")
+    print(f"last_names(3): {history.last_names(3)}")
+    print(f"between(1003, 1005): {history.between(1003.0, 1005.0)}")
+
+    print(f"\n{N_EXECUTIONS:,} recorded executions:")
+    measure("Unbounded list of tuples", lambda: fill_list(N_EXECUTIONS), N_EXECUTIONS)
+    measure(f"Ring buffer ({CAPACITY:,} rows)", lambda: fill_ring(N_EXECUTIONS, CAPACITY), N_EXECUTIONS)
+
+    history = fill_ring(N_EXECUTIONS, CAPACITY)
+    start = time.perf_counter()
+    names = history.last_names(1_000)
+    now = time.time()
+    window = history.between(now - 0.01, now + 1)
+    print(f"\nlast_names(1,000) + between(last 10 ms): {(time.perf_counter() - start) * 1000:.2f} ms"
+          f" ({len(names)} and {len(window):,} rows)")
@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import time
+
+from commands_module import Light, Fan, LightOnCommand, LightOffCommand, FanOnCommand, FanOffCommand
+from journal_module import CommandJournal
+from remote_control_module import RemoteControl
+
+COMMAND_NAMES = ("light_on", "light_off", "fan_on", "fan_off")
+
+
+class QuietDevice(Light):
+    "A receiver that does nothing, to journal millions of commands quickly"
+
+    def turn_on(self):
+        pass
+
+    def turn_off(self):
+        pass
+
+
+def text_log_restart(path):
+    "The naive way: parse a text log line by line on startup"
+    with open(path, encoding="utf-8") as log:
+        return [(float(timestamp), name) for timestamp, name in (line.rstrip("\n").split(",") for line in log)]
+
+
+if __name__ == "__main__":
+    # python 05_command_journal.py [number_of_commands]
+    N_COMMANDS = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "remote.journal")
+
+    # A remote control whose history survives restarts
+    journal = CommandJournal(path)
+    remote = RemoteControl(history=journal)
+    light, fan = Light(), Fan()
+    remote.register("light_on", LightOnCommand(light))
+    remote.register("light_off", LightOffCommand(light))
+    remote.register("fan_on", FanOnCommand(fan))
+    remote.register("fan_off", FanOffCommand(fan))
+    remote.execute("light_on")
+    remote.execute("fan_on")
+    journal.close()
+
+    print("\nRestarted, replaying the last 2 commands from the journal:")
+    journal = CommandJournal(path)
+    remote = RemoteControl(history=journal)
+    remote.register("light_on", LightOnCommand(light))
+    remote.register("fan_on", FanOnCommand(fan))
+    remote.replay_last(2)
+    journal.close()
+
+    # Journal millions of commands, and keep a text log of the same rows
+    quiet = QuietDevice()
+    journal = CommandJournal(path, group_size=4096)
+    remote = RemoteControl(history=journal)
+    for name, command in zip(COMMAND_NAMES, (LightOnCommand, LightOffCommand, LightOnCommand, LightOffCommand)):
+        remote.register(name, command(quiet))
+    start = time.perf_counter()
+    for i in range(N_COMMANDS):
+        remote.execute(COMMAND_NAMES[i & 3])
+    journal.close()
+    elapsed = time.perf_counter() - start
+    print(f"\nJournaled {N_COMMANDS:,} executions in {elapsed:.2f} s ({N_COMMANDS / elapsed:,.0f}/s),"
+          f" {os.path.getsize(path) / 2**20:.1f} MiB")
+
+    text_path = os.path.join(directory, "remote.log")
+    with open(text_path, "w", encoding="utf-8") as log:
+        for timestamp, name in CommandJournal(path):
+            log.write(f"{timestamp!r},{name}\n")
+
+    start = time.perf_counter()
+    rows = text_log_restart(text_path)
+    print(f"Restart from a text log:    {(time.perf_counter() - start) * 1000:8.1f} ms ({len(rows):,} rows parsed)")
+    del rows
+
+    start = time.perf_counter()
+    journal = CommandJournal(path)
+    last = journal.last_names(1_000)
+    print(f"Restart from the journal:   {(time.perf_counter() - start) * 1000:8.1f} ms"
+          f" ({len(journal):,} rows, last 1,000 names ready)")
+
+    start = time.perf_counter()
+    tail = sum(1 for _ in journal.replay(start=len(journal) - 100_000))
+    print(f"Replay 100,000 rows from an offset: {(time.perf_counter() - start) * 1000:.1f} ms ({tail:,} rows)")
+    journal.close()
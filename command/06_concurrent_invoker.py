@@ -0,0 +1,61 @@
+import time
+from typing import List
+
+from commands_module import ISmartDevice, LightOnCommand, LightOffCommand
+from concurrent_remote_control_module import ConcurrentRemoteControl
+
+
+class SlowDevice(ISmartDevice):
+    "A network device that takes `latency` seconds per call and logs what it did"
+
+    def __init__(self, name: str, latency: float = 0.01):
+        self.name = name
+        self.latency = latency
+        self.log: List[str] = []
+
+    def turn_on(self):
+        time.sleep(self.latency)
+        self.log.append("on")
+
+    def turn_off(self):
+        time.sleep(self.latency)
+        self.log.append("off")
+
+
+def run(workers: int, n_devices: int, commands_per_device: int):
+    remote = ConcurrentRemoteControl(workers=workers)
+    devices = [SlowDevice(f"device-{i}") for i in range(n_devices)]
+    for device in devices:
+        remote.register(f"{device.name}_on", LightOnCommand(device))
+        remote.register(f"{device.name}_off", LightOffCommand(device))
+
+    expected = {device.name: [] for device in devices}
+    start = time.perf_counter()
+    futures = []
+    for step in range(commands_per_device):
+        for device in devices:
+            state = "on" if step % 2 == 0 else "off"
+            futures.append(remote.submit(f"{device.name}_{state}"))
+            expected[device.name].append(state)
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - start
+    remote.shutdown()
+
+    in_order = all(device.log == expected[device.name] for device in devices)
+    latency = remote.metrics.latency_percentiles()
+    print(
+        f"{workers:>3} workers: {len(futures) / elapsed:7.0f} commands/s"
+        f"  max queue depth {remote.metrics.max_queue_depth:>4}"
+        f"  p50 latency {latency['p50'] * 1000:6.1f} ms"
+        f"  per-device order kept: {in_order}"
+    )
+
+
+if __name__ == "__main__":
+    N_DEVICES = 32
+    COMMANDS_PER_DEVICE = 10
+
+    print(f"{N_DEVICES} devices with 10 ms calls, {COMMANDS_PER_DEVICE} commands each:")
+    for workers in (1, 2, 4, 8, 16, 32):
+        run(workers, N_DEVICES, COMMANDS_PER_DEVICE)
@@ -0,0 +1,59 @@
+import asyncio
+import random
+import time
+
+from async_remote_control_module import (
+    AsyncRemoteControl,
+    AsyncTurnOffCommand,
+    AsyncTurnOnCommand,
+    IAsyncSmartDevice,
+)
+from commands_module import Light, LightOnCommand
+
+
+class NetworkLight(IAsyncSmartDevice):
+    "A light reached over the network: every call takes a round trip"
+
+    def __init__(self, name: str, latency: float = 0.05):
+        self.name = name
+        self.latency = latency
+        self.is_on = False
+
+    async def turn_on(self):
+        await asyncio.sleep(self.latency)
+        self.is_on = True
+
+    async def turn_off(self):
+        await asyncio.sleep(self.latency)
+        self.is_on = False
+
+
+async def main():
+    N_LIGHTS = 5_000
+
+    remote = AsyncRemoteControl(timeout=0.5)
+    rng = random.Random(3)
+    lights = [NetworkLight(f"light-{i}", latency=rng.uniform(0.02, 0.2)) for i in range(N_LIGHTS)]
+    lights[0].latency = 2.0  # an unreachable bulb
+    for light in lights:
+        remote.register(f"{light.name}_on", AsyncTurnOnCommand(light))
+        remote.register(f"{light.name}_off", AsyncTurnOffCommand(light))
+
+    start = time.perf_counter()
+    results = await remote.execute_many(f"{light.name}_on" for light in lights)
+    elapsed = time.perf_counter() - start
+    timeouts = sum(isinstance(result, asyncio.TimeoutError) for result in results)
+    print(
+        f"Turned on {sum(light.is_on for light in lights):,} of {N_LIGHTS:,} network lights in {elapsed:.2f} s"
+        f" on one event loop ({timeouts} timed out after 0.5 s)"
+    )
+    serial = sum(min(light.latency, 0.5) for light in lights)
+    print(f"One after the other, the same calls would take about {serial:.0f} s")
+
+    # A blocking command keeps working through the SyncCommandAdapter
+    remote.register("hall_light_on", LightOnCommand(Light()))
+    await remote.execute("hall_light_on")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
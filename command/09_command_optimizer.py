@@ -0,0 +1,95 @@
+import random
+import time
+
+from commands_module import ICommand, ISmartDevice, Light, LightOnCommand, LightOffCommand
+from remote_control_module import RemoteControl
+
+
+class CountingLight(ISmartDevice):
+    "A light that records its state and how many calls it received"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.is_on = False
+        self.calls = 0
+
+    def turn_on(self):
+        self.calls += 1
+        self.is_on = True
+
+    def turn_off(self):
+        self.calls += 1
+        self.is_on = False
+
+    def toggle(self):
+        self.calls += 1
+        self.is_on = not self.is_on
+
+
+class LightToggleCommand(ICommand):
+    "The result depends on the previous state: not idempotent"
+
+    def __init__(self, light: CountingLight):
+        self.light = light
+
+    @property
+    def receiver(self):
+        return self.light
+
+    def execute(self):
+        self.light.toggle()
+
+
+class LightStatusCommand(ICommand):
+    "Reads the state: not commutative, the commands before it must have run"
+
+    def __init__(self, light: CountingLight):
+        self.light = light
+
+    @property
+    def receiver(self):
+        return self.light
+
+    def execute(self):
+        return self.light.is_on
+
+
+def scripted_run(optimize: bool, n_lights: int, n_commands: int, seed: int = 7):
+    remote = RemoteControl(history_size=n_commands)
+    lights = [CountingLight(f"light-{i}") for i in range(n_lights)]
+    for light in lights:
+        remote.register(f"{light.name}_on", LightOnCommand(light))
+        remote.register(f"{light.name}_off", LightOffCommand(light))
+        remote.register(f"{light.name}_toggle", LightToggleCommand(light))
+        remote.register(f"{light.name}_status", LightStatusCommand(light))
+
+    rng = random.Random(seed)
+    actions = ["on"] * 45 + ["off"] * 45 + ["status"] * 8 + ["toggle"] * 2
+    script = [f"{rng.choice(lights).name}_{rng.choice(actions)}" for _ in range(n_commands)]
+
+    start = time.perf_counter()
+    report = remote.execute_batch(script, optimize=optimize)
+    elapsed = time.perf_counter() - start
+    return report, elapsed, [light.is_on for light in lights], sum(light.calls for light in lights)
+
+
+if __name__ == "__main__":
+    remote = RemoteControl()
+    light = Light()
+    remote.register("light_on", LightOnCommand(light))
+    remote.register("light_off", LightOffCommand(light))
+    print("light_on, light_off, light_on, light_off, light_on with the optimizer:")
+    report = remote.execute_batch(["light_on", "light_off", "light_on", "light_off", "light_on"], optimize=True)
+    print(f"{report.executed} of {report.submitted} commands executed, {report.saved} device calls saved")
+
+    N_LIGHTS = 200
+    N_COMMANDS = 1_000_000
+    print(f"\nA script of {N_COMMANDS:,} commands on {N_LIGHTS} lights (2% toggles, 8% status reads):")
+    plain, plain_time, plain_states, plain_calls = scripted_run(False, N_LIGHTS, N_COMMANDS)
+    optimized, optimized_time, optimized_states, optimized_calls = scripted_run(True, N_LIGHTS, N_COMMANDS)
+    print(f"  as written: {plain_calls:>9,} device calls in {plain_time:.2f} s")
+    print(
+        f"  optimized:  {optimized_calls:>9,} device calls in {optimized_time:.2f} s"
+        f"  ({optimized.saved:,} saved)"
+    )
+    print(f"  same final state for every light: {plain_states == optimized_states}")
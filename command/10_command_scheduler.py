@@ -0,0 +1,78 @@
+import random
+import time
+from statistics import quantiles
+from typing import List
+
+from commands_module import ICommand, Fan, FanOffCommand, Light, LightOnCommand
+from remote_control_module import RemoteControl
+from scheduler_module import CommandScheduler
+
+
+class ProbeCommand(ICommand):
+    "Records how late it ran compared to the time it was scheduled for"
+
+    def __init__(self, due: float, lateness: List[float]):
+        self.due = due
+        self.lateness = lateness
+
+    def execute(self):
+        self.lateness.append(time.monotonic() - self.due)
+
+
+class SilentCommand(ICommand):
+    def execute(self):
+        pass
+
+
+if __name__ == "__main__":
+    N_TIMERS = 100_000
+    N_PROBES = 2_000
+    TICK = 0.01
+
+    remote = RemoteControl()
+    remote.register("fan_off", FanOffCommand(Fan()))
+    remote.register("light_on", LightOnCommand(Light()))
+    remote.register("silent", SilentCommand())
+    scheduler = CommandScheduler(remote, tick=TICK)
+
+    # "fan_off in 30 min" and "light_on daily at 18:00"
+    scheduler.call_later(30 * 60, "fan_off")
+    scheduler.daily(18, 0, "light_on")
+
+    # Background load: timers from one second to a month away, over every level of the wheel
+    rng = random.Random(18)
+    delays = [rng.uniform(1, 30 * 86_400) for _ in range(N_TIMERS)]
+    start = time.perf_counter()
+    timers = [scheduler.call_later(delay, "silent") for delay in delays]
+    elapsed = time.perf_counter() - start
+    print(f"Scheduled {N_TIMERS:,} timers: {elapsed / N_TIMERS * 1e6:.2f} µs each")
+
+    start = time.perf_counter()
+    for timer in timers[::2]:
+        scheduler.cancel(timer)
+    elapsed = time.perf_counter() - start
+    print(f"Cancelled {N_TIMERS // 2:,} of them: {elapsed / (N_TIMERS // 2) * 1e6:.2f} µs each")
+    for delay in delays[::2]:
+        scheduler.call_later(delay, "silent")
+    print(f"{len(scheduler):,} timers pending")
+
+    # Accuracy: probes due within the next two seconds, on top of the pending timers
+    lateness: List[float] = []
+    for i in range(N_PROBES):
+        delay = rng.uniform(0.05, 2.0)
+        remote.register(f"probe_{i}", ProbeCommand(time.monotonic() + delay, lateness))
+        scheduler.call_later(delay, f"probe_{i}")
+    recurring = scheduler.call_every(0.25, "silent")
+
+    scheduler.start()
+    time.sleep(2.2)
+    scheduler.stop()
+    scheduler.cancel(recurring)
+
+    cuts = quantiles(lateness, n=100)
+    print(
+        f"{len(lateness):,} of {N_PROBES:,} probes ran with {TICK * 1000:.0f} ms ticks, lateness:"
+        f" p50 {cuts[49] * 1000:.1f} ms, p99 {cuts[98] * 1000:.1f} ms, max {max(lateness) * 1000:.1f} ms,"
+        f" early: {sum(late < 0 for late in lateness)}"
+    )
+    print(f"{scheduler.executed:,} commands run, {len(scheduler):,} timers still pending")
@@ -0,0 +1,64 @@
+import time
+
+from commands_module import ISmartDevice, LightOffCommand
+from device_group_module import DeviceGroup, GroupOffCommand, GroupOnCommand, GroupQueryCommand, GroupToggleCommand
+from remote_control_module import RemoteControl
+
+
+class BuildingLight(ISmartDevice):
+    "One light of the building as its own receiver object"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.is_on = True
+
+    def turn_on(self):
+        self.is_on = True
+
+    def turn_off(self):
+        self.is_on = False
+
+
+def light_names(floors: int, rooms: int, lights: int):
+    return [
+        f"floor-{floor}/room-{room}/light-{light}"
+        for floor in range(floors) for room in range(rooms) for light in range(lights)
+    ]
+
+
+if __name__ == "__main__":
+    names = light_names(floors=40, rooms=50, lights=50)
+    print(f"A building with {len(names):,} lights")
+
+    # One receiver and one command per light
+    remote = RemoteControl()
+    lights = [BuildingLight(name) for name in names]
+    commands = [f"{light.name}_off" for light in lights]
+    for command_name, light in zip(commands, lights):
+        remote.register(command_name, LightOffCommand(light))
+    start = time.perf_counter()
+    for command_name in commands:
+        remote.execute(command_name)
+    per_device = time.perf_counter() - start
+    print(f"  one command per light:  {per_device * 1000:8.1f} ms to turn the building off")
+
+    # One group receiver, the commands act on all of it or on a mask
+    group = DeviceGroup(names)
+    remote = RemoteControl()
+    remote.register("building_on", GroupOnCommand(group))
+    remote.register("building_off", GroupOffCommand(group))
+    remote.register("floor_3_toggle", GroupToggleCommand(group, group.select("floor-3/")))
+    remote.register("lights_on", GroupQueryCommand(group, state=True))
+
+    remote.execute("building_on")
+    start = time.perf_counter()
+    remote.execute("building_off")
+    grouped = time.perf_counter() - start
+    print(f"  one group command:      {grouped * 1000:8.3f} ms ({per_device / grouped:,.0f}x faster)")
+
+    start = time.perf_counter()
+    remote.execute("floor_3_toggle")
+    on = remote.execute("lights_on")
+    elapsed = time.perf_counter() - start
+    print(f"  toggle floor 3 and list the lights on: {elapsed * 1000:.2f} ms, {len(on):,} lights on")
+    print(f"  {on[0]} is on: {group.is_on(on[0])}, {group.count(state=False):,} lights off")
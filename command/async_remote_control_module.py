@@ -0,0 +1,92 @@
+import asyncio
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Iterable, List
+
+from commands_module import ICommand
+from history_module import CommandHistory
+
+
+class IAsyncCommand(metaclass=ABCMeta):
+    @abstractmethod
+    async def execute(self):
+        pass
+
+
+class IAsyncSmartDevice(metaclass=ABCMeta):
+    @abstractmethod
+    async def turn_on(self):
+        pass
+
+    @abstractmethod
+    async def turn_off(self):
+        pass
+
+
+class AsyncTurnOnCommand(IAsyncCommand):
+    def __init__(self, device: IAsyncSmartDevice):
+        self.device = device
+
+    async def execute(self):
+        await self.device.turn_on()
+
+
+class AsyncTurnOffCommand(IAsyncCommand):
+    def __init__(self, device: IAsyncSmartDevice):
+        self.device = device
+
+    async def execute(self):
+        await self.device.turn_off()
+
+
+class SyncCommandAdapter(IAsyncCommand):
+    "Adapts a blocking ICommand to IAsyncCommand by running it in the default executor"
+
+    def __init__(self, command: ICommand):
+        self.command = command
+
+    async def execute(self):
+        return await asyncio.to_thread(self.command.execute)
+
+
+class AsyncRemoteControl:
+    """
+    Invoker running commands on one event loop. Any number of commands can
+    be in flight at once; each one is bounded by a timeout (in seconds).
+    Synchronous ICommand objects are wrapped in a SyncCommandAdapter.
+    """
+
+    def __init__(self, timeout: float = None, history_size: int = 10_000):
+        self._commands: Dict[str, IAsyncCommand] = {}
+        self._history = CommandHistory(history_size)
+        self.timeout = timeout
+
+    def register(self, command_name: str, command):
+        "Register commands in the Invoker"
+        if isinstance(command, ICommand):
+            command = SyncCommandAdapter(command)
+        self._commands[command_name] = command
+
+    async def execute(self, command_name: str, timeout: float = None):
+        "Execute a registered command, raising asyncio.TimeoutError if it takes too long"
+        if command_name not in self._commands:
+            raise KeyError(f"Command [{command_name}] not recognised")
+        timeout = self.timeout if timeout is None else timeout
+        result = await asyncio.wait_for(self._commands[command_name].execute(), timeout)
+        self._history.append(time.time(), command_name)
+        return result
+
+    async def execute_many(self, command_names: Iterable[str], timeout: float = None) -> List:
+        """
+        Run many commands concurrently. Returns one entry per command: its
+        result, or the exception it raised (e.g. asyncio.TimeoutError).
+        """
+        return await asyncio.gather(
+            *(self.execute(command_name, timeout) for command_name in command_names),
+            return_exceptions=True,
+        )
+
+    async def replay_last(self, number_of_commands: int):
+        "Replay the last N commands, one after the other"
+        for command_name in self._history.last_names(number_of_commands):
+            await self._commands[command_name].execute()
@@ -1,11 +1,26 @@
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 
 # Command interface
 class ICommand(metaclass=ABCMeta):
+    # An idempotent command sets the state of its receiver whatever the
+    # previous state was, so only the last one of a run matters. A
+    # commutative command neither changes nor reads the state of its
+    # receiver, so it can run before or after any other command on the
+    # same receiver with the same outcome. A status read is not
+    # commutative: what it returns depends on the commands before it.
+    idempotent = False
+    commutative = False
+
     @abstractmethod
     def execute(self):
         pass
 
+    @property
+    def receiver(self):
+        "The device the command acts on, None if it does not act on one"
+        return None
+
 class ISmartDevice(metaclass=ABCMeta):
     @abstractmethod
     def turn_on(self):
@@ -30,31 +45,60 @@ class Fan(ISmartDevice):
     def turn_off(self):
         print("Fan is OFF")
 
+@lru_cache(maxsize=None)
+def default_receiver(device_class):
+    "Receiver shared by the commands created without one, built on first use"
+    return device_class()
+
 # Concrete command classes
 class LightOnCommand(ICommand):
-    def __init__(self, light: Light = Light()):
-        self.light = light
+    idempotent = True
+
+    def __init__(self, light: Light = None):
+        self.light = default_receiver(Light) if light is None else light
+
+    @property
+    def receiver(self):
+        return self.light
 
     def execute(self):
         self.light.turn_on()
 
 class LightOffCommand(ICommand):
-    def __init__(self, light: Light = Light()):
-        self.light = light
+    idempotent = True
+
+    def __init__(self, light: Light = None):
+        self.light = default_receiver(Light) if light is None else light
+
+    @property
+    def receiver(self):
+        return self.light
 
     def execute(self):
         self.light.turn_off()
 
 class FanOnCommand(ICommand):
-    def __init__(self, fan: Fan = Fan()):
-        self.fan = fan
+    idempotent = True
+
+    def __init__(self, fan: Fan = None):
+        self.fan = default_receiver(Fan) if fan is None else fan
+
+    @property
+    def receiver(self):
+        return self.fan
 
     def execute(self):
         self.fan.turn_on()
 
 class FanOffCommand(ICommand):
-    def __init__(self, fan: Fan = Fan()):
-        self.fan = fan
+    idempotent = True
+
+    def __init__(self, fan: Fan = None):
+        self.fan = default_receiver(Fan) if fan is None else fan
+
+    @property
+    def receiver(self):
+        return self.fan
 
     def execute(self):
         self.fan.turn_off()
\ No newline at end of file
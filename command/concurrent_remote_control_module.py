@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from statistics import quantiles
+from typing import Deque, Dict, Tuple
+
+from commands_module import ICommand
+from remote_control_module import RemoteControl
+
+
+@dataclass
+class InvokerMetrics:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_depth: int = 0    # submitted commands that have not started yet
+    max_queue_depth: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=10_000))  # submit to done, seconds
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        if len(self.latencies) < 2:
+            return {}
+        cuts = quantiles(self.latencies, n=100)
+        return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98], "max": max(self.latencies)}
+
+
+class ConcurrentRemoteControl(RemoteControl):
+    """
+    Invoker that runs commands on a pool of `workers` threads.
+
+    Commands acting on the same receiver (see ICommand.receiver) run one at
+    a time in submission order: each busy receiver has a queue of pending
+    commands that a single worker drains. Commands on different receivers
+    run in parallel. `submit()` returns a Future with the command result.
+    After `shutdown()` the commands already submitted still run, and
+    `submit()` raises a RuntimeError.
+    """
+
+    def __init__(self, workers: int = 8, history_size: int = 10_000, history=None):
+        super().__init__(history_size, history)
+        self.metrics = InvokerMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._shut_down = False
+        # id(receiver) -> commands waiting behind the one that is running
+        self._lanes: Dict[int, Deque[Tuple[str, ICommand, Future, float]]] = {}
+
+    def submit(self, command_name: str) -> Future:
+        command = self._command(command_name)
+        if command is None:
+            raise KeyError(f"Command [{command_name}] not recognised")
+        task = (command_name, command, Future(), time.perf_counter())
+        receiver = command.receiver
+        with self._lock:
+            # Checked under the lock so no lane is opened once shutdown() started
+            if self._shut_down:
+                raise RuntimeError("Invoker is shut down")
+            self.metrics.submitted += 1
+            self.metrics.queue_depth += 1
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+            if receiver is None:
+                self._executor.submit(self._run, task)
+            elif id(receiver) in self._lanes:
+                self._lanes[id(receiver)].append(task)
+            else:
+                self._lanes[id(receiver)] = deque()
+                self._executor.submit(self._drain, id(receiver), task)
+        return task[2]
+
+    def _run(self, task):
+        command_name, command, future, submitted_at = task
+        with self._lock:
+            self.metrics.queue_depth -= 1
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = command.execute()
+        except BaseException as error:
+            with self._lock:
+                self.metrics.failed += 1
+            future.set_exception(error)
+        else:
+            with self._lock:
+                self.metrics.completed += 1
+                self.metrics.latencies.append(time.perf_counter() - submitted_at)
+                self._history.append(time.time(), command_name)
+            future.set_result(result)
+
+    def _drain(self, lane: int, task):
+        "Run the commands of one receiver until its lane is empty"
+        while True:
+            self._run(task)
+            with self._lock:
+                pending = self._lanes[lane]
+                if not pending:
+                    del self._lanes[lane]
+                    return
+                task = pending.popleft()
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            self._shut_down = True
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,113 @@
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from commands_module import ICommand, ISmartDevice
+
+
+class DeviceGroup(ISmartDevice):
+    """
+    On/off state of many devices kept in one NumPy boolean array.
+
+    A group operation (everything on, toggle a selection, find what is on)
+    is a single vectorized operation instead of a method call per device.
+    Selections are boolean masks, built with `mask()` from device names or
+    with `select()` from a name prefix.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self.names = np.array(names)
+        self._positions = {name: position for position, name in enumerate(names)}
+        if len(self._positions) != len(names):
+            raise ValueError("device names must be unique")
+        self.state = np.zeros(len(names), dtype=bool)
+
+    def __len__(self):
+        return len(self.state)
+
+    def mask(self, names: Iterable[str]) -> np.ndarray:
+        "Mask selecting the named devices; raises KeyError on an unknown name"
+        selected = np.zeros(len(self.state), dtype=bool)
+        selected[[self._positions[name] for name in names]] = True
+        return selected
+
+    def select(self, prefix: str) -> np.ndarray:
+        "Mask selecting the devices whose name starts with `prefix`, e.g. 'floor-3/'"
+        return np.char.startswith(self.names, prefix)
+
+    def turn_on(self, mask: Optional[np.ndarray] = None):
+        if mask is None:
+            self.state[:] = True
+        else:
+            self.state |= mask
+
+    def turn_off(self, mask: Optional[np.ndarray] = None):
+        if mask is None:
+            self.state[:] = False
+        else:
+            self.state &= ~mask
+
+    def toggle(self, mask: Optional[np.ndarray] = None):
+        if mask is None:
+            np.logical_not(self.state, out=self.state)
+        else:
+            self.state ^= mask
+
+    def is_on(self, name: str) -> bool:
+        return bool(self.state[self._positions[name]])
+
+    def count(self, state: bool = True) -> int:
+        on = int(np.count_nonzero(self.state))
+        return on if state else len(self.state) - on
+
+    def where(self, state: bool = True, mask: Optional[np.ndarray] = None) -> List[str]:
+        "Names of the devices (among `mask`) that are on, or off with state=False"
+        matches = self.state if state else ~self.state
+        if mask is not None:
+            matches = matches & mask
+        return self.names[matches].tolist()
+
+
+class GroupCommand(ICommand):
+    "Base of the commands acting on a whole DeviceGroup, or the devices of `mask`"
+
+    def __init__(self, group: DeviceGroup, mask: Optional[np.ndarray] = None):
+        self.group = group
+        self.mask = mask
+
+    @property
+    def receiver(self):
+        return self.group
+
+
+class GroupSwitchCommand(GroupCommand):
+    @property
+    def idempotent(self):
+        "Only a command on the whole group sets all of its state"
+        return self.mask is None
+
+
+class GroupOnCommand(GroupSwitchCommand):
+    def execute(self):
+        self.group.turn_on(self.mask)
+
+
+class GroupOffCommand(GroupSwitchCommand):
+    def execute(self):
+        self.group.turn_off(self.mask)
+
+
+class GroupToggleCommand(GroupCommand):
+    def execute(self):
+        self.group.toggle(self.mask)
+
+
+class GroupQueryCommand(GroupCommand):
+    "Returns the names of the devices (among `mask`) in the given state: a read, so not commutative"
+
+    def __init__(self, group: DeviceGroup, mask: Optional[np.ndarray] = None, state: bool = True):
+        super().__init__(group, mask)
+        self.state = state
+
+    def execute(self):
+        return self.group.where(self.state, self.mask)
@@ -0,0 +1,97 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Tuple
+
+Row = Tuple[float, str]
+
+
+class CommandHistory:
+    """
+    Fixed-capacity ring buffer of (timestamp, command_name) rows.
+
+    Timestamps are stored in an `array('d')` and command names as interned
+    integer ids in an `array('I')`, so each row costs 12 bytes whatever the
+    length of the name. Appending is O(1); once `capacity` rows are stored
+    the oldest row is overwritten. Rows are expected in timestamp order,
+    which lets `between()` binary search them.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._name_ids = array("I", [0]) * capacity
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._next = 0   # slot written by the next append
+        self._size = 0
+
+    def append(self, timestamp: float, command_name: str):
+        try:
+            name_id = self._ids[command_name]
+        except KeyError:
+            name_id = self._ids[command_name] = len(self._names)
+            self._names.append(command_name)
+        slot = self._next
+        self._timestamps[slot] = timestamp
+        self._name_ids[slot] = name_id
+        slot += 1
+        self._next = 0 if slot == self.capacity else slot
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _slot(self, index: int) -> int:
+        "Ring slot of the `index`-th oldest row"
+        return (self._next - self._size + index) % self.capacity
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index: int) -> Row:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        slot = self._slot(index)
+        return self._timestamps[slot], self._names[self._name_ids[slot]]
+
+    def __iter__(self) -> Iterator[Row]:
+        return self._rows(0, self._size)
+
+    def _rows(self, start: int, stop: int) -> Iterator[Row]:
+        timestamps, name_ids, names, capacity = self._timestamps, self._name_ids, self._names, self.capacity
+        first = self._slot(0)
+        for index in range(start, stop):
+            slot = (first + index) % capacity
+            yield timestamps[slot], names[name_ids[slot]]
+
+    def last(self, number_of_commands: int) -> List[Row]:
+        "The last N rows, oldest first"
+        number_of_commands = max(0, min(number_of_commands, self._size))
+        return list(self._rows(self._size - number_of_commands, self._size))
+
+    def last_names(self, number_of_commands: int) -> List[str]:
+        "The command names of the last N rows, oldest first"
+        return [name for _, name in self.last(number_of_commands)]
+
+    def between(self, start: float, end: float) -> List[Row]:
+        "Rows with start <= timestamp < end"
+        timestamps = _TimestampView(self)
+        return list(self._rows(bisect_left(timestamps, start), bisect_left(timestamps, end)))
+
+    def clear(self):
+        self._next = self._size = 0
+
+
+class _TimestampView:
+    "Read-only sequence of the timestamps in chronological order, for bisect"
+
+    def __init__(self, history: CommandHistory):
+        self._history = history
+
+    def __len__(self):
+        return len(self._history)
+
+    def __getitem__(self, index: int) -> float:
+        return self._history._timestamps[self._history._slot(index)]
@@ -0,0 +1,196 @@
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Tuple
+
+Row = Tuple[float, str]
+
+HEADER = struct.Struct("<8sII")  # magic, format version, record size
+MAGIC = b"CMDJRNL1"
+RECORD = struct.Struct("<dI")    # timestamp, command name id: 12 bytes
+
+
+class CommandJournal:
+    """
+    Binary append-only journal of (timestamp, command_name) rows on disk.
+
+    Every row is a fixed-size 12-byte record, command names are interned
+    into ids kept in a sidecar `<path>.names` file. Appends are group
+    committed: records are buffered and written with a single write and
+    fsync every `group_size` records, after `max_delay` seconds, or on
+    `commit()`. A background thread commits the records left buffered for
+    `max_delay` seconds, so a journal that goes quiet is still synced (no
+    thread and no timed commit with `max_delay=None`). Reads go through an
+    `mmap` of the file and unpack records straight from it, so opening a
+    journal with millions of rows only maps the file and replay can start
+    at any record. The sidecar holds one name per line, so a command name
+    can't contain a newline.
+
+    It has the same interface as CommandHistory and can replace it as the
+    history of a RemoteControl.
+    """
+
+    def __init__(self, path: str, group_size: int = 256, max_delay: float = 0.05):
+        self.path = path
+        self.group_size = group_size
+        self.max_delay = max_delay
+        self._names_path = path + ".names"
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._last_commit = time.monotonic()
+        self._map = None
+        self._map_size = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        if os.path.exists(self._names_path):
+            with open(self._names_path, "r+b") as names:
+                data = names.read()
+                complete = data.rfind(b"\n") + 1
+                if complete != len(data):
+                    # Drop a name torn by a crash: it is synced before any record refers to it
+                    names.truncate(complete)
+            for name in data[:complete].decode("utf-8").split("\n")[:-1]:
+                self._ids[name] = len(self._names)
+                self._names.append(name)
+        self._names_file = open(self._names_path, "a", encoding="utf-8")
+
+        new = not os.path.exists(path) or os.path.getsize(path) < HEADER.size
+        self._file = open(path, "w+b" if new else "r+b")
+        if new:
+            self._file.write(HEADER.pack(MAGIC, 1, RECORD.size))
+            self._sync()
+        else:
+            magic, _, record_size = HEADER.unpack(self._file.read(HEADER.size))
+            if magic != MAGIC or record_size != RECORD.size:
+                raise ValueError(f"{path} is not a command journal")
+            # Drop a record torn by a crash in the middle of a write
+            size = os.path.getsize(path)
+            complete = HEADER.size + (size - HEADER.size) // RECORD.size * RECORD.size
+            if complete != size:
+                self._file.truncate(complete)
+        self._file.seek(0, os.SEEK_END)
+        self._committed = (self._file.tell() - HEADER.size) // RECORD.size
+        self._flusher = None
+        if max_delay is not None:
+            self._flusher = threading.Thread(target=self._commit_periodically, name="journal-flusher", daemon=True)
+            self._flusher.start()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def append(self, timestamp: float, command_name: str):
+        with self._lock:
+            try:
+                name_id = self._ids[command_name]
+            except KeyError:
+                if "\n" in command_name:
+                    raise ValueError(f"Command name {command_name!r} contains a newline") from None
+                # A name must be on disk before any record refers to it
+                name_id = self._ids[command_name] = len(self._names)
+                self._names.append(command_name)
+                self._names_file.write(command_name + "\n")
+                self._names_file.flush()
+                os.fsync(self._names_file.fileno())
+            self._pending += RECORD.pack(timestamp, name_id)
+            self._pending_count += 1
+            if self._pending_count >= self.group_size or (
+                self.max_delay is not None and time.monotonic() - self._last_commit >= self.max_delay
+            ):
+                self._commit()
+
+    def commit(self):
+        "Write and fsync the buffered records"
+        with self._lock:
+            self._commit()
+
+    def _commit_periodically(self):
+        while not self._closed.wait(self.max_delay):
+            with self._lock:
+                if self._pending and time.monotonic() - self._last_commit >= self.max_delay:
+                    self._commit()
+
+    def _commit(self):
+        if self._pending:
+            self._file.write(self._pending)
+            self._sync()
+            self._committed += self._pending_count
+            self._pending.clear()
+            self._pending_count = 0
+        self._last_commit = time.monotonic()
+
+    def _records(self) -> memoryview:
+        "Zero-copy view of every committed record"
+        self.commit()
+        size = HEADER.size + self._committed * RECORD.size
+        if size != self._map_size:
+            # Older maps stay alive as long as a reader still uses them
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+            self._map_size = size
+        return memoryview(self._map)[HEADER.size:]
+
+    def __len__(self):
+        return self._committed + self._pending_count
+
+    def __getitem__(self, index: int) -> Row:
+        records = self._records()
+        if index < 0:
+            index += self._committed
+        if not 0 <= index < self._committed:
+            raise IndexError("journal index out of range")
+        timestamp, name_id = RECORD.unpack_from(records, index * RECORD.size)
+        return timestamp, self._names[name_id]
+
+    def replay(self, start: int = 0, stop: int = None) -> Iterator[Row]:
+        "Rows from record `start` (included) to `stop` (excluded), read from the mapped file"
+        records = self._records()
+        stop = self._committed if stop is None else min(stop, self._committed)
+        names = self._names
+        view = records[start * RECORD.size:max(start, stop) * RECORD.size]
+        for timestamp, name_id in RECORD.iter_unpack(view):
+            yield timestamp, names[name_id]
+
+    def __iter__(self) -> Iterator[Row]:
+        return self.replay()
+
+    def last(self, number_of_commands: int) -> List[Row]:
+        "The last N rows, oldest first"
+        self.commit()
+        return list(self.replay(max(0, self._committed - number_of_commands)))
+
+    def last_names(self, number_of_commands: int) -> List[str]:
+        return [name for _, name in self.last(number_of_commands)]
+
+    def between(self, start: float, end: float) -> List[Row]:
+        "Rows with start <= timestamp < end"
+        timestamps = _TimestampView(self._records(), self._committed)
+        return list(self.replay(bisect_left(timestamps, start), bisect_left(timestamps, end)))
+
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.commit()
+        self._map = None
+        self._file.close()
+        self._names_file.close()
+
+
+class _TimestampView:
+    "Read-only sequence of the journaled timestamps, for bisect"
+
+    def __init__(self, records: memoryview, count: int):
+        self._records = records
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        return RECORD.unpack_from(self._records, index * RECORD.size)[0]
@@ -0,0 +1,164 @@
+import json
+from array import array
+from typing import Dict
+
+SUB_BUCKET_BITS = 5  # one bucket per value below 32, then 16 sub-buckets per power of two: within 1/16
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations in nanoseconds.
+
+    Values below 32 ns get a bucket each; above, every power of two is cut
+    into 16 buckets, so any value up to 2**64 ns is counted with a relative
+    error under 6.25%. The counts live in a preallocated `array('Q')` and
+    recording a value is a few integer operations.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    _SIZE = (1 << SUB_BUCKET_BITS) + (64 - SUB_BUCKET_BITS) * (1 << (SUB_BUCKET_BITS - 1))
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * self._SIZE))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        # Above 32 ns: 16 buckets per power of two, the 5 top bits of the value pick one
+        return value if shift <= 0 else (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        "Largest value counted in bucket `index`"
+        if index < 1 << SUB_BUCKET_BITS:
+            return index
+        shift, offset = divmod(index - (1 << SUB_BUCKET_BITS), 1 << (SUB_BUCKET_BITS - 1))
+        shift += 1
+        return (((1 << (SUB_BUCKET_BITS - 1)) + offset + 1) << shift) - 1
+
+    def record(self, value: int):
+        # _index() inlined: this runs on every measured command
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        self.counts[value if shift <= 0 else (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        "Value (ns) that `percent` percent of the recorded values do not exceed"
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self):
+        self.counts = array("Q", bytes(8 * self._SIZE))
+        self.count = self.total = self.max = 0
+
+
+class CommandMetrics:
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+
+QUANTILES = (50, 90, 99, 99.9)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """
+    Call count, error count and latency histogram of every command run by
+    a RemoteControl. Updates are not locked: use one Metrics per thread.
+    A CommandScheduler runs the commands on its own thread, and
+    ConcurrentRemoteControl.submit() is not measured here: it keeps its
+    own InvokerMetrics.
+    """
+
+    def __init__(self):
+        self._commands: Dict[str, CommandMetrics] = {}
+
+    def command(self, command_name: str) -> CommandMetrics:
+        metrics = self._commands.get(command_name)
+        if metrics is None:
+            metrics = self._commands[command_name] = CommandMetrics()
+        return metrics
+
+    def __getitem__(self, command_name: str) -> CommandMetrics:
+        return self._commands[command_name]
+
+    def __contains__(self, command_name: str) -> bool:
+        return command_name in self._commands
+
+    def __iter__(self):
+        return iter(self._commands)
+
+    def reset(self):
+        self._commands.clear()
+
+    def to_dict(self) -> Dict[str, dict]:
+        "Counters and latency summary (in seconds) of each command"
+        snapshot = {}
+        for command_name, metrics in self._commands.items():
+            latency = metrics.latency
+            summary = {"count": latency.count, "mean": latency.mean() / 1e9, "max": latency.max / 1e9}
+            for percent in QUANTILES:
+                summary[f"p{percent:g}".replace(".", "")] = latency.percentile(percent) / 1e9
+            snapshot[command_name] = {"calls": metrics.calls, "errors": metrics.errors, "latency": summary}
+        return snapshot
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "remote_control") -> str:
+        "The metrics in the Prometheus text exposition format"
+        lines = [
+            f"# HELP {prefix}_command_calls_total Commands executed.",
+            f"# TYPE {prefix}_command_calls_total counter",
+        ]
+        lines += [
+            f'{prefix}_command_calls_total{{command="{_label(name)}"}} {metrics.calls}'
+            for name, metrics in self._commands.items()
+        ]
+        lines += [
+            f"# HELP {prefix}_command_errors_total Commands that raised an exception.",
+            f"# TYPE {prefix}_command_errors_total counter",
+        ]
+        lines += [
+            f'{prefix}_command_errors_total{{command="{_label(name)}"}} {metrics.errors}'
+            for name, metrics in self._commands.items()
+        ]
+        lines += [
+            f"# HELP {prefix}_command_latency_seconds Command execution time.",
+            f"# TYPE {prefix}_command_latency_seconds summary",
+        ]
+        for name, metrics in self._commands.items():
+            label = _label(name)
+            latency = metrics.latency
+            for percent in QUANTILES:
+                lines.append(
+                    f'{prefix}_command_latency_seconds{{command="{label}",quantile="{percent / 100:g}"}}'
+                    f" {latency.percentile(percent) / 1e9:.9g}"
+                )
+            lines.append(f'{prefix}_command_latency_seconds_sum{{command="{label}"}} {latency.total / 1e9:.9g}')
+            lines.append(f'{prefix}_command_latency_seconds_count{{command="{label}"}} {latency.count}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import List, Sequence, Set, Tuple
+
+from commands_module import ICommand
+
+Step = Tuple[str, ICommand]
+
+
+@dataclass
+class OptimizationReport:
+    submitted: int = 0
+    executed: int = 0
+
+    @property
+    def saved(self) -> int:
+        "Device calls the optimizer removed"
+        return self.submitted - self.executed
+
+
+def coalesce(steps: Sequence[Step]) -> List[Step]:
+    """
+    Remove the commands of a batch whose effect a later command overwrites.
+
+    An idempotent command is dropped when a later idempotent command acts
+    on the same receiver and nothing in between depends on the state it
+    set: a non-idempotent command on that receiver, a status read
+    included, or a command without a receiver, is a barrier unless it is
+    commutative. The order of the remaining commands is kept.
+    """
+    kept: List[Step] = []
+    settled: Set[int] = set()  # receivers whose final state a later command sets
+    for step in reversed(steps):
+        command = step[1]
+        receiver = command.receiver
+        if command.commutative:
+            pass
+        elif receiver is None:
+            settled.clear()
+        elif command.idempotent:
+            if id(receiver) in settled:
+                continue
+            settled.add(id(receiver))
+        else:
+            settled.discard(id(receiver))
+        kept.append(step)
+    kept.reverse()
+    return kept
@@ -0,0 +1,231 @@
+from datetime import datetime
+from functools import lru_cache, partial
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Type
+
+from history_module import CommandHistory
+from commands_module import ICommand
+from metrics_module import Metrics
+from optimizer_module import OptimizationReport, coalesce
+import commands_module as command_module
+
+_FIRST_CAP = re.compile('(.)([A-Z][a-z]+)')
+_ALL_CAP = re.compile('([a-z0-9])([A-Z])')
+
+
+@lru_cache(maxsize=None)
+def snake_case(class_name: str) -> str:
+    s1 = _FIRST_CAP.sub(r'\1_\2', class_name)
+    return _ALL_CAP.sub(r'\1_\2', s1).lower()
+
+
+def _manifest_path(source: str) -> str:
+    directory, file_name = os.path.split(source)
+    return os.path.join(directory, "__pycache__", os.path.splitext(file_name)[0] + ".commands.json")
+
+
+def _module_spec(module_name: str):
+    "The import spec of a module, None for __main__ run as a script or a module that can't be found"
+    try:
+        return importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+
+def _command_classes(module) -> Dict[str, str]:
+    return {
+        snake_case(name.replace("Command", "")): name
+        for name, obj in inspect.getmembers(module)
+        if inspect.isclass(obj) and issubclass(obj, ICommand) and obj != ICommand
+    }
+
+
+def discover_commands(module_name: str, use_cache: bool = True) -> Dict[str, str]:
+    """
+    Map command names to the ICommand classes defined in a module.
+
+    The result is cached on disk in a manifest next to the module bytecode,
+    valid as long as the module source keeps the same mtime and size, so a
+    warm start neither imports nor inspects the module.
+    """
+    spec = _module_spec(module_name)
+    source = spec.origin if spec is not None else None
+    stat = os.stat(source) if source and os.path.isfile(source) else None
+    manifest_path = _manifest_path(source) if stat else None
+
+    if use_cache and manifest_path:
+        try:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest["mtime_ns"] == stat.st_mtime_ns and manifest["size"] == stat.st_size:
+                return manifest["commands"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    commands = _command_classes(importlib.import_module(module_name))
+
+    if manifest_path:
+        manifest = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "commands": commands}
+        try:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            temporary = f"{manifest_path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as manifest_file:
+                json.dump(manifest, manifest_file)
+            os.replace(temporary, manifest_path)
+        except OSError:
+            pass  # a read-only install only loses the cache
+    return commands
+
+
+def _load_command(module_name: str, class_name: str) -> ICommand:
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class RemoteControl:
+    def __init__(self, history_size: int = 10_000, history=None, metrics: Metrics = None):
+        """
+        `history` replaces the in-memory CommandHistory, e.g. with a CommandJournal.
+        `metrics` turns on the instrumentation of execute(), see enable_metrics().
+        """
+        self._commands: Dict[str, Type[ICommand]] = {}
+        self._factories: Dict[str, Callable[[], ICommand]] = {}
+        self._factories_lock = threading.Lock()
+        self._history = CommandHistory(history_size) if history is None else history
+        # What execute() records into. Not called `metrics`: subclasses such
+        # as ConcurrentRemoteControl keep their own figures under that name
+        self.command_metrics: Optional[Metrics] = None
+        if metrics is not None:
+            self.enable_metrics(metrics)
+
+    def show_history(self):
+        "Print the history of each time a command was invoked"
+        for row in self._history:
+            print(
+                f"{datetime.fromtimestamp(row[0]).strftime('%H:%M:%S')}"
+                f" : {row[1]}"
+            )
+
+    def snake_case(self, class_name):
+        return snake_case(class_name)
+
+    def auto_register_commands(self, module=command_module, use_cache: bool = True):
+        """
+        Register every command class of a module (a module object or its
+        name). Commands are only created on their first execution, except
+        for a module object that can't be imported again by name (a script
+        run as __main__): its commands are created now.
+        """
+        if not isinstance(module, str) and module.__spec__ is None:
+            for command_name, class_name in _command_classes(module).items():
+                self.register(command_name, getattr(module, class_name)())
+            return
+        module_name = module if isinstance(module, str) else module.__name__
+        for command_name, class_name in discover_commands(module_name, use_cache).items():
+            self.register_lazy(command_name, partial(_load_command, module_name, class_name))
+
+    def register(self, command_name: str, command: ICommand):
+        "Register commands in the Invoker"
+        self._factories.pop(command_name, None)
+        self._commands[command_name] = command
+
+    def register_lazy(self, command_name: str, factory: Callable[[], ICommand]):
+        "Register a command that `factory` creates on its first execution"
+        self._commands.pop(command_name, None)
+        self._factories[command_name] = factory
+
+    def _command(self, command_name: str) -> Optional[ICommand]:
+        command = self._commands.get(command_name)
+        if command is None and command_name in self._factories:
+            # Two threads executing a new command must not both create it
+            with self._factories_lock:
+                command = self._commands.get(command_name)
+                factory = self._factories.get(command_name)
+                if command is None and factory is not None:
+                    # Stored before the factory is dropped: other threads always find one of them
+                    command = self._commands[command_name] = factory()
+                    del self._factories[command_name]
+        return command
+
+    def execute(self, command_name: str):
+        "Execute any registered commands and return what the command returns"
+        command = self._command(command_name)
+        if command is not None:
+            if self.command_metrics is None:
+                result = command.execute()
+            else:
+                result = self._execute_measured(command_name, command)
+            self._history.append(time.time(), command_name)
+            return result
+        else:
+            print(f"Command [{command_name}] not recognised")
+
+    def _execute_measured(self, command_name: str, command: ICommand):
+        "Execute a command, counting calls and errors and timing it"
+        metrics = self.command_metrics.command(command_name)
+        metrics.calls += 1
+        start = time.perf_counter_ns()
+        try:
+            result = command.execute()
+        except BaseException:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.latency.record(time.perf_counter_ns() - start)
+        return result
+
+    def enable_metrics(self, metrics: Metrics = None) -> Metrics:
+        """
+        Record the calls, errors and latency of every command run by
+        execute(), execute_batch() and replay_last(), and so by a
+        CommandScheduler driving this remote control. Without metrics the
+        only cost is one attribute check per command.
+        """
+        self.command_metrics = Metrics() if metrics is None else metrics
+        return self.command_metrics
+
+    def disable_metrics(self):
+        self.command_metrics = None
+
+    def execute_batch(self, command_names, optimize: bool = False) -> OptimizationReport:
+        """
+        Execute a sequence of commands. With `optimize`, commands whose
+        effect a later command of the batch overwrites are skipped.
+        """
+        steps = []
+        for command_name in command_names:
+            command = self._command(command_name)
+            if command is None:
+                print(f"Command [{command_name}] not recognised")
+            else:
+                steps.append((command_name, command))
+        report = OptimizationReport(submitted=len(steps))
+        for command_name, command in coalesce(steps) if optimize else steps:
+            if self.command_metrics is None:
+                command.execute()
+            else:
+                self._execute_measured(command_name, command)
+            self._history.append(time.time(), command_name)
+            report.executed += 1
+        return report
+
+    def replay_last(self, number_of_commands: int, optimize: bool = False) -> OptimizationReport:
+        "Replay the last N commands, skipping the redundant ones with `optimize`"
+        steps = [
+            (command_name, self._command(command_name))
+            for command_name in self._history.last_names(number_of_commands)
+        ]
+        report = OptimizationReport(submitted=len(steps))
+        for command_name, command in coalesce(steps) if optimize else steps:
+            if self.command_metrics is None:
+                command.execute()
+            else:
+                self._execute_measured(command_name, command)
+            report.executed += 1
+        return report
@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+
+class Timer:
+    "A scheduled command, returned by the scheduler so that it can be cancelled"
+    __slots__ = ("deadline", "command_name", "interval", "_slot")
+
+    def __init__(self, deadline: int, command_name: str, interval: Optional[int]):
+        self.deadline = deadline        # tick at which the command runs
+        self.command_name = command_name
+        self.interval = interval        # ticks between runs of a recurring timer
+        self._slot: Optional[Dict["Timer", None]] = None
+
+    @property
+    def pending(self) -> bool:
+        return self._slot is not None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel counting time in integer ticks.
+
+    Level 0 has one slot per tick for the next `slots` ticks, each higher
+    level has slots `slots` times as wide. A timer goes to the lowest level
+    whose range covers its delay and moves down a level each time the
+    wheel below completes a turn. Adding and removing a timer only touch
+    one slot, whatever the number of pending timers.
+    """
+
+    def __init__(self, slots: int = 256, levels: int = 4):
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._span = 1 << (self._bits * levels)  # longest delay a wheel turn covers
+        self._wheels: List[List[Dict[Timer, None]]] = [[{} for _ in range(slots)] for _ in range(levels)]
+        self.tick = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, timer: Timer):
+        if timer.deadline <= self.tick:
+            timer.deadline = self.tick + 1
+        self._place(timer)
+        self._count += 1
+
+    def remove(self, timer: Timer) -> bool:
+        if timer._slot is None:
+            return False
+        del timer._slot[timer]
+        timer._slot = None
+        self._count -= 1
+        return True
+
+    def _place(self, timer: Timer):
+        # Delays beyond the top level wait in its furthest slot and are placed again from there
+        target = min(timer.deadline, self.tick + self._span - 1)
+        delay = target - self.tick
+        level = 0
+        while delay >> (self._bits * (level + 1)):
+            level += 1
+        slot = self._wheels[level][(target >> (self._bits * level)) & self._mask]
+        slot[timer] = None
+        timer._slot = slot
+
+    def advance(self) -> List[Timer]:
+        "Move one tick forward and return the timers due at the new tick"
+        self.tick += 1
+        tick = self.tick
+        for level in range(1, len(self._wheels)):
+            if tick & ((1 << (self._bits * level)) - 1):
+                break
+            # The wheel below completed a turn: spread this slot over the lower levels
+            slot = self._wheels[level][(tick >> (self._bits * level)) & self._mask]
+            timers = list(slot)
+            slot.clear()
+            for timer in timers:
+                self._place(timer)
+        slot = self._wheels[0][tick & self._mask]
+        due = list(slot)
+        slot.clear()
+        self._count -= len(due)
+        for timer in due:
+            timer._slot = None
+        return due
+
+    def skip_to(self, tick: int):
+        "Jump to `tick` without turning the wheels, only valid with no timer pending"
+        if self._count:
+            raise RuntimeError("cannot skip ticks while timers are pending")
+        self.tick = max(self.tick, tick)
+
+
+class CommandScheduler:
+    """
+    Runs the commands of a RemoteControl after a delay or at a fixed
+    interval, on a single thread.
+
+    Time is cut into ticks of `tick` seconds: a command runs on the first
+    tick at or after its due time. Timers are kept in a TimerWheel, so
+    scheduling and cancelling are O(1) with hundreds of thousands of
+    pending timers. Commands can be scheduled from any thread; `run()` or
+    `start()` executes them.
+    """
+
+    def __init__(self, remote, tick: float = 0.01, slots: int = 256, levels: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        self.remote = remote
+        self.tick = tick
+        self.clock = clock
+        self.executed = 0
+        self.failed = 0
+        self._wheel = TimerWheel(slots, levels)
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self):
+        return len(self._wheel)
+
+    def _ticks(self, seconds: float) -> int:
+        return math.ceil(seconds / self.tick)
+
+    def call_later(self, delay: float, command_name: str, every: float = None) -> Timer:
+        "Run `command_name` in `delay` seconds, then every `every` seconds if given"
+        interval = None if every is None else max(1, self._ticks(every))
+        deadline = self._ticks(self.clock() + delay - self._origin)
+        timer = Timer(deadline, command_name, interval)
+        with self._lock:
+            self._wheel.add(timer)
+        return timer
+
+    def call_every(self, interval: float, command_name: str) -> Timer:
+        return self.call_later(interval, command_name, every=interval)
+
+    def call_at(self, when: datetime, command_name: str, every: timedelta = None) -> Timer:
+        "Run `command_name` at the wall-clock time `when`"
+        delay = (when - datetime.now(when.tzinfo)).total_seconds()
+        return self.call_later(delay, command_name, None if every is None else every.total_seconds())
+
+    def daily(self, hour: int, minute: int, command_name: str) -> Timer:
+        "Run `command_name` every day at hour:minute, e.g. daily(18, 0, 'light_on')"
+        now = datetime.now()
+        when = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if when <= now:
+            when += timedelta(days=1)
+        return self.call_at(when, command_name, every=timedelta(days=1))
+
+    def cancel(self, timer: Timer) -> bool:
+        "Cancel a pending timer; returns False if it already ran or was cancelled"
+        with self._lock:
+            return self._wheel.remove(timer)
+
+    def run_pending(self) -> int:
+        "Run every command due by now; returns the number of commands run"
+        target = int((self.clock() - self._origin) / self.tick)
+        ran = 0
+        while True:
+            with self._lock:
+                if self._wheel.tick >= target:
+                    break
+                if not len(self._wheel):
+                    self._wheel.skip_to(target)
+                    break
+                due = self._wheel.advance()
+                for timer in due:
+                    if timer.interval is not None:
+                        timer.deadline += timer.interval
+                        self._wheel.add(timer)
+            for timer in due:
+                try:
+                    self.remote.execute(timer.command_name)
+                    self.executed += 1
+                except Exception:
+                    # One failing device must not stop the other timers
+                    self.failed += 1
+                ran += 1
+        return ran
+
+    def run(self, duration: float = None):
+        "Run commands as they become due, for `duration` seconds or until stop()"
+        end = None if duration is None else self.clock() + duration
+        while not self._stopping.is_set() and (end is None or self.clock() < end):
+            self.run_pending()
+            next_tick = self._origin + (self._wheel.tick + 1) * self.tick
+            self._stopping.wait(max(0.0, next_tick - self.clock()))
+
+    def start(self):
+        "Run the scheduler on a background thread"
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.run, name="command-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from async_remote_control_module import (
+    AsyncRemoteControl,
+    AsyncTurnOffCommand,
+    AsyncTurnOnCommand,
+    IAsyncSmartDevice,
+    SyncCommandAdapter,
+)
+from commands_module import ICommand
+
+
+class FakeLight(IAsyncSmartDevice):
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.is_on = False
+
+    async def turn_on(self):
+        await asyncio.sleep(self.latency)
+        self.is_on = True
+
+    async def turn_off(self):
+        await asyncio.sleep(self.latency)
+        self.is_on = False
+
+
+class CountCommand(ICommand):
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_execute_many_runs_concurrently_and_reports_timeouts():
+    remote = AsyncRemoteControl(timeout=0.5)
+    lights = [FakeLight(latency=0.05) for _ in range(50)] + [FakeLight(latency=5.0)]
+    for index, light in enumerate(lights):
+        remote.register(f"light-{index}_on", AsyncTurnOnCommand(light))
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await remote.execute_many(f"light-{index}_on" for index in range(len(lights)))
+        return results, loop.time() - start
+
+    results, elapsed = asyncio.run(run())
+    assert elapsed < 2.0
+    assert [isinstance(result, asyncio.TimeoutError) for result in results] == [False] * 50 + [True]
+    assert sum(light.is_on for light in lights) == 50
+
+
+def test_sync_command_is_adapted():
+    remote = AsyncRemoteControl()
+    command = CountCommand()
+    remote.register("count", command)
+    assert isinstance(remote._commands["count"], SyncCommandAdapter)
+    assert asyncio.run(remote.execute("count")) == 1
+
+
+def test_unknown_command_raises_key_error():
+    with pytest.raises(KeyError):
+        asyncio.run(AsyncRemoteControl().execute("missing"))
+
+
+def test_replay_last_runs_the_recorded_commands_in_order():
+    remote = AsyncRemoteControl()
+    light = FakeLight()
+    remote.register("on", AsyncTurnOnCommand(light))
+    remote.register("off", AsyncTurnOffCommand(light))
+
+    async def run():
+        await remote.execute("off")
+        await remote.execute("on")
+        light.is_on = False
+        await remote.replay_last(2)
+
+    asyncio.run(run())
+    assert light.is_on
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from commands_module import ICommand, ISmartDevice, LightOffCommand, LightOnCommand
+from concurrent_remote_control_module import ConcurrentRemoteControl
+
+
+class LoggingDevice(ISmartDevice):
+    def __init__(self, latency: float = 0.001):
+        self.latency = latency
+        self.log = []
+
+    def turn_on(self):
+        time.sleep(self.latency)
+        self.log.append("on")
+
+    def turn_off(self):
+        time.sleep(self.latency)
+        self.log.append("off")
+
+
+class FailingCommand(ICommand):
+    def execute(self):
+        raise ValueError("device unreachable")
+
+
+class ThreadNameCommand(ICommand):
+    def execute(self):
+        return threading.current_thread().name
+
+
+def test_commands_on_one_receiver_run_in_submission_order():
+    remote = ConcurrentRemoteControl(workers=4)
+    device = LoggingDevice()
+    remote.register("on", LightOnCommand(device))
+    remote.register("off", LightOffCommand(device))
+    futures = [remote.submit("on" if step % 2 == 0 else "off") for step in range(20)]
+    for future in futures:
+        future.result(timeout=5)
+    remote.shutdown()
+    assert device.log == ["on", "off"] * 10
+    assert remote.metrics.submitted == remote.metrics.completed == 20
+    assert remote.metrics.queue_depth == 0
+    assert not remote._lanes
+
+
+def test_command_without_receiver_returns_its_result():
+    remote = ConcurrentRemoteControl(workers=2)
+    remote.register("name", ThreadNameCommand())
+    assert remote.submit("name").result(timeout=5) != threading.current_thread().name
+    remote.shutdown()
+
+
+def test_failure_is_set_on_the_future():
+    remote = ConcurrentRemoteControl(workers=2)
+    remote.register("fail", FailingCommand())
+    with pytest.raises(ValueError):
+        remote.submit("fail").result(timeout=5)
+    remote.shutdown()
+    assert remote.metrics.failed == 1
+
+
+def test_unknown_command_raises_key_error():
+    remote = ConcurrentRemoteControl(workers=1)
+    with pytest.raises(KeyError):
+        remote.submit("missing")
+    remote.shutdown()
+
+
+def test_submit_after_shutdown_raises_and_leaves_no_lane():
+    remote = ConcurrentRemoteControl(workers=2)
+    device = LoggingDevice(latency=0.02)
+    remote.register("on", LightOnCommand(device))
+    first = remote.submit("on")
+    remote.shutdown(wait=False)
+    with pytest.raises(RuntimeError):
+        remote.submit("on")
+    first.result(timeout=5)
+    assert device.log == ["on"]
+    assert remote.metrics.submitted == 1
@@ -0,0 +1,27 @@
+from device_group_module import DeviceGroup, GroupOffCommand, GroupOnCommand, GroupQueryCommand
+from remote_control_module import RemoteControl
+
+
+class RecordQueryCommand(GroupQueryCommand):
+    "execute_batch discards results: keep them"
+
+    def __init__(self, group: DeviceGroup):
+        super().__init__(group, state=True)
+        self.seen = []
+
+    def execute(self):
+        self.seen.append(list(super().execute()))
+
+
+def test_query_between_group_writes_sees_them():
+    group = DeviceGroup(["a", "b"])
+    group.turn_off()
+    query = RecordQueryCommand(group)
+    remote = RemoteControl()
+    remote.register("on", GroupOnCommand(group))
+    remote.register("q", query)
+    remote.register("off", GroupOffCommand(group))
+    report = remote.execute_batch(["on", "q", "off"], optimize=True)
+    assert report.executed == 3
+    assert query.seen == [["a", "b"]]
+    assert group.count(state=False) == 2
@@ -0,0 +1,44 @@
+import os
+import time
+
+import pytest
+
+from journal_module import CommandJournal, HEADER, RECORD
+
+
+def test_quiet_journal_is_committed_after_max_delay(tmp_path):
+    path = str(tmp_path / "journal")
+    journal = CommandJournal(path, group_size=1000, max_delay=0.02)
+    journal.append(time.time(), "light_on")
+    time.sleep(0.2)
+    assert os.path.getsize(path) == HEADER.size + RECORD.size
+    journal.close()
+
+
+def test_torn_name_is_dropped_on_open(tmp_path):
+    path = str(tmp_path / "journal")
+    journal = CommandJournal(path)
+    journal.append(1.0, "light_on")
+    journal.close()
+    with open(path + ".names", "a", encoding="utf-8") as names:
+        names.write("fan_o")  # crash in the middle of writing a new name
+
+    journal = CommandJournal(path)
+    journal.append(2.0, "fan_on")
+    assert journal.last_names(2) == ["light_on", "fan_on"]
+    journal.close()
+    with open(path + ".names", encoding="utf-8") as names:
+        assert names.read() == "light_on\nfan_on\n"
+
+
+def test_name_with_newline_is_rejected(tmp_path):
+    path = str(tmp_path / "journal")
+    journal = CommandJournal(path, max_delay=None)
+    with pytest.raises(ValueError):
+        journal.append(1.0, "light\non")
+    journal.append(2.0, "light_on")
+    journal.close()
+
+    journal = CommandJournal(path, max_delay=None)
+    assert journal.last_names(5) == ["light_on"]
+    journal.close()
@@ -0,0 +1,60 @@
+from commands_module import ICommand
+from concurrent_remote_control_module import ConcurrentRemoteControl
+from metrics_module import LatencyHistogram
+from remote_control_module import RemoteControl
+
+
+class NoopCommand(ICommand):
+    def execute(self):
+        return "done"
+
+
+class AuditedRemoteControl(RemoteControl):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.audit = []
+
+    def execute(self, command_name):
+        self.audit.append(command_name)
+        return super().execute(command_name)
+
+
+def test_enable_metrics_keeps_subclass_execute():
+    remote = AuditedRemoteControl()
+    remote.register("noop", NoopCommand())
+    metrics = remote.enable_metrics()
+    assert remote.execute("noop") == "done"
+    assert remote.audit == ["noop"]
+    assert metrics["noop"].calls == 1
+
+
+def test_batch_and_replay_are_measured():
+    remote = RemoteControl()
+    remote.register("noop", NoopCommand())
+    metrics = remote.enable_metrics()
+    remote.execute_batch(["noop", "noop"])
+    remote.replay_last(2)
+    assert metrics["noop"].calls == 4
+    assert metrics["noop"].latency.count == 4
+    remote.disable_metrics()
+    remote.execute("noop")
+    assert metrics["noop"].calls == 4
+
+
+def test_histogram_buckets_keep_values_within_a_sixteenth():
+    histogram = LatencyHistogram()
+    for value in (5, 31, 32, 1_000, 123_456_789):
+        bound = histogram._upper_bound(histogram._index(value))
+        assert value <= bound < value * (1 + 1 / 16) + 1
+
+
+def test_enable_metrics_keeps_concurrent_invoker_metrics():
+    remote = ConcurrentRemoteControl(workers=2)
+    remote.register("noop", NoopCommand())
+    metrics = remote.enable_metrics()
+    assert remote.submit("noop").result(timeout=5) == "done"
+    assert remote.execute("noop") == "done"
+    remote.shutdown()
+    assert remote.metrics.submitted == remote.metrics.completed == 1
+    assert remote.command_metrics is metrics
+    assert metrics["noop"].calls == 1
@@ -0,0 +1,72 @@
+from commands_module import ICommand, ISmartDevice, LightOffCommand, LightOnCommand
+from optimizer_module import coalesce
+from remote_control_module import RemoteControl
+
+
+class SwitchLight(ISmartDevice):
+    def __init__(self):
+        self.is_on = False
+
+    def turn_on(self):
+        self.is_on = True
+
+    def turn_off(self):
+        self.is_on = False
+
+
+class LightStatusCommand(ICommand):
+    def __init__(self, light: SwitchLight):
+        self.light = light
+
+    @property
+    def receiver(self):
+        return self.light
+
+    def execute(self):
+        return self.light.is_on
+
+
+class RecordStatusCommand(LightStatusCommand):
+    "execute_batch discards results: keep them"
+
+    def __init__(self, light: SwitchLight):
+        super().__init__(light)
+        self.seen = []
+
+    def execute(self):
+        self.seen.append(super().execute())
+
+
+def steps(*commands):
+    return [(type(command).__name__, command) for command in commands]
+
+
+def test_runs_of_writes_keep_the_last_one():
+    light = SwitchLight()
+    last = LightOnCommand(light)
+    batch = steps(LightOnCommand(light), LightOffCommand(light), last)
+    assert [command for _, command in coalesce(batch)] == [last]
+
+
+def test_query_between_writes_is_a_barrier():
+    light = SwitchLight()
+    batch = steps(LightOnCommand(light), LightStatusCommand(light), LightOffCommand(light))
+    assert coalesce(batch) == batch
+
+
+def test_query_sees_the_state_set_before_it():
+    light = SwitchLight()
+    remote = RemoteControl()
+    remote.register("on", LightOnCommand(light))
+    remote.register("off", LightOffCommand(light))
+    status = RecordStatusCommand(light)
+    remote.register("status", status)
+    remote.execute_batch(["on", "status", "off"], optimize=True)
+    assert status.seen == [True]
+    assert light.is_on is False
+
+
+def test_writes_on_other_receivers_are_not_held_back_by_a_query():
+    light, other = SwitchLight(), SwitchLight()
+    batch = steps(LightOnCommand(light), LightStatusCommand(other), LightOffCommand(light))
+    assert [command for _, command in coalesce(batch)] == [batch[1][1], batch[2][1]]
@@ -0,0 +1,47 @@
+import threading
+import types
+
+from commands_module import ICommand
+from remote_control_module import RemoteControl, discover_commands
+
+
+class HelloCommand(ICommand):
+    def execute(self):
+        return "hello"
+
+
+def test_auto_register_module_without_spec():
+    script = types.ModuleType("__main__")  # a script run with `python script.py` has no __spec__
+    script.HelloCommand = HelloCommand
+    remote = RemoteControl()
+    remote.auto_register_commands(script)
+    assert remote.execute("hello") == "hello"
+
+
+def test_discover_commands_of_main_module():
+    assert isinstance(discover_commands("__main__"), dict)
+
+
+def test_lazy_command_created_once_under_concurrent_execution():
+    created = []
+    barrier = threading.Barrier(8)
+
+    def factory():
+        created.append(1)
+        return HelloCommand()
+
+    remote = RemoteControl()
+    remote.register_lazy("hello", factory)
+    results = []
+
+    def run():
+        barrier.wait()
+        results.append(remote.execute("hello"))
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["hello"] * 8
+    assert len(created) == 1
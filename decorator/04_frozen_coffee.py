@@ -0,0 +1,57 @@
+import sys
+import time
+
+from coffee_module import Coffee, Milk, Sugar, Vanilla
+
+CONDIMENTS = (Milk, Vanilla, Sugar)
+
+
+def build_order(depth: int):
+    coffee = Coffee()
+    for layer in range(depth):
+        coffee = CONDIMENTS[layer % len(CONDIMENTS)](coffee)
+    return coffee
+
+
+def timed(function, repeat: int = 1):
+    "Seconds per call and the result, or the exception raised"
+    start = time.perf_counter()
+    try:
+        for _ in range(repeat):
+            result = function()
+    except RecursionError as error:
+        return None, error
+    return (time.perf_counter() - start) / repeat, result
+
+
+def read_order(coffee):
+    return coffee.get_cost(), coffee.get_ingredients(), coffee.get_tax()
+
+
+if __name__ == "__main__":
+    print(f"Recursion limit: {sys.getrecursionlimit():,}")
+    for depth in (10, 1_000, 100_000):
+        order = build_order(depth)
+        repeat = max(1, 10_000 // depth)
+
+        chained_time, chained = timed(lambda: read_order(order), repeat)
+        failure = chained if chained_time is None else None
+        if failure is not None and depth <= 10_000:
+            # Check the frozen order against the chain with enough stack for it
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(depth + 1_000)
+            _, chained = timed(lambda: read_order(order))
+            sys.setrecursionlimit(limit)
+        freeze_time, frozen = timed(order.freeze, repeat)
+        frozen_time, flat = timed(lambda: read_order(frozen), 10_000)
+
+        print(f"\nDepth {depth:,}:")
+        if failure is not None:
+            print(f"  decorator chain: {type(failure).__name__}")
+        else:
+            print(f"  decorator chain: {chained_time * 1e6:12.1f} µs per cost + ingredients + tax")
+        print(f"  freeze():        {freeze_time * 1e6:12.1f} µs")
+        print(f"  frozen order:    {frozen_time * 1e6:12.2f} µs per cost + ingredients + tax")
+        if isinstance(chained, tuple):
+            print(f"  identical results: {chained == flat}")
+        print(f"  frozen cost {flat[0]:,.2f}, {len(frozen.ingredients):,} ingredients")
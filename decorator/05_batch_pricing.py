@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+
+from coffee_module import Coffee
+from pricing_module import BatchPricer, NO_CONDIMENT
+
+
+def build(pricer: BatchPricer, recipe) -> Coffee:
+    "The decorated coffee of a recipe row"
+    coffee = Coffee()
+    for code in recipe:
+        if code != NO_CONDIMENT:
+            coffee = pricer.condiments[code - 1](coffee)
+    return coffee
+
+
+if __name__ == "__main__":
+    N_ORDERS = 1_000_000
+    N_CHECKED = 100_000
+    MAX_CONDIMENTS = 6
+
+    pricer = BatchPricer()
+    rng = np.random.default_rng(22)
+    # Recipes of 0 to 6 condiments, padded on the right
+    recipes = rng.integers(1, len(pricer.condiments) + 1, size=(N_ORDERS, MAX_CONDIMENTS), dtype=np.uint8)
+    lengths = rng.integers(0, MAX_CONDIMENTS + 1, size=N_ORDERS)
+    recipes[np.arange(MAX_CONDIMENTS) >= lengths[:, None]] = NO_CONDIMENT
+    counts = np.stack([(recipes == code).sum(axis=1) for code in range(1, len(pricer.condiments) + 1)], axis=1)
+
+    start = time.perf_counter()
+    orders = [build(pricer, recipe) for recipe in recipes[:N_CHECKED].tolist()]
+    object_costs = np.array([order.get_cost() for order in orders])
+    object_taxes = np.array([order.get_tax() for order in orders])
+    object_time = (time.perf_counter() - start) / N_CHECKED * N_ORDERS
+
+    start = time.perf_counter()
+    recipe_costs, recipe_taxes = pricer.price_recipes(recipes)
+    recipe_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    count_costs, count_taxes = pricer.price_counts(counts)
+    count_time = time.perf_counter() - start
+
+    print(f"Pricing {N_ORDERS:,} orders:")
+    print(f"  objects and get_cost()/get_tax(): {object_time:7.3f} s (extrapolated from {N_CHECKED:,})")
+    print(f"  batch from recipes:               {recipe_time:7.3f} s ({object_time / recipe_time:,.0f}x faster)")
+    print(f"  batch from counts:                {count_time:7.3f} s ({object_time / count_time:,.0f}x faster)")
+
+    sample = slice(0, N_CHECKED)
+    print(
+        "Identical to the objects:"
+        f" recipes {np.array_equal(recipe_costs[sample], object_costs) and np.array_equal(recipe_taxes[sample], object_taxes)},"
+        f" counts {np.array_equal(count_costs[sample], object_costs) and np.array_equal(count_taxes[sample], object_taxes)}"
+    )
+    print(f"Encoded order: {pricer.encode(orders[0])} -> {orders[0].get_ingredients()}")
+    print(f"Day total: {recipe_costs.sum():,.2f} + {recipe_taxes.sum():,.2f} tax")
@@ -0,0 +1,82 @@
+import random
+import time
+
+from coffee_module import Coffee, Milk, Sugar, Vanilla
+from shared_coffee_module import CoffeeCache
+
+CONDIMENTS = (Milk, Vanilla, Sugar)
+
+
+def order_mix(n_orders: int, seed: int = 23):
+    """
+    A day of orders: most customers pick one of the 30 house recipes, with
+    a long tail of custom ones. Each order is a tuple of condiment classes.
+    """
+    rng = random.Random(seed)
+    house = [
+        tuple(rng.choice(CONDIMENTS) for _ in range(rng.randint(0, 4)))
+        for _ in range(30)
+    ]
+    weights = [1 / rank for rank in range(1, len(house) + 1)]  # Zipf-like popularity
+    orders = []
+    for _ in range(n_orders):
+        if rng.random() < 0.9:
+            orders.append(rng.choices(house, weights)[0])
+        else:
+            orders.append(tuple(rng.choice(CONDIMENTS) for _ in range(rng.randint(1, 8))))
+    return orders
+
+
+def build(condiments):
+    coffee = Coffee()
+    for condiment in condiments:
+        coffee = condiment(coffee)
+    return coffee
+
+
+def bill(orders):
+    "Total cost and tax of a list of orders, printing-style: every getter is called"
+    cost = tax = 0.0
+    for order in orders:
+        order.get_ingredients()
+        cost += order.get_cost()
+        tax += order.get_tax()
+    return cost, tax
+
+
+if __name__ == "__main__":
+    N_ORDERS = 300_000
+    recipes = order_mix(N_ORDERS)
+
+    start = time.perf_counter()
+    plain_orders = [build(recipe) for recipe in recipes]
+    plain_bill = bill(plain_orders)
+    plain_time = time.perf_counter() - start
+
+    cache = CoffeeCache()
+    start = time.perf_counter()
+    shared_orders = [cache.order(Coffee, *recipe) for recipe in recipes]
+    shared_bill = bill(shared_orders)
+    shared_time = time.perf_counter() - start
+
+    print(f"Billing {N_ORDERS:,} orders:")
+    print(f"  decorator objects: {plain_time:6.2f} s")
+    print(f"  shared nodes:      {shared_time:6.2f} s ({plain_time / shared_time:.1f}x faster)")
+    print(f"  identical bill: {plain_bill == shared_bill}")
+    stats = cache.stats
+    print(
+        f"  {len(cache):,} distinct nodes for {N_ORDERS:,} orders,"
+        f" {stats.hits:,} memo hits, {stats.misses:,} evaluations, hit rate {stats.hit_rate:.2%}"
+    )
+
+    # A price change invalidates the memoized values
+    Milk.extra_cost = 0.30
+    try:
+        start = time.perf_counter()
+        shared_bill = bill(shared_orders)
+        repriced_time = time.perf_counter() - start
+        plain_bill = bill(plain_orders)
+        print(f"\nMilk now costs 0.30: rebilled in {repriced_time:.2f} s, identical bill: {plain_bill == shared_bill}")
+        print(f"  {cache.stats.invalidations:,} nodes evaluated again")
+    finally:
+        Milk.extra_cost = 0.25
@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from text_module import BoldDecorator, EscapeDecorator, IText, ItalicDecorator, LinkDecorator, PlainText
+
+
+class ConcatBold(IText):
+    "The concatenating decorator of 01_text_formatting.py: every level copies the payload"
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+
+    def render(self):
+        return "<b>" + self.wrapped.render() + "</b>"
+
+
+def measure(render):
+    "Seconds and peak traced memory (MiB) of one rendering"
+    tracemalloc.start()
+    start = time.perf_counter()
+    render()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def nest(text, depth: int, decorator):
+    for _ in range(depth):
+        text = decorator(text)
+    return text
+
+
+if __name__ == "__main__":
+    SIZE_MB = 8
+    DEPTH = 200
+    content = "Lorem ipsum dolor sit amet, <consectetur> & adipiscing elit. " * (SIZE_MB * 2**20 // 62)
+    print(f"Document of {len(content) / 2**20:.1f} MiB wrapped in {DEPTH} bold decorators:")
+
+    concat = nest(PlainText(content), DEPTH, ConcatBold)
+    streamed = nest(PlainText(content), DEPTH, BoldDecorator)
+    assert concat.render() == streamed.render()
+
+    elapsed, peak = measure(concat.render)
+    print(f"  string concatenation: {elapsed * 1000:7.1f} ms, peak {peak:6.1f} MiB")
+    elapsed, peak = measure(streamed.render)
+    print(f"  render() via a buffer: {elapsed * 1000:6.1f} ms, peak {peak:6.1f} MiB")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "document.html")
+        with open(path, "w", encoding="utf-8") as output:
+            elapsed, peak = measure(lambda: streamed.render_to(output))
+        print(f"  render_to(file):       {elapsed * 1000:6.1f} ms, peak {peak:6.1f} MiB")
+
+    deep = nest(PlainText("deep"), 100_000, BoldDecorator)
+    start = time.perf_counter()
+    rendered = deep.render()
+    print(
+        f"\n100,000 nested decorators (recursion limit {sys.getrecursionlimit():,}):"
+        f" {len(rendered):,} characters in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+
+    page = LinkDecorator(ItalicDecorator(EscapeDecorator(PlainText(content))), "https://example.com/?q=a&b")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "page.html")
+        with open(path, "w", encoding="utf-8") as output:
+            elapsed, peak = measure(lambda: page.render_to(output))
+        print(
+            f"Escaped, italic link around the document: {os.path.getsize(path) / 2**20:.1f} MiB written"
+            f" in {elapsed * 1000:.0f} ms, peak {peak:.1f} MiB"
+        )
@@ -0,0 +1,65 @@
+import random
+import time
+from statistics import median
+
+from document_module import Document
+from text_module import BoldDecorator, EscapeDecorator, ItalicDecorator, LinkDecorator, PlainText, TextBlock
+
+
+def build_book(chapters: int, sections: int, paragraphs: int, seed: int = 25):
+    "A book of chapters made of sections made of decorated paragraphs; returns it and its leaves"
+    rng = random.Random(seed)
+    leaves = []
+
+    def paragraph(number: int):
+        leaf = PlainText(f"Paragraph {number}: the <quick> brown fox & the lazy dog. ")
+        leaves.append(leaf)
+        kind = rng.random()
+        if kind < 0.2:
+            return ItalicDecorator(leaf)
+        if kind < 0.3:
+            return LinkDecorator(BoldDecorator(leaf), f"https://example.com/notes/{number}")
+        return EscapeDecorator(leaf)
+
+    book = TextBlock([
+        TextBlock([
+            BoldDecorator(PlainText(f"Chapter {chapter}\n")),
+            *(
+                TextBlock([paragraph(len(leaves)) for _ in range(paragraphs)])
+                for _ in range(sections)
+            ),
+        ])
+        for chapter in range(chapters)
+    ])
+    return book, leaves
+
+
+if __name__ == "__main__":
+    N_EDITS = 200
+
+    book, leaves = build_book(chapters=100, sections=100, paragraphs=10)
+    document = Document(book)
+    print(f"A document of {len(document):,} nodes, {len(leaves):,} paragraphs")
+
+    start = time.perf_counter()
+    text = document.render()
+    print(f"  first render:              {(time.perf_counter() - start) * 1000:8.1f} ms, {len(text) / 2**20:.1f} MiB")
+
+    start = time.perf_counter()
+    assert book.render() == text
+    full = time.perf_counter() - start
+    print(f"  full render():             {full * 1000:8.1f} ms")
+
+    rng = random.Random(7)
+    latencies = []
+    for edit in range(N_EDITS):
+        leaf = rng.choice(leaves)
+        start = time.perf_counter()
+        document.edit(leaf, f"Edited paragraph {edit}: now with <more> & better words. ")
+        text = document.render()
+        latencies.append(time.perf_counter() - start)
+    print(
+        f"  edit one paragraph + render: {median(latencies) * 1000:6.1f} ms median,"
+        f" {max(latencies) * 1000:.1f} ms max ({document.rendered_nodes} nodes rendered again)"
+    )
+    print(f"  identical to a full render: {book.render() == text}")
@@ -0,0 +1,134 @@
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Tuple
+
+# Class attributes a price or an ingredient list is computed from
+PRICED_ATTRIBUTES = ('extra_cost', 'ingredient', 'get_cost', 'get_ingredients', 'get_tax')
+
+class PricedType(ABCMeta):
+    """
+    Metaclass of the coffee classes: counts the changes of a price or an
+    ingredient, of a condiment (extra_cost, ingredient) or of a base coffee
+    (its get_cost(), get_ingredients() or get_tax() replaced), whether the
+    attribute is set or deleted
+    """
+    version = 0
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name in PRICED_ATTRIBUTES:
+            PricedType.version += 1
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        if name in PRICED_ATTRIBUTES:
+            PricedType.version += 1
+
+class ICoffee(ABC, metaclass=PricedType):
+    @abstractmethod
+    def get_cost(self):
+        pass
+
+    @abstractmethod
+    def get_ingredients(self):
+        pass
+
+    def get_tax(self):
+        return 0.1 * self.get_cost()
+
+    def freeze(self) -> "FrozenCoffee":
+        """
+        Flatten the order into a FrozenCoffee holding its precomputed cost,
+        ingredients and tax. The decorator chain is walked with a loop, so
+        any depth works, and the results are exactly those of the chain.
+        Only plain condiments (see is_plain_condiment()) can be flattened.
+        """
+        layers = []
+        plain = set()  # condiment classes already checked
+        coffee = self
+        while isinstance(coffee, CoffeeDecorator):
+            if type(coffee) not in plain:
+                if not is_plain_condiment(type(coffee)):
+                    raise TypeError(
+                        f"{type(coffee).__name__} overrides get_cost(), get_ingredients() or get_tax():"
+                        " describe it with extra_cost and ingredient to freeze it"
+                    )
+                plain.add(type(coffee))
+            layers.append(coffee)
+            coffee = coffee.decorated_coffee
+        if isinstance(coffee, FrozenCoffee):
+            cost, ingredients = coffee.cost, list(coffee.ingredients)
+        else:
+            cost, ingredients = coffee.get_cost(), [coffee.get_ingredients()]
+        if not layers:
+            # The base may have its own tax; a plain condiment taxes 10% of its cost
+            return FrozenCoffee(cost, tuple(ingredients), coffee.get_tax())
+        # Same additions in the same order as the recursive calls: same floats
+        for layer in reversed(layers):
+            cost = cost + layer.extra_cost
+            if layer.ingredient is not None:
+                ingredients.append(layer.ingredient)
+        return FrozenCoffee(cost, tuple(ingredients))
+
+class Coffee(ICoffee):
+    def get_cost(self):
+        return 1.00
+
+    def get_ingredients(self):
+        return 'coffee'
+
+class CoffeeDecorator(ICoffee):
+    # What the decorator adds to the coffee it wraps
+    extra_cost = 0.0
+    ingredient = None
+
+    def __init__(self, decorated_coffee: ICoffee):
+        self.decorated_coffee = decorated_coffee
+
+    def get_cost(self):
+        return self.decorated_coffee.get_cost() + self.extra_cost
+
+    def get_ingredients(self):
+        if self.ingredient is None:
+            return self.decorated_coffee.get_ingredients()
+        return self.decorated_coffee.get_ingredients() + ', ' + self.ingredient
+
+def is_plain_condiment(condiment: type) -> bool:
+    "True if a decorator class only adds its extra_cost and ingredient to the coffee it wraps"
+    return all(
+        getattr(condiment, method) is getattr(CoffeeDecorator, method)
+        for method in ("get_cost", "get_ingredients", "get_tax")
+    )
+
+class Sugar(CoffeeDecorator):
+    ingredient = 'sugar'
+
+class Milk(CoffeeDecorator):
+    extra_cost = 0.25
+    ingredient = 'milk'
+
+class Vanilla(CoffeeDecorator):
+    extra_cost = 0.75
+    ingredient = 'vanilla'
+
+class FrozenCoffee(ICoffee):
+    "A coffee order flattened by ICoffee.freeze(): no chain left to walk"
+
+    def __init__(self, cost: float, ingredients: Tuple[str, ...], tax: float = None):
+        self.cost = cost
+        self.ingredients = ingredients
+        self.tax = 0.1 * cost if tax is None else tax
+        self._ingredients_text = None
+
+    def get_cost(self):
+        return self.cost
+
+    def get_ingredients(self):
+        if self._ingredients_text is None:
+            self._ingredients_text = ', '.join(self.ingredients)
+        return self._ingredients_text
+
+    def get_tax(self):
+        return self.tax
+
+    def freeze(self):
+        return self
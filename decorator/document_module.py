@@ -0,0 +1,100 @@
+from io import StringIO
+from typing import Dict, List, Optional, Tuple
+
+from text_module import IText, PlainText, TextBlock, TextDecorator, Writer
+
+
+def _children(node: IText) -> List[IText]:
+    if isinstance(node, TextBlock):
+        return node.children
+    if isinstance(node, TextDecorator):
+        return [node.wrapped]
+    return []
+
+
+class Document:
+    """
+    A tree of texts (TextBlocks, TextDecorators and PlainText leaves) that
+    renders incrementally.
+
+    Every node keeps its rendered output with the document version it was
+    rendered at, and the version of its last change. Editing a leaf with
+    `edit()` stamps the leaf and its ancestors with a new version, so the
+    next `render()` only renders that path again: the other nodes reuse
+    their output. A node must appear only once in the tree, and the tree
+    must only be changed through the document.
+
+    The first `render()` keeps the output of every node, so it is several
+    times slower than rendering the tree with `root.render()` (about 4x on
+    the 100,000-paragraph book of 08_incremental_render.py): a Document
+    pays off when the same tree is rendered again after small edits.
+    """
+
+    def __init__(self, root: IText):
+        self.root = root
+        self.version = 0
+        self.rendered_nodes = 0  # nodes rendered by the last render()
+        self._parents: Dict[IText, Optional[IText]] = {root: None}
+        self._changed: Dict[IText, int] = {}
+        self._cache: Dict[IText, Tuple[int, str]] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self._changed[node] = 0
+            for child in _children(node):
+                if child in self._parents:
+                    raise ValueError("a text appears twice in the document")
+                self._parents[child] = node
+                stack.append(child)
+
+    def __len__(self):
+        return len(self._parents)
+
+    def edit(self, leaf: PlainText, content: str):
+        "Replace the content of a leaf of the document"
+        if leaf not in self._parents:
+            raise KeyError("the text is not part of the document")
+        leaf.content = content
+        self.version += 1
+        node = leaf
+        while node is not None:
+            self._changed[node] = self.version
+            node = self._parents[node]
+
+    def _fresh(self, node: IText) -> bool:
+        cached = self._cache.get(node)
+        return cached is not None and cached[0] >= self._changed[node]
+
+    def _render_node(self, node: IText) -> str:
+        "Render one node whose children are all fresh"
+        if isinstance(node, TextBlock):
+            return "".join([self._cache[child][1] for child in node.children])
+        if node.streaming:
+            buffer = StringIO()
+            node.open(buffer).write(self._cache[node.wrapped][1])
+            node.close(buffer)
+            return buffer.getvalue()
+        # A leaf, or a decorator overriding render(): it renders its whole subtree
+        return node.render()
+
+    def render(self) -> str:
+        "The rendered document, rendering again only the nodes changed since last time"
+        rendered = 0
+        stack = [self.root]
+        while stack:
+            node = stack[-1]
+            if self._fresh(node):
+                stack.pop()
+                continue
+            stale = [child for child in _children(node) if not self._fresh(child)]
+            if stale:
+                stack.extend(stale)
+                continue
+            stack.pop()
+            self._cache[node] = (self.version, self._render_node(node))
+            rendered += 1
+        self.rendered_nodes = rendered
+        return self._cache[self.root][1]
+
+    def render_to(self, writer: Writer):
+        writer.write(self.render())
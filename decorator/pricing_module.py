@@ -0,0 +1,94 @@
+from typing import Iterable, Sequence, Tuple, Type
+
+import numpy as np
+
+from coffee_module import Coffee, CoffeeDecorator, ICoffee, Milk, Sugar, Vanilla, is_plain_condiment
+
+NO_CONDIMENT = 0  # padding code of a recipe
+
+
+class BatchPricer:
+    """
+    Prices whole batches of coffee orders with NumPy.
+
+    The prices come from the classes themselves: the base cost of `base`
+    and the `extra_cost` of every condiment class. An order is given either
+    as a row of condiment counts, or as a recipe: a row of condiment codes
+    (1 for the first condiment class, 2 for the second...) in the order the
+    decorators wrap the coffee, padded with NO_CONDIMENT.
+
+    Recipes are priced by adding the condiment prices one column at a time,
+    the same additions in the same order as the decorator chain, so the
+    result is exactly what `get_cost()` returns. Counts are priced with one
+    matrix product, which is exact as long as the prices are binary
+    fractions such as 0.25 or 0.75.
+
+    Only what the arrays can describe is accepted: condiments that
+    override get_cost(), get_ingredients() or get_tax() are rejected with
+    a TypeError, like ICoffee.freeze() does, and so are orders whose base
+    is not exactly `base`.
+    """
+
+    def __init__(self, condiments: Sequence[Type[CoffeeDecorator]] = (Milk, Vanilla, Sugar),
+                 base: Type[ICoffee] = Coffee):
+        for condiment in condiments:
+            if not is_plain_condiment(condiment):
+                raise TypeError(
+                    f"{condiment.__name__} overrides get_cost(), get_ingredients() or get_tax():"
+                    " describe it with extra_cost and ingredient to price it in batches"
+                )
+        self.condiments = tuple(condiments)
+        self.base = base
+        self._codes = {condiment: code for code, condiment in enumerate(self.condiments, 1)}
+        self.base_cost = base().get_cost()
+        self.prices = np.array([condiment.extra_cost for condiment in self.condiments], dtype=np.float64)
+        # Index 0 is the padding code, which adds 0.0
+        self._price_table = np.concatenate(([0.0], self.prices))
+
+    def encode(self, coffee: ICoffee) -> Tuple[int, ...]:
+        "Recipe of a decorated coffee, innermost condiment first"
+        codes = []
+        while isinstance(coffee, CoffeeDecorator):
+            code = self._codes.get(type(coffee))
+            if code is None:
+                raise TypeError(f"{type(coffee).__name__} is not one of the condiments of this pricer")
+            codes.append(code)
+            coffee = coffee.decorated_coffee
+        if type(coffee) is not self.base:
+            raise TypeError(f"the order is based on {type(coffee).__name__}, not on {self.base.__name__}")
+        return tuple(reversed(codes))
+
+    def encode_orders(self, orders: Iterable[ICoffee]) -> np.ndarray:
+        "Recipe matrix of many orders, one row per order"
+        recipes = [self.encode(order) for order in orders]
+        width = max((len(recipe) for recipe in recipes), default=0)
+        matrix = np.full((len(recipes), width), NO_CONDIMENT, dtype=np.uint8)
+        for row, recipe in enumerate(recipes):
+            matrix[row, :len(recipe)] = recipe
+        return matrix
+
+    def costs_from_counts(self, counts: np.ndarray) -> np.ndarray:
+        "Cost of each order from an (orders, condiments) matrix of counts"
+        counts = np.asarray(counts)
+        return self.base_cost + counts @ self.prices
+
+    def costs_from_recipes(self, recipes: np.ndarray) -> np.ndarray:
+        "Cost of each order from an (orders, layers) recipe matrix"
+        recipes = np.asarray(recipes)
+        costs = np.full(len(recipes), self.base_cost)
+        for column in recipes.T:
+            costs += self._price_table[column]
+        return costs
+
+    @staticmethod
+    def taxes(costs: np.ndarray) -> np.ndarray:
+        "The 10% sales tax of each cost, as ICoffee.get_tax() computes it"
+        return 0.1 * costs
+
+    def price_counts(self, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        costs = self.costs_from_counts(counts)
+        return costs, self.taxes(costs)
+
+    def price_recipes(self, recipes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        costs = self.costs_from_recipes(recipes)
+        return costs, self.taxes(costs)
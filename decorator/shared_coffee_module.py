@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Type
+
+from coffee_module import CoffeeDecorator, PricedType, ICoffee, is_plain_condiment
+
+
+@dataclass
+class CacheStats:
+    created: int = 0        # distinct nodes built
+    shared: int = 0         # requests for a node that already existed
+    hits: int = 0           # get_* calls answered from the memo
+    misses: int = 0         # node evaluations
+    invalidations: int = 0  # evaluations of a node whose values a price change made stale
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SharedCoffee(ICoffee):
+    """
+    Node of a hash-consed coffee order, built by a CoffeeCache.
+
+    A node is a base coffee or a condiment class wrapping an inner node.
+    Identical orders and sub-orders are the same node, so each one is
+    evaluated once: the cost, ingredients and tax are memoized and stay
+    valid until a condiment or a base coffee class changes price or
+    ingredient (see PricedType).
+    """
+
+    def __init__(self, cache: "CoffeeCache", base: Optional[ICoffee],
+                 condiment: Optional[Type[CoffeeDecorator]], inner: Optional["SharedCoffee"]):
+        self._cache = cache
+        self.base = base
+        self.condiment = condiment
+        self.inner = inner
+        self._version = None
+        self._cost = self._ingredients = self._tax = None
+
+    def _evaluate(self):
+        "Compute the stale nodes from the innermost one, with the same arithmetic as the decorators"
+        version = PricedType.version
+        stale = []
+        node = self
+        while node is not None and node._version != version:
+            stale.append(node)
+            node = node.inner
+        stats = self._cache.stats
+        for node in reversed(stale):
+            if node._version is not None:
+                stats.invalidations += 1
+            if node.inner is None:
+                base = node.base
+                cost, ingredients, tax = base.get_cost(), base.get_ingredients(), base.get_tax()
+            else:
+                cost = node.inner._cost + node.condiment.extra_cost
+                ingredients = node.inner._ingredients
+                if node.condiment.ingredient is not None:
+                    ingredients = ingredients + ', ' + node.condiment.ingredient
+                tax = 0.1 * cost
+            node._cost, node._ingredients, node._tax = cost, ingredients, tax
+            node._version = version
+        stats.misses += len(stale)
+
+    def get_cost(self):
+        if self._version != PricedType.version:
+            self._evaluate()
+        else:
+            self._cache.stats.hits += 1
+        return self._cost
+
+    def get_ingredients(self):
+        if self._version != PricedType.version:
+            self._evaluate()
+        else:
+            self._cache.stats.hits += 1
+        return self._ingredients
+
+    def get_tax(self):
+        if self._version != PricedType.version:
+            self._evaluate()
+        else:
+            self._cache.stats.hits += 1
+        return self._tax
+
+
+class CoffeeCache:
+    """
+    Builds coffee orders as shared SharedCoffee nodes.
+
+    `order(Coffee, Vanilla, Milk)` is `Milk(Vanilla(Coffee()))`: a base
+    coffee class then the condiments from the innermost one. `share()`
+    turns an existing decorator chain into its shared node: a base coffee
+    without instance attributes is shared with `order()`, any other base
+    (a FrozenCoffee, a coffee priced from its own state) is kept as it is
+    and shared only by the chains built on that same instance. Only
+    condiments described by their extra_cost and ingredient can be shared:
+    one overriding get_cost(), get_ingredients() or get_tax() raises a
+    TypeError, as with ICoffee.freeze().
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._nodes: Dict[Tuple, SharedCoffee] = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _node(self, key: Tuple, make_base, condiment, inner) -> SharedCoffee:
+        node = self._nodes.get(key)
+        if node is None:
+            base = None if make_base is None else make_base()
+            node = self._nodes[key] = SharedCoffee(self, base, condiment, inner)
+            self.stats.created += 1
+        else:
+            self.stats.shared += 1
+        return node
+
+    def base(self, coffee_class: Type[ICoffee]) -> SharedCoffee:
+        return self._node((coffee_class,), coffee_class, None, None)
+
+    def _base_of(self, coffee: ICoffee) -> SharedCoffee:
+        if getattr(coffee, "__dict__", None) == {}:
+            # Nothing per instance: any instance of the class prices the same
+            return self.base(type(coffee))
+        # The node keeps the instance alive, so its id is not reused while cached
+        return self._node((type(coffee), id(coffee)), lambda: coffee, None, None)
+
+    def wrap(self, condiment: Type[CoffeeDecorator], inner: SharedCoffee) -> SharedCoffee:
+        if not is_plain_condiment(condiment):
+            raise TypeError(
+                f"{condiment.__name__} overrides get_cost(), get_ingredients() or get_tax():"
+                " describe it with extra_cost and ingredient to share it"
+            )
+        # inner is itself shared, so its identity is enough to tell equal orders apart
+        return self._node((condiment, inner), None, condiment, inner)
+
+    def order(self, coffee_class: Type[ICoffee], *condiments: Type[CoffeeDecorator]) -> SharedCoffee:
+        node = self.base(coffee_class)
+        for condiment in condiments:
+            node = self.wrap(condiment, node)
+        return node
+
+    def share(self, coffee: ICoffee) -> SharedCoffee:
+        "The shared node of a decorator chain"
+        condiments = []
+        while isinstance(coffee, CoffeeDecorator):
+            condiments.append(type(coffee))
+            coffee = coffee.decorated_coffee
+        node = self._base_of(coffee)
+        for condiment in reversed(condiments):
+            node = self.wrap(condiment, node)
+        return node
+
+    def clear(self):
+        self._nodes.clear()
+        self.stats = CacheStats()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The example modules import each other by name, as when the scripts are run from their directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,36 @@
+import pytest
+
+from coffee_module import Coffee, CoffeeDecorator, Milk, Sugar, Vanilla
+
+
+class TaxFree(CoffeeDecorator):
+    ingredient = 'tax free'
+
+    def get_tax(self):
+        return 0.0
+
+
+class ReducedRate(Coffee):
+    def get_tax(self):
+        return 0.05
+
+
+def test_frozen_order_matches_the_chain():
+    order = Sugar(Vanilla(Milk(Coffee())))
+    frozen = order.freeze()
+    assert (frozen.get_cost(), frozen.get_ingredients(), frozen.get_tax()) == \
+        (order.get_cost(), order.get_ingredients(), order.get_tax())
+    assert Milk(frozen).freeze().get_cost() == Milk(order).get_cost()
+
+
+def test_condiment_overriding_get_tax_is_not_frozen():
+    with pytest.raises(TypeError):
+        TaxFree(Milk(Coffee())).freeze()
+
+
+def test_base_tax_is_kept():
+    base = ReducedRate()
+    assert base.freeze().get_tax() == base.get_tax() == 0.05
+    assert base.freeze().freeze().get_tax() == 0.05
+    order = Milk(base)
+    assert order.freeze().get_tax() == order.get_tax()
@@ -0,0 +1,15 @@
+from document_module import Document
+from text_module import BoldDecorator, PlainText, TextBlock, TextDecorator
+
+
+class Upper(TextDecorator):
+    def render(self):
+        return super().render().upper()
+
+
+def test_document_honours_decorators_overriding_render():
+    leaf = PlainText("hi")
+    document = Document(TextBlock([BoldDecorator(Upper(leaf)), PlainText("!")]))
+    assert document.render() == "<b>HI</b>!"
+    document.edit(leaf, "yo")
+    assert document.render() == "<b>YO</b>!" == document.root.render()
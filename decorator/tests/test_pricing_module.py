@@ -0,0 +1,39 @@
+import pytest
+
+from coffee_module import Coffee, CoffeeDecorator, FrozenCoffee, Milk, Vanilla
+from pricing_module import BatchPricer
+
+
+class DoubleShot(CoffeeDecorator):
+    "Prices itself instead of declaring an extra_cost"
+
+    def get_cost(self):
+        return self.decorated_coffee.get_cost() * 2
+
+
+class Decaf(Coffee):
+    def get_cost(self):
+        return 1.20
+
+
+def test_recipes_match_the_decorator_chain():
+    pricer = BatchPricer()
+    order = Vanilla(Milk(Coffee()))
+    costs, taxes = pricer.price_recipes(pricer.encode_orders([order]))
+    assert costs.tolist() == [order.get_cost()] and taxes.tolist() == [order.get_tax()]
+
+
+def test_condiment_overriding_get_cost_is_rejected():
+    with pytest.raises(TypeError):
+        BatchPricer(condiments=(Milk, DoubleShot))
+
+
+def test_unknown_condiment_is_rejected():
+    with pytest.raises(TypeError):
+        BatchPricer(condiments=(Milk,)).encode(Vanilla(Coffee()))
+
+
+@pytest.mark.parametrize("base", [Decaf(), FrozenCoffee(3.0, ("coffee",))])
+def test_other_base_is_rejected(base):
+    with pytest.raises(TypeError):
+        BatchPricer().encode(Milk(base))
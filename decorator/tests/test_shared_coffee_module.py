@@ -0,0 +1,81 @@
+import pytest
+
+from coffee_module import Coffee, CoffeeDecorator, Milk, Vanilla
+from shared_coffee_module import CoffeeCache
+
+
+class DoubleShot(CoffeeDecorator):
+    "Prices itself instead of declaring an extra_cost"
+
+    def get_cost(self):
+        return self.decorated_coffee.get_cost() * 2
+
+
+def test_shared_order_matches_the_decorator_chain():
+    cache = CoffeeCache()
+    order = Milk(Vanilla(Coffee()))
+    shared = cache.share(order)
+    assert shared is cache.order(Coffee, Vanilla, Milk)
+    assert (shared.get_cost(), shared.get_ingredients(), shared.get_tax()) == \
+        (order.get_cost(), order.get_ingredients(), order.get_tax())
+
+
+def test_condiment_overriding_get_cost_is_rejected():
+    cache = CoffeeCache()
+    with pytest.raises(TypeError):
+        cache.order(Coffee, DoubleShot)
+    with pytest.raises(TypeError):
+        cache.share(DoubleShot(Coffee()))
+
+
+def test_base_price_change_invalidates_the_memo():
+    cache = CoffeeCache()
+    shared = cache.order(Coffee, Milk)
+    assert shared.get_cost() == 1.25
+    original = Coffee.get_cost
+    Coffee.get_cost = lambda self: 2.00
+    try:
+        assert shared.get_cost() == Milk(Coffee()).get_cost() == 2.25
+        assert cache.stats.invalidations == 2
+    finally:
+        Coffee.get_cost = original
+    assert shared.get_cost() == 1.25
+
+
+class HouseBlend(Coffee):
+    "A coffee priced from its own state"
+
+    def __init__(self, price):
+        self.price = price
+
+    def get_cost(self):
+        return self.price
+
+
+def test_share_keeps_a_base_with_state():
+    cache = CoffeeCache()
+    frozen = Milk(Coffee()).freeze()
+    order = Milk(frozen)
+    shared = cache.share(order)
+    assert (shared.get_cost(), shared.get_ingredients()) == (order.get_cost(), order.get_ingredients())
+    assert cache.share(Vanilla(frozen)).inner is shared.inner
+    cheap, dear = cache.share(Milk(HouseBlend(1.5))), cache.share(Milk(HouseBlend(3.0)))
+    assert (cheap.get_cost(), dear.get_cost()) == (1.75, 3.25)
+
+
+def test_share_of_stateless_bases_is_shared_with_order():
+    cache = CoffeeCache()
+    assert cache.share(Milk(Coffee())) is cache.share(Milk(Coffee())) is cache.order(Coffee, Milk)
+
+
+def test_deleting_a_price_invalidates_the_memo():
+    cache = CoffeeCache()
+    shared = cache.order(Coffee, Vanilla)
+    assert shared.get_cost() == 1.75
+    original = Vanilla.extra_cost
+    del Vanilla.extra_cost
+    try:
+        assert shared.get_cost() == Vanilla(Coffee()).get_cost() == 1.0
+    finally:
+        Vanilla.extra_cost = original
+    assert shared.get_cost() == 1.75
@@ -0,0 +1,51 @@
+from io import StringIO
+
+import pytest
+
+from text_module import BoldDecorator, IText, ItalicDecorator, PlainText, TextBlock, TextDecorator
+
+
+class Upper(TextDecorator):
+    "A decorator written the way of 01_text_formatting.py, overriding render()"
+
+    def render(self):
+        return super().render().upper()
+
+
+class Reversed(TextDecorator):
+    def render_to(self, writer):
+        writer.write(self.wrapped.render()[::-1])
+
+
+def test_decorator_overriding_render_inside_a_chain():
+    assert BoldDecorator(Upper(PlainText("hi"))).render() == "<b>HI</b>"
+    assert Upper(BoldDecorator(PlainText("hi"))).render() == "<B>HI</B>"
+
+
+def test_decorator_overriding_render_to_inside_a_chain():
+    assert BoldDecorator(Reversed(ItalicDecorator(PlainText("hi")))).render() == "<b>>i/<ih>i<</b>"
+    assert Reversed(PlainText("hi")).render() == "ih"
+
+
+def test_render_to_matches_render():
+    text = TextBlock([ItalicDecorator(Upper(PlainText("a"))), PlainText("b")])
+    writer = StringIO()
+    text.render_to(writer)
+    assert writer.getvalue() == text.render() == "<i>A</i>b"
+
+
+def test_itext_without_render_is_rejected():
+    class Empty(IText):
+        pass
+
+    with pytest.raises(TypeError):
+        Empty()
+
+
+def test_itext_with_only_render_to_renders():
+    class Shout(IText):
+        def render_to(self, writer):
+            writer.write("HEY")
+
+    assert Shout().render() == "HEY"
+    assert BoldDecorator(Shout()).render() == "<b>HEY</b>"
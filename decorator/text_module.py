@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from html import escape
+from io import StringIO
+from typing import List, Optional, Protocol
+
+CHUNK_SIZE = 1 << 16
+
+
+class Writer(Protocol):
+    "Anything text can be written to: io.StringIO, an open text file..."
+
+    def write(self, text: str): ...
+
+
+class IText(ABC):
+    """
+    A text implements render(), render_to() or both: render_to() writes
+    what render() returns by default, and a subclass implementing only
+    render_to() gets a render() that renders into a buffer through it.
+    """
+    # True for the decorators rendered through their open()/close() hooks
+    streaming = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Set before ABCMeta collects the abstract methods, so the class can be instantiated
+        if "render_to" in vars(cls) and getattr(cls.render, "__isabstractmethod__", False):
+            cls.render = _render_from_render_to
+
+    @abstractmethod
+    def render(self):
+        pass
+
+    def render_to(self, writer: Writer):
+        "Write the rendered text to `writer`, without building it in memory"
+        writer.write(self.render())
+
+def _render_through(write, *args) -> str:
+    "Run write(*args, buffer) into a single buffer and return the text"
+    buffer = StringIO()
+    write(*args, buffer)
+    return buffer.getvalue()
+
+def _render_from_render_to(self) -> str:
+    return _render_through(self.render_to)
+
+class PlainText(IText):
+    def __init__(self, content: str):
+        self.content = content
+
+    def render(self):
+        return self.content
+
+    def render_to(self, writer: Writer):
+        content = self.content
+        if len(content) <= CHUNK_SIZE or isinstance(writer, StringIO):
+            writer.write(content)
+        else:
+            # A file encodes what it is given in one piece: keep that copy small
+            for start in range(0, len(content), CHUNK_SIZE):
+                writer.write(content[start:start + CHUNK_SIZE])
+
+class TextBlock(IText):
+    "A sequence of texts rendered one after the other, e.g. the paragraphs of a section"
+
+    def __init__(self, children: Optional[List[IText]] = None):
+        self.children = [] if children is None else children
+
+    def render(self):
+        return _render_through(self.render_to)
+
+    def render_to(self, writer: Writer):
+        for child in self.children:
+            child.render_to(writer)
+
+class TextDecorator(IText):
+    """
+    Wraps a text between a prefix and a suffix. `open()` writes the prefix
+    and returns the writer the wrapped text is written to, `close()`
+    writes the suffix. The chain is walked with a loop, so the output is
+    produced in one pass at any nesting depth.
+
+    A subclass may still override `render()` (or `render_to()`) instead of
+    describing a prefix and a suffix: the walk stops at such a decorator
+    and lets it render its own part of the chain.
+    """
+    prefix = ""
+    suffix = ""
+
+    def __init__(self, wrapped: IText):
+        self.wrapped = wrapped
+
+    def open(self, writer: Writer) -> Writer:
+        if self.prefix:
+            writer.write(self.prefix)
+        return writer
+
+    def close(self, writer: Writer):
+        if self.suffix:
+            writer.write(self.suffix)
+
+    # False for the subclasses overriding render() or render_to()
+    streaming = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.streaming = cls.render is TextDecorator.render and cls.render_to is TextDecorator.render_to
+
+    def render(self):
+        if type(self).render_to is not TextDecorator.render_to:
+            return _render_through(self.render_to)
+        return _render_through(self._write_chain)
+
+    def render_to(self, writer: Writer):
+        if type(self).render is not TextDecorator.render:
+            writer.write(self.render())
+        else:
+            self._write_chain(writer)
+
+    def _write_chain(self, writer: Writer):
+        "Write this decorator and the streaming decorators it wraps with open()/close()"
+        opened = [(self, writer)]
+        writer = self.open(writer)
+        text = self.wrapped
+        while text.streaming:
+            opened.append((text, writer))
+            writer = text.open(writer)
+            text = text.wrapped
+        text.render_to(writer)
+        for decorator, outer_writer in reversed(opened):
+            decorator.close(outer_writer)
+
+class BoldDecorator(TextDecorator):
+    prefix = "<b>"
+    suffix = "</b>"
+
+class ItalicDecorator(TextDecorator):
+    prefix = "<i>"
+    suffix = "</i>"
+
+class LinkDecorator(TextDecorator):
+    def __init__(self, wrapped: IText, href: str):
+        super().__init__(wrapped)
+        self.prefix = f'<a href="{escape(href)}">'
+        self.suffix = "</a>"
+
+class _EscapingWriter:
+    "Writes the HTML-escaped version of the text, a chunk at a time"
+
+    def __init__(self, writer: Writer):
+        self.writer = writer
+
+    def write(self, text: str):
+        for start in range(0, len(text), CHUNK_SIZE):
+            self.writer.write(escape(text[start:start + CHUNK_SIZE], quote=False))
+
+class EscapeDecorator(TextDecorator):
+    "HTML-escapes everything the wrapped text writes, tags of inner decorators included"
+
+    def open(self, writer: Writer) -> Writer:
+        return _EscapingWriter(writer)